@@ -0,0 +1,273 @@
+import argparse
+import tracemalloc
+from collections import namedtuple
+from random import Random
+from time import perf_counter
+from bot import Best_pawn_picker
+from engine import Fanorona
+from position import Position
+from bitboard import FULL_MASK
+from mcts import playout
+from selfplay import random_player
+from perft import random_engine_turn, seeded_positions
+from constants import SELFPLAY_MAX_ROUNDS, MCTS_PLAYOUT_ROUNDS
+
+BENCHMARK_SEED = 2023
+NUM_OF_POSITIONS = 50
+# every benchmark is repeated for at least that many seconds
+MIN_BENCHMARK_TIME = 0.5
+
+BenchmarkResult = namedtuple('BenchmarkResult', [
+    'name', 'ops', 'seconds', 'peak_memory', 'allocated_memory'])
+
+
+def engine_playout(fanorona: "Fanorona", generator: "Random",
+                   max_rounds=SELFPLAY_MAX_ROUNDS):
+    """Plays random turns until the end of the game, returns their number"""
+    turns = 0
+    while fanorona.round <= max_rounds:
+        if fanorona.logic.check_for_winner() is not None:
+            return turns
+        if not random_engine_turn(fanorona, generator):
+            return turns
+        turns += 1
+    return turns
+
+
+def position_playout(position: "Position", generator: "Random",
+                     max_rounds=SELFPLAY_MAX_ROUNDS):
+    """The same as engine_playout() but played on Position"""
+    turns = 0
+    while position.round_number <= max_rounds:
+        if position.winner() is not None:
+            return turns
+        round_number = position.round_number
+        random_player(position, generator)
+        if position.round_number == round_number:
+            return turns
+        turns += 1
+    return turns
+
+
+# every benchmark takes list of positions, prepares what it needs and
+# returns function that runs it once and returns a number of operations
+
+def bench_possibilities_of_pawn(positions):
+    games = [position.to_fanorona() for position in positions]
+
+    def run():
+        ops = 0
+        for fanorona in games:
+            for pawn in fanorona.pawns.pawns:
+                fanorona.logic.possibilities_of_pawn(pawn)
+                ops += 1
+        return ops
+    return run
+
+
+def _bench_capture(positions, approach):
+    cases = []
+    for position in positions:
+        fanorona = position.to_fanorona()
+        for pawn in fanorona.pawns.pawns:
+            if pawn.colour != fanorona.turn:
+                continue
+            targets = [
+                (row, col)
+                for row, col in fanorona.logic.possibilities_of_pawn(pawn)
+                if fanorona.pawns.is_place_empty(row, col)[0]]
+            if targets:
+                cases.append((fanorona, pawn, targets))
+
+    def run():
+        ops = 0
+        for fanorona, pawn, targets in cases:
+            fanorona.selected_pawn = pawn
+            capture = (fanorona.logic.capture_by_approach if approach
+                       else fanorona.logic.capture_by_withdrawal)
+            for row, col in targets:
+                capture(row, col)
+                ops += 1
+            fanorona.selected_pawn = None
+        return ops
+    return run
+
+
+def bench_capture_by_approach(positions):
+    return _bench_capture(positions, approach=True)
+
+
+def bench_capture_by_withdrawal(positions):
+    return _bench_capture(positions, approach=False)
+
+
+def bench_return_able_to_capture(positions):
+    """
+    Finds pawns able to capture from scratch, every place is marked
+    as changed before the call, so the cached list isn't used
+    """
+    games = [position.to_fanorona() for position in positions]
+
+    def run():
+        for fanorona in games:
+            fanorona.pawns._changed = FULL_MASK
+            fanorona.return_able_to_capture()
+        return len(games)
+    return run
+
+
+def bench_able_to_capture_after_step(positions):
+    """
+    Updates pawns able to capture after one step, places changed by the
+    first allowed step (with captured pawns) are marked as changed
+    before the call, so only the incremental update is timed
+    """
+    cases = []
+    for position in positions:
+        fanorona = position.to_fanorona()
+        fanorona.return_able_to_capture()
+        after = Position.from_snapshot(position.snapshot())
+        after.make_move(after.legal_steps()[0])
+        changed = (position.white_mask ^ after.white_mask
+                   | position.black_mask ^ after.black_mask)
+        cases.append((fanorona, changed))
+
+    def run():
+        for fanorona, changed in cases:
+            fanorona.pawns._changed = changed
+            fanorona.return_able_to_capture()
+        return len(cases)
+    return run
+
+
+def bench_best_pawn_to_pick(positions):
+    games = [position.to_fanorona() for position in positions]
+
+    def run():
+        for fanorona in games:
+            Best_pawn_picker._calc_best_pawn_to_pick(fanorona)
+        return len(games)
+    return run
+
+
+def bench_opening_validators(positions):
+    """
+    Updates possibilities and captures (with all validators) of every
+    white pawn in the standard opening, passed positions aren't used
+    """
+    fanorona = Fanorona()
+    pawns = [pawn for pawn in fanorona.pawns.pawns
+             if pawn.colour == fanorona.turn]
+
+    def run():
+        for pawn in pawns:
+            fanorona.selected_pawn = pawn
+            fanorona.where_was_pawn = [(pawn.row, pawn.column)]
+            fanorona.last_move = 'N'
+            fanorona.update_possible_captures()
+        fanorona.selected_pawn = None
+        fanorona.where_was_pawn = []
+        fanorona.last_move = None
+        return len(pawns)
+    return run
+
+
+def bench_engine_playout(positions):
+    snapshots = [position.snapshot() for position in positions]
+
+    def run():
+        turns = 0
+        for seed, snapshot in enumerate(snapshots):
+            fanorona = Position.from_snapshot(snapshot).to_fanorona()
+            turns += engine_playout(fanorona, Random(seed))
+        return turns
+    return run
+
+
+def bench_position_playout(positions):
+    snapshots = [position.snapshot() for position in positions]
+
+    def run():
+        turns = 0
+        for seed, snapshot in enumerate(snapshots):
+            position = Position.from_snapshot(snapshot)
+            turns += position_playout(position, Random(seed))
+        return turns
+    return run
+
+
+def bench_mcts_playout(positions):
+    """Random playouts of MonteCarloSearch, ops are playouts"""
+    snapshots = [position.snapshot() for position in positions]
+
+    def run():
+        for seed, snapshot in enumerate(snapshots):
+            position = Position.from_snapshot(snapshot)
+            playout(position, Random(seed),
+                    position.round_number + MCTS_PLAYOUT_ROUNDS)
+        return len(snapshots)
+    return run
+
+
+BENCHMARKS = {
+    'possibilities_of_pawn': bench_possibilities_of_pawn,
+    'capture_by_approach': bench_capture_by_approach,
+    'capture_by_withdrawal': bench_capture_by_withdrawal,
+    'return_able_to_capture': bench_return_able_to_capture,
+    'able_to_capture_after_step': bench_able_to_capture_after_step,
+    'best_pawn_to_pick': bench_best_pawn_to_pick,
+    'opening_validators': bench_opening_validators,
+    'engine_playout': bench_engine_playout,
+    'position_playout': bench_position_playout,
+    'mcts_playout': bench_mcts_playout,
+}
+
+
+def run_benchmark(name, positions, min_time=MIN_BENCHMARK_TIME):
+    """
+    Runs benchmark with passed name (see BENCHMARKS) on positions,
+    repeats it for at least min_time seconds and then measures memory
+    of one more run with tracemalloc; returns BenchmarkResult
+    """
+    run = BENCHMARKS[name](positions)
+    ops = 0
+    start = perf_counter()
+    seconds = 0.0
+    while seconds < min_time or not ops:
+        ops += run()
+        seconds = perf_counter() - start
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    run()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return BenchmarkResult(name, ops, seconds, peak - before, after - before)
+
+
+def report(result: "BenchmarkResult"):
+    """Returns one line summary of the result"""
+    ops_per_second = result.ops / result.seconds if result.seconds else 0.0
+    return (f"{result.name:<28}{ops_per_second:>14,.0f} ops/s"
+            f"{result.peak_memory/1024:>12.1f} KiB peak"
+            f"{result.allocated_memory/1024:>12.1f} KiB kept")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures speed of the rules on seeded positions")
+    parser.add_argument(
+        "names", nargs="*", help="benchmarks to run, all by default")
+    parser.add_argument("-n", "--positions", type=int,
+                        default=NUM_OF_POSITIONS)
+    parser.add_argument("-s", "--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("-t", "--time", type=float,
+                        default=MIN_BENCHMARK_TIME)
+    arguments = parser.parse_args()
+    positions = seeded_positions(arguments.positions, arguments.seed)
+    for name in arguments.names or BENCHMARKS:
+        print(report(run_benchmark(name, positions, arguments.time)))
+
+
+if __name__ == "__main__":
+    main()
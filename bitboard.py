@@ -0,0 +1,311 @@
+from constants import ROWS, COLS, WHITE, BLACK
+from geometry import DIRECTIONS, OPPOSITE, NEIGHBOURS, RAYS
+from geometry import direction_between
+
+# Every place of the board is represented by one bit of an integer,
+# place (row, col) has index (row-1)*COLS + (col-1), so the whole position
+# is described by two masks - one for white pawns and one for black pawns
+NUM_OF_POINTS = ROWS * COLS
+FULL_MASK = (1 << NUM_OF_POINTS) - 1
+
+
+def index_of(row, col):
+    """Returns index of the bit that represents place (row, col)"""
+    return (row-1)*COLS + (col-1)
+
+
+def point_of(index):
+    """Returns (row, col) of the place represented by bit with index"""
+    return index // COLS + 1, index % COLS + 1
+
+
+def _build_tables():
+    """
+    Returns (shifts, step_masks, rays) translated from tables
+    of module geometry into indexes of bits
+
+    shifts - how index changes after one step in the direction
+    step_masks - mask of places from which one step in the direction is
+    possible (along the line)
+    rays - rays[index][direction] is a tuple of indexes of places beyond
+    index in the direction, in order of the distance
+    """
+    shifts = {}
+    step_masks = {}
+    for direction, (d_row, d_col) in DIRECTIONS.items():
+        shifts[direction] = d_row*COLS + d_col
+        step_masks[direction] = 0
+
+    rays = []
+    for index in range(NUM_OF_POINTS):
+        row, col = point_of(index)
+        for n_row, n_col in NEIGHBOURS[(row, col)]:
+            direction = direction_between(row, col, n_row, n_col)
+            step_masks[direction] |= 1 << index
+        rays.append({
+            direction: tuple(index_of(*place) for place in ray)
+            for direction, ray in RAYS[(row, col)].items()
+        })
+    return shifts, step_masks, rays
+
+
+SHIFTS, STEP_MASKS, RAYS_OF_BITS = _build_tables()
+_DIRECTION_OF_STEP = {
+    (index, index+SHIFTS[direction]): direction
+    for index in range(NUM_OF_POINTS)
+    for direction in DIRECTIONS if STEP_MASKS[direction] >> index & 1
+}
+
+
+def _build_influence():
+    """
+    Returns list, influence[index] is mask of places up to two steps
+    away from index in every direction (and index itself); whether pawn
+    can capture depends only on places that near, so only pawns from
+    that mask have to be checked again when place index changes
+    """
+    influence = []
+    for index in range(NUM_OF_POINTS):
+        mask = 1 << index
+        for ray in RAYS_OF_BITS[index].values():
+            for near in ray[:2]:
+                mask |= 1 << near
+        influence.append(mask)
+    return influence
+
+
+INFLUENCE = _build_influence()
+
+
+def influenced_by(changed):
+    """
+    Returns mask of places whose pawns may have started or stopped
+    being able to capture after places from changed mask have changed
+    """
+    mask = 0
+    for index in bits(changed):
+        mask |= INFLUENCE[index]
+    return mask
+
+
+def _build_lines(size):
+    """
+    Returns masks of every row, column and both diagonals of the board
+    size x size (places are indexed as above when the board has that size)
+    """
+    lines = []
+    for i in range(size):
+        lines.append(sum(1 << i*size + col for col in range(size)))
+        lines.append(sum(1 << row*size + i for row in range(size)))
+    lines.append(sum(1 << i*size + i for i in range(size)))
+    lines.append(sum(1 << i*size + size-1-i for i in range(size)))
+    return lines
+
+
+# lines of the 3x3 board, its game is won by three pawns in a row
+THREE_IN_A_ROW = _build_lines(3)
+
+
+def line_winner(white_mask, black_mask):
+    """
+    Returns colour of the side with three pawns in a row on the 3x3
+    board or None
+    """
+    for line in THREE_IN_A_ROW:
+        if white_mask & line == line:
+            return WHITE
+        if black_mask & line == line:
+            return BLACK
+    return None
+
+
+def step(mask, direction):
+    """
+    Moves every bit of the mask one step in the direction,
+    bits that can't be moved along the line are dropped
+    """
+    mask &= STEP_MASKS[direction]
+    shift = SHIFTS[direction]
+    if shift > 0:
+        return mask << shift
+    return mask >> -shift
+
+
+def bits(mask):
+    """Yields indexes of set bits of the mask"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def direction_of(from_index, to_index):
+    """
+    Returns direction e.g. 'N', 'SW' of one step along the line from
+    from_index to to_index or None if these places are not connected
+    """
+    return _DIRECTION_OF_STEP.get((from_index, to_index))
+
+
+class Bitboard:
+    """
+    Class used for representing a position of Fanorona game
+    as two integer bitmasks, it doesn't need pygame
+
+    ...
+    Attributes
+    ----------
+    white_mask: int
+        mask of places taken by white pawns
+    black_mask: int
+        mask of places taken by black pawns
+
+    Methods
+    -------
+    from_pawns(pawns: "Pawns")
+        class method, returns an instance of Bitboard with the same
+        layout as passed Pawns
+    masks(colour)
+        returns (mask of pawns with passed colour, mask of enemy's pawns)
+    empty_mask()
+        returns mask of empty places
+    paika_moves(colour)
+    approach_moves(colour)
+    withdrawal_moves(colour)
+        returns list of moves (from_index, to_index) for the whole side,
+        respectively all moves to the empty neighbour places, moves that
+        capture by APPROACH and moves that capture by WITHDRAWAL
+    capturing_mask(colour)
+        returns mask of pawns with passed colour that are able to capture
+    captured_by_approach(from_index, to_index, colour)
+    captured_by_withdrawal(from_index, to_index, colour)
+        returns mask of enemy's pawns that would be captured by
+        APPROACH/WITHDRAWAL when pawn moves from from_index to to_index
+    capture_steps(index, colour, last_direction=None, visited=0)
+        returns list of capturing steps of the pawn at index
+        (to_index, 'APPROACH'/'WITHDRAWAL', captured mask, direction),
+        skipping the direction of the last move and visited places,
+        it is used for continuing captures
+    make_step(from_index, to_index, captured, colour)
+        moves pawn with passed colour and removes captured pawns
+    """
+    def __init__(self, white_mask=0, black_mask=0):
+        self.white_mask = white_mask
+        self.black_mask = black_mask
+
+    @classmethod
+    def from_pawns(cls, pawns):
+        """Creates Bitboard with the same layout as passed Pawns"""
+        white_mask = 0
+        black_mask = 0
+        for pawn in pawns.pawns:
+            if not (1 <= pawn.row <= ROWS and 1 <= pawn.column <= COLS):
+                continue
+            if pawn.colour == WHITE:
+                white_mask |= 1 << index_of(pawn.row, pawn.column)
+            elif pawn.colour == BLACK:
+                black_mask |= 1 << index_of(pawn.row, pawn.column)
+        return cls(white_mask, black_mask)
+
+    def masks(self, colour):
+        """Returns (own mask, enemy's mask) for passed colour"""
+        if colour == WHITE:
+            return self.white_mask, self.black_mask
+        return self.black_mask, self.white_mask
+
+    def empty_mask(self):
+        return FULL_MASK & ~(self.white_mask | self.black_mask)
+
+    def _origins_paika(self, colour, direction):
+        own, _ = self.masks(colour)
+        return own & step(self.empty_mask(), OPPOSITE[direction])
+
+    def _origins_approach(self, colour, direction):
+        own, enemy = self.masks(colour)
+        back = OPPOSITE[direction]
+        landing = self.empty_mask() & step(enemy, back)
+        return own & step(landing, back)
+
+    def _origins_withdrawal(self, colour, direction):
+        own, enemy = self.masks(colour)
+        back = OPPOSITE[direction]
+        return own & step(self.empty_mask(), back) & step(enemy, direction)
+
+    def _moves(self, origins_func, colour):
+        moves = []
+        for direction in DIRECTIONS:
+            shift = SHIFTS[direction]
+            for index in bits(origins_func(colour, direction)):
+                moves.append((index, index+shift))
+        return moves
+
+    def paika_moves(self, colour):
+        return self._moves(self._origins_paika, colour)
+
+    def approach_moves(self, colour):
+        return self._moves(self._origins_approach, colour)
+
+    def withdrawal_moves(self, colour):
+        return self._moves(self._origins_withdrawal, colour)
+
+    def capturing_mask(self, colour):
+        mask = 0
+        for direction in DIRECTIONS:
+            mask |= self._origins_approach(colour, direction)
+            mask |= self._origins_withdrawal(colour, direction)
+        return mask
+
+    def _captured_along(self, ray, colour):
+        _, enemy = self.masks(colour)
+        captured = 0
+        for index in ray:
+            bit = 1 << index
+            if not enemy & bit:
+                break
+            captured |= bit
+        return captured
+
+    def captured_by_approach(self, from_index, to_index, colour):
+        direction = direction_of(from_index, to_index)
+        return self._captured_along(
+            RAYS_OF_BITS[to_index][direction], colour)
+
+    def captured_by_withdrawal(self, from_index, to_index, colour):
+        direction = OPPOSITE[direction_of(from_index, to_index)]
+        return self._captured_along(
+            RAYS_OF_BITS[from_index][direction], colour)
+
+    def capture_steps(self, index, colour, last_direction=None, visited=0):
+        """
+        Returns capturing steps of the pawn at index that don't go in
+        last_direction and don't land on visited places (mask)
+        """
+        free = self.empty_mask() & ~visited
+        steps = []
+        for direction in DIRECTIONS:
+            if direction == last_direction:
+                continue
+            if not STEP_MASKS[direction] >> index & 1:
+                continue
+            to_index = index + SHIFTS[direction]
+            if not free >> to_index & 1:
+                continue
+            captured = self._captured_along(
+                RAYS_OF_BITS[to_index][direction], colour)
+            if captured:
+                steps.append((to_index, 'APPROACH', captured, direction))
+            captured = self._captured_along(
+                RAYS_OF_BITS[index][OPPOSITE[direction]], colour)
+            if captured:
+                steps.append((to_index, 'WITHDRAWAL', captured, direction))
+        return steps
+
+    def make_step(self, from_index, to_index, captured, colour):
+        """Moves the pawn and removes captured pawns (mask)"""
+        moved = (1 << from_index) | (1 << to_index)
+        if colour == WHITE:
+            self.white_mask ^= moved
+            self.black_mask &= ~captured
+        else:
+            self.black_mask ^= moved
+            self.white_mask &= ~captured
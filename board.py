@@ -1,5 +1,5 @@
 import pygame
-from constants import WHITE, RED
+from constants import WHITE_RGB, RED
 from constants import ROWS, COLS, LINE_WIDTH, PADDING
 
 
@@ -21,18 +21,31 @@ class Board:
     _square_size: int
         size of the square that is calculated based on the width and the height
         of passed window (pygame.display)
+    _window_size: tuple or None
+        (width, height) of the window that the board was calculated for
+    _surface: pygame.Surface or None
+        the whole board (background, squares and lines) drawn once for
+        '_window_size', it is only blitted until the window is resized
 
     Methods
     -------
     draw_board(window)
         draws the square boxes depending on the size of passed window
         (pygame.display) and lines of the board after calculating
-        its sizes and locations
+        its sizes and locations; it is calculated and drawn again only
+        if the size of the window has changed, otherwise the cached
+        surface is blitted
+    _render(width, height)
+        returns pygame.Surface with the whole board drawn on it
     row_col_from_center_of_square(passed_center)
         takes as an argument a tuple with two numbers which represents
         the center of the square box and returns its number of column and row
 
         if there is no such square with passed_center, returns None
+    row_col_from_position(position)
+        takes (x, y) position of the pixel e.g. of the click and returns
+        (row, column) of the square box that contains it or None; it is
+        calculated, not searched, so it takes the same time for every board
     _calculate_size_of_square(width, height)
         retruns size of the square and sets is to self._square_size
     draw_vertical_lines(window)
@@ -54,6 +67,8 @@ class Board:
         self.centers_of_squares = None
         self.rectangles_boxes = []
         self._square_size = None
+        self._window_size = None
+        self._surface = None
 
     def draw_board(self, window):
         """Calculates measurments of the board and draws the board
@@ -61,10 +76,23 @@ class Board:
         # takes the size of the window
         width = window.get_width()
         height = window.get_height()
-        self._calculate_size_of_square(width, height)
-        self.update_rectangles_and_its_centers(width, height)
-
-        self.draw(window)
+        if (width, height) != self._window_size:
+            self._calculate_size_of_square(width, height)
+            self.update_rectangles_and_its_centers(width, height)
+            self._surface = self._render(width, height)
+            self._window_size = (width, height)
+
+        window.blit(self._surface, (0, 0))
+
+    def _render(self, width, height):
+        """Returns Surface with background, squares and lines"""
+        surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            # the same pixel format as the window makes blitting faster
+            surface = surface.convert()
+        surface.fill(RED)
+        self.draw(surface)
+        return surface
 
     def row_col_from_center_of_square(self, passed_center):
         """Takes center of square, returns its number of row, column or None"""
@@ -74,6 +102,26 @@ class Board:
                     return i+1, j+1
         return None
 
+    def row_col_from_position(self, position):
+        """
+        Returns number of row, column of the square box that contains
+        the pixel with passed position (x, y) or None
+        """
+        if not self.rectangles_boxes:
+            return None
+        left, top = self.rectangles_boxes[0][0].topleft
+        # squares are separated by gaps as wide as a square
+        distance = 2 * self._square_size
+        col, x_in_square = divmod(position[0] - left, distance)
+        row, y_in_square = divmod(position[1] - top, distance)
+        if not (0 <= row < ROWS and 0 <= col < COLS):
+            return None
+        if x_in_square >= self._square_size:
+            return None
+        if y_in_square >= self._square_size:
+            return None
+        return row+1, col+1
+
     def _calculate_size_of_square(self, width, height):
         """Calculating some appropriate size of square
            depending on the width and height of the window"""
@@ -93,7 +141,7 @@ class Board:
             middle_point_of_upper = self.centers_of_squares[0][i]
             middle_point_of_lower = self.centers_of_squares[-1][i]
             pygame.draw.line(
-                window, WHITE, middle_point_of_upper,
+                window, WHITE_RGB, middle_point_of_upper,
                 middle_point_of_lower, LINE_WIDTH)
 
         # draw '\' lines
@@ -102,7 +150,7 @@ class Board:
                 point_one = self.centers_of_squares[i][j]
                 point_two = self.centers_of_squares[i+2][j+2]
                 pygame.draw.line(
-                    window, WHITE, point_one, point_two, LINE_WIDTH)
+                    window, WHITE_RGB, point_one, point_two, LINE_WIDTH)
 
         # draw '/' lines
         for i in range(0, ROWS-2, 2):
@@ -110,7 +158,7 @@ class Board:
                 point_one = self.centers_of_squares[i][j]
                 point_two = self.centers_of_squares[i+2][j-2]
                 pygame.draw.line(
-                    window, WHITE, point_one, point_two, LINE_WIDTH)
+                    window, WHITE_RGB, point_one, point_two, LINE_WIDTH)
 
     def update_rectangles_and_its_centers(self, width, height):
         """Updates the attributes - self.centers_of_squares
@@ -153,7 +201,7 @@ class Board:
             middle_point_of_left = row_of_centers[0]
             middle_point_of_right = row_of_centers[-1]
             pygame.draw.line(
-                window, WHITE, middle_point_of_left,
+                window, WHITE_RGB, middle_point_of_left,
                 middle_point_of_right, LINE_WIDTH)
 
     def draw_rectangles(self, window):
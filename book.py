@@ -0,0 +1,229 @@
+import argparse
+import mmap
+import os
+import struct
+from collections import namedtuple
+from position import Position
+from selfplay import play_game, make_player, run_tasks
+from transposition import Zobrist
+from constants import WHITE, BLACK
+from constants import OPENING_BOOK_PATH, BOOK_ROUNDS, BOOK_MIN_GAMES
+from constants import BookFileError
+
+# every record of the book file is: hash of the position (with the state
+# of the capture chain), the step (from_index, to_index, kind), number of
+# games the step was played in and points the side to move got in them
+# (2 for the win, 1 for the draw); records are sorted by hash, so all
+# steps of one position are next to each other
+RECORD = struct.Struct('<QBBBxII')
+KEY = struct.Struct('<Q')
+KINDS = ('APPROACH', 'WITHDRAWAL', 'PAIKA')
+
+BookMove = namedtuple('BookMove', ['step', 'games', 'points'])
+
+_zobrist = Zobrist()
+
+
+def position_key(position: "Position"):
+    """Returns the hash of the position that is used by the book"""
+    return _zobrist.hash_position(
+        position.white_mask, position.black_mask, position.turn,
+        position.round_number, position.last_direction, position.visited)
+
+
+def book_entries(snapshot, steps):
+    """
+    Yields (key, step, colour) of every step of the turn made from
+    the position described by Snapshot
+    """
+    position = Position.from_snapshot(snapshot)
+    colour = position.turn
+    for step in steps:
+        yield position_key(position), step, colour
+        position.make_move(step)
+
+
+def _book_game_task(arguments):
+    """
+    Plays one self-play game, returns its book entries from the first
+    rounds and colour of the winner (None for the draw)
+    """
+    first, second, seed, rounds = arguments
+    entries = []
+
+    def on_turn(snapshot, steps):
+        if snapshot.round_number <= rounds:
+            entries.extend(book_entries(snapshot, steps))
+    result = play_game(first, second, seed, on_turn=on_turn)
+    if result.winner is None:
+        return entries, None
+    second_colour = BLACK if result.first_colour == WHITE else WHITE
+    winner = (result.first_colour if result.winner == 'first'
+              else second_colour)
+    return entries, winner
+
+
+def build_book(first, second, games, processes=None, seed=0,
+               rounds=BOOK_ROUNDS):
+    """
+    Plays games between players with passed names (just as
+    run_selfplay()) and returns dict (key, step): [games, points] of
+    steps made in the first rounds
+    """
+    make_player(first)
+    make_player(second)
+    tasks = [(first, second, seed+i, rounds) for i in range(games)]
+    moves = {}
+    for entries, winner in run_tasks(_book_game_task, tasks, processes):
+        _add_game(moves, entries, winner)
+    return moves
+
+
+def _add_game(moves, entries, winner):
+    for key, step, colour in entries:
+        stats = moves.setdefault((key, step), [0, 0])
+        stats[0] += 1
+        if winner is None:
+            stats[1] += 1
+        elif winner == colour:
+            stats[1] += 2
+
+
+def write_book(moves, path=OPENING_BOOK_PATH, min_games=BOOK_MIN_GAMES):
+    """
+    Writes moves returned by build_book() played in at least min_games
+    games to the file sorted by hash, returns number of written records
+    """
+    records = sorted(
+        (key, from_index, to_index, KINDS.index(kind), games, points)
+        for (key, (from_index, to_index, kind)), (games, points)
+        in moves.items() if games >= min_games)
+    with open(path, 'wb') as file:
+        for record in records:
+            file.write(RECORD.pack(*record))
+    return len(records)
+
+
+class OpeningBook:
+    """
+    Class used for looking up turns of the opening in the book file,
+    the file is mapped to memory and searched with binary search,
+    so nothing is parsed when the book is opened
+
+    ...
+    Attributes
+    ----------
+    path: str
+        path of the book file
+    size: int
+        number of records in the book
+
+    Methods
+    -------
+    moves(position)
+        returns list of BookMove of the position, the best one first
+    best_step(position)
+        returns the best allowed step of the position or None
+    best_turn(position)
+        returns steps of the whole turn of the side to move found
+        step by step in the book or None if the book doesn't know it
+    close()
+        unmaps the file
+    """
+    def __init__(self, path=OPENING_BOOK_PATH):
+        self.path = path
+        length = os.path.getsize(path)
+        if length % RECORD.size:
+            raise BookFileError(path)
+        self.size = length // RECORD.size
+        self._map = None
+        if self.size:
+            with open(path, 'rb') as file:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _key_at(self, index):
+        return KEY.unpack_from(self._map, index * RECORD.size)[0]
+
+    def moves(self, position: "Position"):
+        """
+        Returns list of BookMove of steps played from the position,
+        sorted by the average number of points, the best one first
+        """
+        key = position_key(position)
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        moves = []
+        for index in range(low, self.size):
+            record = RECORD.unpack_from(self._map, index * RECORD.size)
+            if record[0] != key:
+                break
+            _, from_index, to_index, kind, games, points = record
+            moves.append(
+                BookMove((from_index, to_index, KINDS[kind]), games, points))
+        moves.sort(key=lambda move: (move.points / move.games, move.games),
+                   reverse=True)
+        return moves
+
+    def best_step(self, position: "Position"):
+        """
+        Returns the best step of the position that is allowed (the hash
+        could come from other position) or None
+        """
+        allowed = position.legal_steps()
+        for move in self.moves(position):
+            if move.step in allowed:
+                return move.step
+        return None
+
+    def best_turn(self, position: "Position"):
+        """
+        Returns steps of the turn made of the best book steps or None
+        if any step of the turn isn't in the book; passed position
+        isn't changed
+        """
+        position = Position.from_snapshot(position.snapshot())
+        colour = position.turn
+        steps = []
+        while position.turn == colour and position.winner() is None:
+            step = self.best_step(position)
+            if step is None:
+                return None
+            steps.append(step)
+            position.make_move(step)
+        return steps if steps else None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Builds the opening book from self-play games")
+    parser.add_argument(
+        "first", help="random, greedy, alphabeta[:depth] or mcts[:playouts]")
+    parser.add_argument(
+        "second", help="random, greedy, alphabeta[:depth] or mcts[:playouts]")
+    parser.add_argument("-n", "--games", type=int, default=1000)
+    parser.add_argument("-p", "--processes", type=int, default=None)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-r", "--rounds", type=int, default=BOOK_ROUNDS)
+    parser.add_argument("-m", "--min-games", type=int, default=BOOK_MIN_GAMES)
+    parser.add_argument("-o", "--output", default=OPENING_BOOK_PATH)
+    arguments = parser.parse_args()
+    moves = build_book(
+        arguments.first, arguments.second, arguments.games,
+        arguments.processes, arguments.seed, arguments.rounds)
+    records = write_book(moves, arguments.output, arguments.min_games)
+    print(f"{records} records written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,19 @@
+import os
 import pygame
-from random import choice
+from concurrent.futures import ThreadPoolExecutor
+from random import choice, Random
 from constants import BLACK, BOT_DELAY
+from constants import USE_OPENING_BOOK, OPENING_BOOK_PATH
+from constants import USE_TABLEBASE, TABLEBASE_PATH
 from fanorona import Fanorona
+from bitboard import point_of
+from telo import paika_moves, best_move
+from search import AlphaBetaSearch
+from mcts import MonteCarloSearch
+from book import OpeningBook
+from tablebase import EndgameTablebase
+from position import Position
+from selfplay import random_player, greedy_player
 
 
 class FanoronaBot:
@@ -26,7 +38,33 @@ class FanoronaBot:
 
         imitate the player with colour of pawns BLACK and makes allowed moves
         that capture the most enemy's pawns
-    make_paika_move(window, fanorona: "Fanorona", move_sound=False)
+    make_search_move(window, fanorona: "Fanorona", move_sound=False)
+        takes window (pygame.display), an instance
+        of fanorona game (class Fanorona) an optional
+        move_sound as arguments
+
+        imitate the player with colour of pawns BLACK and makes the turn
+        found by alpha-beta search (AlphaBetaSearch) within the time budget
+    make_mcts_move(window, fanorona: "Fanorona", move_sound=False)
+        takes window (pygame.display), an instance
+        of fanorona game (class Fanorona) an optional
+        move_sound as arguments
+
+        imitate the player with colour of pawns BLACK and makes the turn
+        found by Monte Carlo Tree Search (MonteCarloSearch)
+    book_turn(position: "Position")
+        returns steps of the turn from the opening book or None if the
+        book doesn't know the position (or there is no book file)
+    tablebase_turn(position: "Position")
+        returns steps of the turn of perfect play from the endgame
+        tablebase or None if the position has too many pawns (or there
+        is no tablebase file)
+    pick_pawn_of_step(fanorona: "Fanorona", step)
+        picks the pawn that makes the step (from_index, to_index, kind)
+        of the turn found on Position
+    make_step(fanorona: "Fanorona", step, move_sound=False)
+        makes one step (from_index, to_index, kind) with picked pawn
+    make_random_paika_move(window, fanorona: "Fanorona", move_sound=False)
         takes window (pygame.display), an instance
         of fanorona game (class Fanorona) an optional
         move_sound as arguments
@@ -34,6 +72,9 @@ class FanoronaBot:
         imitate the player with colour of pawns BLACK and makes random
         paika moves only one time, this method is used for imitating the
         player on Board 3x3 (Fanorona on board 3x3 have different rules)
+    make_perfect_paika_move(window, fanorona: "Fanorona", move_sound=False)
+        the same as make_random_paika_move but it makes the move of
+        perfect play looked up in the table of the solved 3x3 board
     the_best_move_turn(window, fanorona: "Fanorona", move_sound=False)
         takes a turn and picks capture that would pick the most enemy's pawn
 
@@ -86,25 +127,54 @@ class FanoronaBot:
             there are no captures on this board)
         """
         if fanorona.turn == BLACK:
-            try_to_pick = True
-            while try_to_pick:
-                picked = choice(fanorona.pawns.pawns)
-                fanorona.pick_your_pawn(picked)
-                if fanorona.possibilities:
-                    try_to_pick = False
-            fanorona.printer.draw(window)
-            pygame.display.update()
-            pygame.time.delay(BOT_DELAY)
-            x, y = choice(fanorona.possibilities)
-            fanorona.turn_paika(x, y, move_sound)
-            pygame.time.delay(BOT_DELAY)
+            pawns = fanorona.pawns
+            moves = paika_moves(
+                pawns._white_mask, pawns._black_mask, fanorona.turn)
+            if moves:
+                FanoronaBot._make_paika_move(
+                    window, fanorona, choice(moves), move_sound)
+
+    @staticmethod
+    def make_perfect_paika_move(window, fanorona: "Fanorona",
+                                move_sound=False):
+        """
+        Imitate the player and makes the paika move of perfect play
+        taken from the solved 3x3 board (telo.py)
+        """
+        if fanorona.turn == BLACK:
+            pawns = fanorona.pawns
+            move = best_move(
+                pawns._white_mask, pawns._black_mask, fanorona.turn)
+            if move is not None:
+                FanoronaBot._make_paika_move(
+                    window, fanorona, move, move_sound)
+
+    @staticmethod
+    def _make_paika_move(window, fanorona: "Fanorona", move, move_sound):
+        """Picks the pawn and makes the move (from_index, to_index)"""
+        from_index, to_index = move
+        fanorona.pick_your_pawn(
+            fanorona.pawns.row_column_pawn(*point_of(from_index)))
+        fanorona.printer.draw(window)
+        pygame.display.update()
+        pygame.time.delay(BOT_DELAY)
+        fanorona.turn_paika(*point_of(to_index), move_sound)
+        pygame.time.delay(BOT_DELAY)
 
     @staticmethod
     def make_good_move(window, fanorona: "Fanorona", move_sound=False):
         """
         Imitate the player and makes good allowed moves during his turn
-        depending on the number of possible captures
+        depending on the number of possible captures, endgames from
+        the tablebase are played perfectly
         """
+        if fanorona.turn == BLACK and fanorona.change is True:
+            steps = FanoronaBot.tablebase_turn(
+                Position.from_fanorona(fanorona))
+            if steps is not None:
+                FanoronaBot._make_turn_of_steps(
+                    window, fanorona, steps, move_sound)
+                return None
         while fanorona.turn == BLACK:
             # if there is a capture at the start or capturing keeps on
             if fanorona.able_to_capture or fanorona.change is False:
@@ -133,6 +203,146 @@ class FanoronaBot:
             fanorona.printer.draw(window)
             pygame.display.update()
 
+    _search = None
+
+    @staticmethod
+    def _searcher():
+        """
+        Returns AlphaBetaSearch shared by all the moves, so its
+        transposition table is reused between moves
+        """
+        if FanoronaBot._search is None:
+            FanoronaBot._search = AlphaBetaSearch()
+        return FanoronaBot._search
+
+    @staticmethod
+    def make_search_move(window, fanorona: "Fanorona", move_sound=False):
+        """
+        Imitate the player and makes the turn found by alpha-beta search
+        that looks a few full turns ahead
+        """
+        if fanorona.turn != BLACK or fanorona.change is False:
+            return None
+        position = Position.from_fanorona(fanorona)
+        steps = FanoronaBot._known_turn(position)
+        if steps is None:
+            steps = FanoronaBot._searcher().best_turn(position)
+        FanoronaBot._make_turn_of_steps(window, fanorona, steps, move_sound)
+
+    _monte_carlo = None
+
+    @staticmethod
+    def _monte_carlo_searcher():
+        """Returns MonteCarloSearch shared by all the moves"""
+        if FanoronaBot._monte_carlo is None:
+            FanoronaBot._monte_carlo = MonteCarloSearch()
+        return FanoronaBot._monte_carlo
+
+    @staticmethod
+    def make_mcts_move(window, fanorona: "Fanorona", move_sound=False):
+        """
+        Imitate the player and makes the turn that won the most random
+        playouts of Monte Carlo Tree Search
+        """
+        if fanorona.turn != BLACK or fanorona.change is False:
+            return None
+        position = Position.from_fanorona(fanorona)
+        steps = FanoronaBot._known_turn(position)
+        if steps is None:
+            steps = FanoronaBot._monte_carlo_searcher().best_turn(position)
+        FanoronaBot._make_turn_of_steps(window, fanorona, steps, move_sound)
+
+    _book = None
+    _book_opened = False
+
+    @staticmethod
+    def _opening_book():
+        """
+        Returns OpeningBook shared by all the moves or None if it is
+        turned off or there is no book file
+        """
+        if not FanoronaBot._book_opened:
+            FanoronaBot._book_opened = True
+            if USE_OPENING_BOOK == 1 and os.path.exists(OPENING_BOOK_PATH):
+                FanoronaBot._book = OpeningBook(OPENING_BOOK_PATH)
+        return FanoronaBot._book
+
+    @staticmethod
+    def book_turn(position: "Position"):
+        """Returns steps of the turn from the opening book or None"""
+        book = FanoronaBot._opening_book()
+        if book is None:
+            return None
+        return book.best_turn(position)
+
+    _tablebase = None
+    _tablebase_opened = False
+
+    @staticmethod
+    def _endgame_tablebase():
+        """
+        Returns EndgameTablebase shared by all the moves or None if it is
+        turned off or there is no tablebase file
+        """
+        if not FanoronaBot._tablebase_opened:
+            FanoronaBot._tablebase_opened = True
+            if USE_TABLEBASE == 1 and os.path.exists(TABLEBASE_PATH):
+                FanoronaBot._tablebase = EndgameTablebase(TABLEBASE_PATH)
+        return FanoronaBot._tablebase
+
+    @staticmethod
+    def tablebase_turn(position: "Position"):
+        """Returns steps of the turn from the endgame tablebase or None"""
+        tablebase = FanoronaBot._endgame_tablebase()
+        if tablebase is None:
+            return None
+        return tablebase.best_turn(position)
+
+    @staticmethod
+    def _known_turn(position: "Position"):
+        """Returns turn from the opening book or the tablebase or None"""
+        steps = FanoronaBot.book_turn(position)
+        if steps is None:
+            steps = FanoronaBot.tablebase_turn(position)
+        return steps
+
+    @staticmethod
+    def _make_turn_of_steps(window, fanorona: "Fanorona", steps,
+                            move_sound=False):
+        """Makes the turn found on Position step by step with drawing"""
+        if steps is None:
+            return None
+        FanoronaBot.pick_pawn_of_step(fanorona, steps[0])
+        fanorona.printer.draw(window)
+        pygame.display.update()
+        pygame.time.delay(BOT_DELAY)
+        for step in steps:
+            FanoronaBot.make_step(fanorona, step, move_sound)
+            fanorona.printer.draw(window)
+            pygame.display.update()
+            pygame.time.delay(BOT_DELAY)
+        if fanorona.turn == BLACK:
+            # just in case the turn couldn't be finished as planned
+            FanoronaBot.make_good_move(window, fanorona, move_sound)
+
+    @staticmethod
+    def pick_pawn_of_step(fanorona: "Fanorona", step):
+        """Picks the pawn that starts the step (from_index, to_index, kind)"""
+        row, col = point_of(step[0])
+        fanorona.pick_your_pawn(fanorona.pawns.row_column_pawn(row, col))
+
+    @staticmethod
+    def make_step(fanorona: "Fanorona", step, move_sound=False):
+        """Moves picked pawn as described by (from_index, to_index, kind)"""
+        _, to_index, kind = step
+        row, col = point_of(to_index)
+        if kind == 'APPROACH':
+            fanorona.turn_approach(row, col, move_sound)
+        elif kind == 'WITHDRAWAL':
+            fanorona.turn_withdrawal(row, col, move_sound)
+        else:
+            fanorona.turn_paika(row, col, move_sound)
+
     def the_best_move_turn(window, fanorona: "Fanorona", move_sound=False):
         cond1 = fanorona.capturing_moves_approach
         cond2 = fanorona.capturing_moves_withdrawal
@@ -195,6 +405,99 @@ class FanoronaBot:
             fanorona.turn_paika(x, y, move_sound)
 
 
+def think(level, snapshot, seed=None):
+    """
+    Returns steps of the turn of the bot with passed level (the same as
+    in main_comp(): 0 - good moves, 1 - random moves, 2 - search,
+    3 - Monte Carlo Tree Search) for the position described by Snapshot
+    or None if there is no allowed turn; search bots take turns from
+    the opening book when it knows the position and all but the random
+    bot play endgames from the tablebase
+
+    It doesn't touch any game, so it can be called by BotWorker
+    """
+    position = Position.from_snapshot(snapshot)
+    if level in [2, 3]:
+        steps = FanoronaBot._known_turn(position)
+        if steps is not None:
+            return steps
+    if level == 0:
+        steps = FanoronaBot.tablebase_turn(position)
+        if steps is not None:
+            return steps
+    if level == 2:
+        return FanoronaBot._searcher().best_turn(position)
+    if level == 3:
+        return FanoronaBot._monte_carlo_searcher().best_turn(position)
+    player = greedy_player if level == 0 else random_player
+    steps = player(position, Random(seed))
+    return steps if steps else None
+
+
+class BotWorker:
+    """
+    Class used for computing turns of the bot in a background thread,
+    so the window isn't frozen while the bot is thinking; the game is
+    copied to Snapshot before thinking starts
+
+    ...
+    Attributes
+    ----------
+    level: int
+        level of the bot (see think())
+    ready_event: int or None
+        type of pygame event that is posted when the turn is computed,
+        it wakes up the main loop
+
+    Methods
+    -------
+    start(fanorona: "Fanorona")
+        starts computing the turn of the side to move, returns False
+        if the previous turn is still computed
+    busy()
+        returns True if the turn is being computed
+    result()
+        returns (snapshot, steps) of the computed turn or None if it isn't
+        computed yet, snapshot describes the game the turn was found for
+    shutdown()
+        stops the background thread after the current computation
+    """
+    def __init__(self, level, ready_event=None):
+        self.level = level
+        self.ready_event = ready_event
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future = None
+        self._snapshot = None
+
+    def start(self, fanorona: "Fanorona"):
+        if self.busy():
+            return False
+        self._snapshot = Position.from_fanorona(fanorona).snapshot()
+        self._future = self._executor.submit(
+            think, self.level, self._snapshot)
+        if self.ready_event is not None:
+            self._future.add_done_callback(self._post_ready_event)
+        return True
+
+    def _post_ready_event(self, future):
+        # pygame.event.post can be called from other threads
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(self.ready_event))
+
+    def busy(self):
+        return self._future is not None and not self._future.done()
+
+    def result(self):
+        if self._future is None or not self._future.done():
+            return None
+        steps = self._future.result()
+        self._future = None
+        return self._snapshot, steps
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 class Best_move_picker:
     """
     Class used for picking best move in Fanorona game
@@ -1,18 +1,31 @@
-from pygame import font
+from enum import IntEnum
 
 # RGB colours
 RED = (100, 0, 50)
 RED2 = (255, 0, 0)
-BLACK = (0, 0, 0)
-BLACK2 = (78, 75, 75)
-WHITE = (255, 255, 255)
-WHITE2 = (176, 190, 197)
+BLACK_RGB = (0, 0, 0)
+BLACK2_RGB = (78, 75, 75)
+WHITE_RGB = (255, 255, 255)
+WHITE2_RGB = (176, 190, 197)
 GREEN = (31, 97, 52)
 DARK_BLUE = (0, 143, 179)
 ORANGE = (255, 204, 0)
 PINK = (255, 0, 255)
 YELLOW = (250, 253, 15)
 
+
+class Colour(IntEnum):
+    """
+    Sides of the game (colours of pawns) used by the game logic, they
+    are small ints; RGB colours, also the ones of highlighted pawns,
+    are picked only when pawns are drawn (rendering.py)
+    """
+    WHITE = 0
+    BLACK = 1
+
+
+WHITE, BLACK = Colour.WHITE, Colour.BLACK
+
 # Game constants
 """"
 ROWS and COLS should be not even in order
@@ -22,18 +35,48 @@ ROWS, COLS = 5, 9
 FPS = 60
 SOUND_EFFECTS = 1  # 1 - on, 0 - off
 BOT_DELAY = 480
+# 1 - bot computes its turn in background thread, so the window isn't
+# frozen, 0 - bot moves inside the event handler
+BOT_IN_BACKGROUND = 1
+SEARCH_MAX_DEPTH = 8  # in full turns
+SEARCH_TIME_BUDGET = 1.0  # seconds for one move of the search bot
+MCTS_ITERATIONS = 3000  # maximal number of playouts for one move
+MCTS_TIME_BUDGET = 1.0  # seconds for one move of the Monte Carlo bot
+MCTS_EXPLORATION = 1.4  # constant of UCT
+MCTS_PLAYOUT_ROUNDS = 100  # longer playouts are counted as draws
+# search bots take turns of the first rounds from the opening book
+# if the file exists (it is made by book.py), 1 - on, 0 - off
+USE_OPENING_BOOK = 1
+OPENING_BOOK_PATH = "opening_book.bin"
+BOOK_ROUNDS = 6  # rounds of self-play games that are put into the book
+BOOK_MIN_GAMES = 3  # steps played in fewer games aren't put into the book
+# bots play endgames from the tablebase if the file exists (it is made
+# by tablebase.py), 1 - on, 0 - off
+USE_TABLEBASE = 1
+TABLEBASE_PATH = "endgame_tablebase.bin"
+TABLEBASE_PAWNS = 3  # maximal number of pawns of both sides in the tablebase
+# games played in the window are appended to the file of game records
+# GAME_RECORDS_PATH (see records.py), 1 - on, 0 - off
+RECORD_GAMES = 0
+GAME_RECORDS_PATH = "games.fgr"
+SELFPLAY_MAX_ROUNDS = 300  # longer self-play games are counted as draws
+SELFPLAY_SEARCH_DEPTH = 2  # depth of alpha-beta player in self-play
+SELFPLAY_MCTS_ITERATIONS = 200  # playouts of Monte Carlo player in self-play
 
 # Window constants
 PADDING = 50
 MIN_WIDTH = 250
 MIN_HEIGHT = 250
 
-# Drawing constants
-font.init()
-FONT = font.SysFont('calibri', 40, True)
-FONT_SMALL = font.SysFont('calibri', 20, True)
+# Drawing constants (fonts are in rendering.py)
 LINE_WIDTH = 5
 IF_DRAW_NUM_OF_ROUND = 1  # 1 - draw, 0 - dont't draw
+# 1 - only changed parts of the window are drawn, 0 - everything every frame
+DIRTY_RECT_RENDERING = 1
+# 1 - the main loop sleeps until some event comes, 0 - it runs FPS times
+# per second; IDLE_WAIT_TIMEOUT (ms) is the longest sleep
+EVENT_DRIVEN_LOOP = 1
+IDLE_WAIT_TIMEOUT = 1000
 
 # --------------------------------------
 # check if ROWS and COLS are appropriate
@@ -65,7 +108,7 @@ class MainArguemntRandomException(Exception):
     def __init__(self):
         super().__init__(
             """Random argument of main function should be
-either 1 or 0, check documentation"""
+either 1, 0, 2 or 3, check documentation"""
         )
 
 
@@ -84,3 +127,43 @@ class WrongUseOfCaptureByAppOrWithFunc(Exception):
 capture_by_withdrawal(), check documentation
 for further information"""
         )
+
+
+class TranspositionTableSizeError(Exception):
+    def __init__(self):
+        super().__init__(
+            """Size of the transposition table should be
+a power of two"""
+        )
+
+
+class BookFileError(Exception):
+    def __init__(self, path):
+        super().__init__(
+            f"""File '{path}' isn't an opening book, its size
+should be a multiple of the size of the record"""
+        )
+
+
+class TablebaseFileError(Exception):
+    def __init__(self, path):
+        super().__init__(
+            f"""File '{path}' isn't an endgame tablebase for
+the board with the current number of rows and columns"""
+        )
+
+
+class GameRecordFileError(Exception):
+    def __init__(self, path):
+        super().__init__(
+            f"""File '{path}' isn't a file of game records
+or its last game is cut off"""
+        )
+
+
+class UnknownPlayerError(Exception):
+    def __init__(self, name):
+        super().__init__(
+            f"""There is no player called '{name}', check
+documentation of selfplay.py"""
+        )
@@ -0,0 +1,769 @@
+from pawn import Pawn
+from pawns import Pawns
+from constants import BLACK, WHITE
+from constants import ROWS, COLS, SOUND_EFFECTS
+from bitboard import Bitboard, FULL_MASK, bits, point_of, influenced_by
+from bitboard import index_of, line_winner
+from geometry import NEIGHBOURS, RAYS, OPPOSITE, direction_between
+from constants import WrongUseOfCaptureByAppOrWithFunc
+
+
+class NoWinnerError(Exception):
+    def __init__(self):
+        super().__init__("Cannot draw winner if there is no winner")
+
+
+class Fanorona:
+    """
+    Class used for representing the state of Fanorona game and making
+    turns, it doesn't need pygame (drawing is done by fanorona.Fanorona)
+
+    ...
+    Attributes
+    ----------
+    pawns:
+        an instance of class Pawns
+    logic:
+        an instance of class FanoronaLogic
+    selected_pawn: an instance of class Pawn
+        an instance of class Pawn if some pawn is selected,
+        if nothing is selected - None
+    turn: Colour
+        holds the colour of pawns that can be moved,
+        either WHITE or BLACK (constants.Colour)
+    possiblilities: list
+        list of tuples - (row, column) that represents the places
+        where the selected Pawn can be moved (empty boxes along the
+        lines)
+    round: int
+        a number of round, default value is 1 (first round)
+    change: bool
+        informas if pawn can be changed, if it is False, it means
+        that capturing continues
+    where_was_pawn: list
+        a list which informs about where was pawn during actual round
+        e.g [(1, 2), (1, 3), (2, 3)]
+    able_to_capture: list
+        contains instances of Pawn that are able to capture some enemy's pawns;
+
+        it is mainly used to highlight this pawns later at the start of the
+        round
+    _able_mask: int
+        mask of places of pawns (of both colours) that are able to capture,
+        only pawns near places changed since the last check are checked
+        again, so checking it when nothing has moved costs nothing
+    _able_pawns: list
+        pawns from '_able_mask' in order of places, row by row
+    _able_of: Pawns
+        an instance of Pawns that '_able_mask' describes
+    last_move: string
+        last_move of actually selected pawn, e.g 'N' means that
+        self.selected_pawn was before moved into in 'N' direction
+
+        it is mainly used to block not allowed captures, for example if pawn
+        captures by moving to the right (withdrawal) and after that it
+        can capture again by moving to the right (approach)
+    problematic_cap: bool
+        indicate if problematic capture was detected;
+        problematic captures is capture that can be either by approach or
+        withdrowal
+
+        hint:
+        it is needed to detect this capture since after that there is need
+        for player to choose what he wants to capture
+    approach_choices: list
+        contains list of (row, col) that selected_pawn would capture by
+        approach if he moves there
+
+        it helps with problematic_capture (when player need to choose what he
+        wants to capture)
+    withdrowal_choices: list
+        contains list of (row, col) that selected_pawn would capture by
+        withdrawal if he moves there
+
+        it helps with problematic_capture (when player need to choose what he
+        wants to capture)
+    on_step: function or None
+        called with step (from_index, to_index, kind) just before every
+        step of selected_pawn is made, kind is 'APPROACH', 'WITHDRAWAL'
+        or 'PAIKA'; it is used for recording games (see records.py)
+        and it is kept after reset()
+
+    Methods:
+    -------
+    highlight_clicked(clicked_pawn)
+        clears highlighting and then highlights clicked_pawn
+        (changes the Pawn 'if_selected' attribute)
+    move_selected_piece(new_row, new_column)
+        moves the selected Pawn to the square that matches
+        new_row and new_column
+    remove_captured_and_count(captured: "list")
+        takes the list of (row, col) e.g [(1, 2), (3, 4)]
+        and then removes pawns that matches that number of
+        rows and column, plus updates attributes of
+        self.pawns 'blacks' and 'whites' that hold information
+        about number of pawns with some colour
+    move_and_capture_by_approach(new_row, new_col)
+        does everything connected to moving and capturing
+
+        updating 'last_move' and 'where_was_pawn' attributes,
+        calling remove_captured_and_count(), capturing by appraoch,
+        moving
+    move_and_capture_by_withdrawal(new_row, new_col)
+        does everything connected to moving and capturing
+
+        updating 'last_move' and 'where_was_pawn' attributes,
+        calling remove_captured_and_count(), capturing by withdrawal,
+        moving
+    reset()
+        resets the game by calling __init__ again,
+        everything is as at the beginning
+    empty_space_validator()
+        updates 'possibilities' attribute, by removing not empty pawns
+        from it
+    last_move_validator()
+        updates 'possibilities' attribute by removing these moves that
+        would match 'last_move' attribute
+
+        it it important since it is not allowed to move in the same
+        directon twice
+    capturing_moves_validator()
+        updates 'capturing_moves_approach' and 'capturing_moves_withdrawal'
+        attributes depending on the attribute 'where_was_pawn'
+
+        it is important since captures can't be done by moving to
+        the places the pawn was before on in the same round
+    change_turn()
+        changes the turn of the game (attribute 'turn')
+    return_able_to_capture()
+        returns the list of instance of Pawn that are able
+        to capture, it is updated only around places changed since
+        the last call
+    update_last_move(new_row, new_col)
+        updates 'last_move' attribute, takes row and col that
+        pawn is moved into
+    update_possibilities()
+        if no Pawn is selected, returns None
+        otherwise appends to attribute 'possibilities' allowed possible
+        places e.g. [(1, 2), (2, 1)]
+    update_possible_captures()
+        updates 'capturing_moves_approach' and
+        'capturing_moves_withdrawal' attributes
+
+        if no pawn is selected, returns None
+    update_able_to_capture()
+        updates attribute 'able_to_capture' with instances of Pawn
+        that are able to capture and matches the colour of the actual
+        turn
+    -------------
+    turn_approach(n_row, n_col, move_sound=False)
+    turn_withdrawal(n_row, n_col, move_sound=False)
+        takes as arguments row, col where pawn should move and optionally
+        move_sound (pygame.mixer.Sound), which will be played after calling
+        this method
+
+        this method is used to make one full turn, when we now that pawn
+        will capture by APPROACH/WITHDRAWAL, it moves, captures and it
+        takes care of the configuraton depending on the fact if the pawn
+        can still capture or this is the end of the round or it's first
+        or second round
+    turn_paika(n_row, n_col, move_sound=False)
+        takes as arguments row, col where pawn should move and optionally
+        move_sound (pygame.mixer.Sound)
+
+        this method is used to make one full turn, when we now that pawn
+        will make paika move (no captures), it moves the pawn and takes care of
+        configuration that should be done after the end of the round
+
+        note that after paika move always will the end of the round
+    turn_problematic_move(n_row, n_col, move_sound=False)
+        takes as arguments row, col of clicked square and optionally
+        move_sound (pygame.mixer.Sound)
+
+        this method is used to make one full turn after problmatic capture
+        (when player needs to choose what he wants to capture) and should
+        be called on click.event after method that indicate problematic capture
+
+        depending on passed row, col, it does nothing and waits or makes
+        a capture by approach/withdrawal; it depends whether passed row, col
+        is either in 'approach_choices' or 'withdrawal_choices'
+
+        it also takes care of configuration after capture/the end of round
+        just as turn_approach/turn_withdrawal methods
+    pick_your_pawn(clicked_pawn)
+        this method should be called after click.event on pawn
+
+        if clicked pawn colour matches the actual turn, then it is selected,
+        highlighted and 'possibilities' and possible captures are updated
+    indicate_problematic_capture(ew_row, new_col)
+        this method should be called after discovering problematic capture
+        (when player needs to choose what he want to capture)
+
+        main function of this method is to prepare for calling
+        turn_problematic_move() method (mainly updating 'approach_choices'
+        and 'withdrowal_choices' attributes)
+    _sett_after_problematic_capture()
+        this method should be called after calling turn_problematic_move()
+        method, it clears after it and ends turn/prepares for next captures
+    register_poss_of_pawn()
+        after calling this method, current position of the pawn is added to
+        'where_was_pawn' attribute e.g. (2, 5)
+    end_of_turn_conf()
+        should be called after every round, clears, changes rounds, turns and
+        sets 'last_move' and 'change' attribute back to default
+    clear_possibilities()
+        clears 'possibilities' attribute
+    clear_capturing_moves()
+        clears 'capturing_moves_approach' and 'capturing_moves_withdrawal'
+        attributes
+    clear_highlighted()
+        clears highlight of every pawn and changes 'selected_pawn' back to None
+    clear_where_was_pawn()
+        clears 'where_was_pawn' attribute
+    clear_able_to_capture()
+        clears 'able_to_capture' attribute and clears 'if_capture' attribute
+        of pawns from it
+    """
+    def __init__(self):
+        self.pawns = Pawns()
+        self.logic = FanoronaLogic(self)
+        self.selected_pawn = None
+        self.turn = WHITE
+        self.possibilities = []
+        self.capturing_moves_approach = []
+        self.capturing_moves_withdrawal = []
+        self.round = 1
+        self.change = True
+        self.where_was_pawn = []
+        self.able_to_capture = []
+        self._able_mask = 0
+        self._able_pawns = []
+        self._able_of = None
+        self.last_move = None
+
+        self.problematic_cap = False
+        self.approach_choices = []
+        self.withdrowal_choices = []
+        self.on_step = None
+
+    def highlight_clicked(self, clicked_pawn):
+        """
+        Changes attribute 'if_selected' of clicked Pawn
+        """
+        self.pawns.highlight_pawn(clicked_pawn)
+        self.selected_pawn = clicked_pawn
+
+    def move_selected_piece(self, new_row, new_col):
+        """
+        Changes location of the selected pawn to the
+        new_row and new_column, note that it doesn't
+        check if the move is valid
+        """
+        if self.selected_pawn is not None:
+            self.selected_pawn.move(new_row, new_col)
+
+    def _report_step(self, new_row, new_col, kind):
+        if self.on_step is not None:
+            pawn = self.selected_pawn
+            self.on_step((index_of(pawn.row, pawn.column),
+                          index_of(new_row, new_col), kind))
+
+    def remove_captured_and_count(self, captured: list):
+        count = len(captured)
+
+        for row, col in captured:
+            self.pawns.remove_pawn(row, col)
+
+        if self.selected_pawn.colour == WHITE:
+            self.pawns.blacks -= count
+        else:
+            self.pawns.whites -= count
+
+    def move_and_capture_by_approach(self, new_row, new_col):
+        """
+        this method should be called when we now that capture by
+        approach is possible
+        """
+        self._report_step(new_row, new_col, 'APPROACH')
+        self.update_last_move(new_row, new_col)
+        # print(self.last_move)
+        captured = self.logic.capture_by_approach(new_row, new_col)
+        self.remove_captured_and_count(captured)
+        self.selected_pawn.move(new_row, new_col)
+        self.where_was_pawn.append((new_row, new_col))
+        self.clear_able_to_capture()
+        # print(self.where_was_pawn)
+
+    def move_and_capture_by_withdrawal(self, new_row, new_col):
+        """
+        this method should be called when we now that capture by
+        withdrawal is possible
+        """
+        self._report_step(new_row, new_col, 'WITHDRAWAL')
+        self.update_last_move(new_row, new_col)
+        # print(self.last_move)
+        captured = self.logic.capture_by_withdrawal(new_row, new_col)
+        self.remove_captured_and_count(captured)
+        self.selected_pawn.move(new_row, new_col)
+        self.where_was_pawn.append((new_row, new_col))
+        self.clear_able_to_capture()
+        # print(self.where_was_pawn)
+
+    def empty_space_validator(self):
+        new_poss = self.logic.empty_space_validator_list(self.possibilities)
+        self.possibilities = new_poss
+
+    def last_move_validator(self):
+        self.possibilities = self.logic.last_move_validator_poss()
+
+    def capturing_moves_validator(self):
+        """Removes captures that would move the pawn where it has been"""
+        if not self.where_was_pawn:
+            return None
+        visited = set(self.where_was_pawn)
+        self.capturing_moves_approach = [
+            place for place in self.capturing_moves_approach
+            if place not in visited]
+        self.capturing_moves_withdrawal = [
+            place for place in self.capturing_moves_withdrawal
+            if place not in visited]
+
+    def reset(self):
+        """Resets the game, calls init again"""
+        on_step = self.on_step
+        self.__init__()
+        self.on_step = on_step
+
+    def next_round(self):
+        """Initializes a new game"""
+        self.round += 1
+
+    def change_turn(self):
+        if self.turn == WHITE:
+            self.turn = BLACK
+        else:
+            self.turn = WHITE
+
+    def return_able_to_capture(self):
+        pawns = self.pawns
+        changed = pawns._take_changes()
+        if pawns is not self._able_of:
+            # pawns were replaced, e.g. by a test or reset()
+            self._able_of = pawns
+            self._able_mask = 0
+            changed = FULL_MASK
+        if changed:
+            near = influenced_by(changed)
+            bitboard = self.logic.bitboard()
+            able_near = near & (bitboard.capturing_mask(WHITE)
+                                | bitboard.capturing_mask(BLACK))
+            self._able_mask = self._able_mask & ~near | able_near
+            self._able_pawns = [
+                pawns._index_pawn(*point_of(index))
+                for index in bits(self._able_mask)]
+        return list(self._able_pawns)
+
+    def update_last_move(self, new_row, new_col):
+        last_move = self.logic.get_last_move(
+            self.selected_pawn, new_row, new_col)
+        self.last_move = last_move
+
+    def update_possibilities(self):
+        if self.selected_pawn is None:
+            self.possibilities.clear()
+            return None
+        selected = self.selected_pawn
+        poss = self.logic.possibilities_of_pawn(selected)
+        self.possibilities = poss
+        self.empty_space_validator()
+        self.last_move_validator()
+
+    def update_possible_captures(self):
+        if self.selected_pawn is None:
+            return None
+        self.update_possibilities()  # just in case
+        captures_app = self.logic.possible_captures_approach(
+            self.selected_pawn, self.possibilities)
+        captures_with = self.logic.possible_captures_withdrowal(
+            self.selected_pawn, self.possibilities)
+        self.capturing_moves_approach = captures_app
+        self.capturing_moves_withdrawal = captures_with
+        self.capturing_moves_validator()
+
+    def update_able_to_capture(self):
+        pawns_able_to_capture = self.return_able_to_capture()
+        self.able_to_capture.clear()
+        for pawn in pawns_able_to_capture:
+            if pawn.colour == self.turn:
+                self.able_to_capture.append(pawn)
+                pawn.if_capture = True
+
+    def turn_approach(self, n_row, n_col, move_sound=False):
+        if self.problematic_cap is False:
+            self.register_poss_of_pawn()
+            capt_mv_ap = self.capturing_moves_approach
+            if (n_row, n_col) in capt_mv_ap:
+                self.move_and_capture_by_approach(
+                    n_row, n_col)
+                self.clear_possibilities()
+                self.clear_capturing_moves()
+                if SOUND_EFFECTS == 1 and move_sound is not False:
+                    move_sound.play(0)
+
+                self.update_possibilities()
+                self.update_possible_captures()
+                cond1 = self.capturing_moves_approach
+                cond2 = self.capturing_moves_withdrawal
+                cond3 = self.round in [1, 2]
+                self.change = False
+                self.clear_able_to_capture()
+                if (not cond1 and not cond2) or cond3:
+                    self.end_of_turn_conf()
+
+    def turn_paika(self, n_row, n_col, move_sound=False):
+        # in this case there is no point saving position of pawn
+        # since there will be no more moves and the end of the round
+        # after paika move
+        if self.problematic_cap is False:
+            if (n_row, n_col) in self.possibilities:
+                self._report_step(n_row, n_col, 'PAIKA')
+                self.move_selected_piece(n_row, n_col)
+
+                if SOUND_EFFECTS == 1 and move_sound is not False:
+                    move_sound.play(0)
+
+                self.clear_able_to_capture()
+
+                self.end_of_turn_conf()
+
+    def turn_withdrawal(self, n_row, n_col, move_sound=False):
+        if self.problematic_cap is False:
+            self.register_poss_of_pawn()
+            capt_mv_w = self.capturing_moves_withdrawal
+            if (n_row, n_col) in capt_mv_w:
+                self.move_and_capture_by_withdrawal(
+                    n_row, n_col)
+                self.clear_possibilities()
+                self.clear_capturing_moves()
+                if SOUND_EFFECTS == 1 and move_sound is not False:
+                    move_sound.play(0)
+
+                self.update_possibilities()
+                self.update_possible_captures()
+                cond1 = self.capturing_moves_approach
+                cond2 = self.capturing_moves_withdrawal
+                cond3 = self.round in [1, 2]
+                self.change = False
+                self.clear_able_to_capture()
+                if (not cond1 and not cond2) or cond3:
+                    self.end_of_turn_conf()
+
+    def turn_problematic_move(self, n_row, n_col, move_sound=False):
+        where_to_move = self.problematic_cap[1]
+
+        def movement_after_problematic(type_of_capture):
+            # type_of_capture - "APPROACH" / "WITHDRAWAL"
+            self.register_poss_of_pawn()
+            # print(self.where_was_pawn)
+            if type_of_capture == "WITHDRAWAL":
+                self.move_and_capture_by_withdrawal(
+                    where_to_move[0], where_to_move[1])
+            else:
+                self.move_and_capture_by_approach(
+                    where_to_move[0], where_to_move[1])
+            self._sett_after_problematic_capture()
+            if SOUND_EFFECTS == 1 and move_sound is not False:
+                move_sound.play(0)
+            self.clear_able_to_capture()
+
+        for row, col in self.withdrowal_choices:
+            if row == n_row and col == n_col:
+                movement_after_problematic("WITHDRAWAL")
+
+        for row, col in self.approach_choices:
+            if row == n_row and col == n_col:
+                movement_after_problematic("APPROACH")
+
+    def pick_your_pawn(self, clicked_pawn):
+        if self.turn == clicked_pawn.colour:
+            self.update_able_to_capture()
+            # we needed to add this since we are now
+            # clearing able_to_capture with draw function
+            # because of previous bug
+            if self.change is True:
+                cond1 = clicked_pawn in self.able_to_capture
+                cond2 = not self.able_to_capture
+                if cond1 or cond2 or (ROWS == 3 and COLS == 3):
+                    self.highlight_clicked(
+                        clicked_pawn)
+            # clearing list of possibilites just in case
+                    self.clear_capturing_moves()
+                    self.clear_possibilities()
+                    self.update_possibilities()
+                    if ROWS != 3 or COLS != 3:
+                        self.update_possible_captures()
+
+    def indicate_problematic_capture(self, new_row, new_col):
+        if self.problematic_cap is False:
+            self.problematic_cap = True, (new_row, new_col)
+            captured1 = self.logic.capture_by_approach(new_row, new_col)
+            captured2 = self.logic.capture_by_withdrawal(new_row, new_col)
+
+            # pawns from choices are drawn highlighted (see rendering.py),
+            # their colour doesn't change
+            for row, col in captured1:
+                if (row, col) not in self.where_was_pawn:
+                    self.approach_choices.append((row, col))
+
+            for row, col in captured2:
+                if (row, col) not in self.where_was_pawn:
+                    self.withdrowal_choices.append((row, col))
+            # clearing highlights of pawns that can capture
+            self.clear_able_to_capture()
+
+    def _sett_after_problematic_capture(self):
+        self.approach_choices.clear()
+        self.withdrowal_choices.clear()
+        self.problematic_cap = False
+
+        self.clear_possibilities()
+        self.clear_capturing_moves()
+        self.update_possibilities()
+        self.update_possible_captures()
+
+        self.change = False
+        cond3 = self.round in [1, 2]
+        cond1 = self.capturing_moves_approach
+        cond2 = self.capturing_moves_withdrawal
+
+        if cond3 or (not cond1 and not cond2):
+            self.end_of_turn_conf()
+
+    def register_poss_of_pawn(self):
+        """Notes current position of pawn to 'where_was_pawn'"""
+        row = self.selected_pawn.row
+        col = self.selected_pawn.column
+
+        if (row, col) not in self.where_was_pawn:
+            self.where_was_pawn.append((row, col))
+
+    def end_of_turn_conf(self):
+        self._clear_after_round()
+        self.next_round()
+        self.change_turn()
+        self.change = True
+        self.last_move = None
+
+    def clear_possibilities(self):
+        """Clears 'possibiliites' (list) attribute"""
+        self.possibilities.clear()
+
+    def clear_capturing_moves(self):
+        self.capturing_moves_approach.clear()
+        self.capturing_moves_withdrawal.clear()
+
+    def clear_highlighted(self):
+        self.pawns.clear_highlights()
+        self.selected_pawn = None
+
+    def _clear_after_round(self):
+        self.clear_highlighted()
+        self.clear_possibilities()
+        self.clear_capturing_moves()
+        self.clear_where_was_pawn()
+
+    def clear_where_was_pawn(self):
+        self.where_was_pawn.clear()
+
+    def clear_able_to_capture(self):
+        # only pawns from the list can have 'if_capture' set
+        for pawn in self.able_to_capture:
+            pawn.if_capture = False
+        self.able_to_capture.clear()
+
+
+class FanoronaLogic:
+    """
+    Class used for taking care of majority of logic of Fanorona game
+
+    ....
+    Attributes
+    ----------
+    fanorona:
+        an instance of class Fanorona
+
+    Methods:
+    --------
+    capture_by_approach(new_row, new_col)
+    capture_by_withdrawal(new_row, new_col)
+        takes as arguemnt new_row and new_column and according to that and
+        fanorona.selected_pawn returns list of pawns that selected pawn would
+        capture by APPROACH/WITHDRAWAL by moving there;
+        return e.g. [(1, 2), (2, 2), (3, 2)] and it means that if selected pawn
+        moves on the place (new_row, new_col) is would capture pawns that are
+        on (1, 2), (2, 2) and (3, 2)
+
+        raises WrongUseOfCaptureByAppOrWithFunc exception if (new_row, new_col)
+        isn't around selected_pawn (one place away)
+    empty_space_validator_list(list_of_poss)
+        takes as arguemnt list of possible movements and removes from it places
+        that are already taken by some other pawn
+    last_move_validator_poss()
+        return copy of list fanorona.possibilities attribute without not
+        allowed moved because of direction of last movement
+    possibilities_of_pawn(pawn: "Pawn")
+        takes as argument an instance of class Pawn and returns list of
+        possible movement that it can be moved into; note that it returns
+        possiblies as if it was on PLAIN BOARD, so all possible movement
+        are just movements along the lines
+    possible_captures_withdrowal(pawn: "Pawns", poss)
+    possible_captures_approach(pawn: "Pawns", poss)
+        takes as argument an instance of class Pawn and list of its possible
+        movement and according to that returns list of possible moves that
+        would capture by APPROCH/WITHDROWAL
+        e.g. [(1, 2), (2, 1)]
+    get_last_move(pawn: "Pawn", new_row, new_col)
+        takes an instance of class Pawn and new_row and new_col that means the
+        place that it will be moved into and according to that returns
+        direction of movement e.g. 'N', 'SW'....
+
+        returns string
+    check_for_winner()
+        returns Colour (WHITE/BLACK) of pawns that won or None if nobody
+        has won yet
+    bitboard()
+        returns an instance of Bitboard with the current layout of pawns,
+        it is used for generating moves of the whole side at once
+    """
+    def __init__(self, fanorona: "Fanorona"):
+        self.fanorona = fanorona
+
+    def bitboard(self):
+        """Returns Bitboard with the current layout of pawns"""
+        pawns = self.fanorona.pawns
+        return Bitboard(pawns._white_mask, pawns._black_mask)
+
+    def capture_by_approach(self, new_row, new_col):
+        """
+        This method works knowing that pawn can be moved on places that are
+        'around' it, just as in fanorona game; in other cases will be raised
+        WrongUseOfCaptureByAppOrWithFunc Excepetion
+        """
+        selected = self.fanorona.selected_pawn
+        if selected is None:
+            return []
+        row = selected.row
+        col = selected.column
+        if abs(row-new_row) > 1 or abs(col-new_col) > 1:
+            raise WrongUseOfCaptureByAppOrWithFunc()
+
+        direction = direction_between(row, col, new_row, new_col)
+        if direction is None:
+            return []
+        # enemy's pawns in a row right in front of the new place
+        return self._captured_along(
+            RAYS[(new_row, new_col)][direction], selected.colour)
+
+    def capture_by_withdrawal(self, new_row, new_col):
+        """
+        This method works knowing that pawn can be moved on places that are
+        'around' it, just as in fanorona game; in other cases will be raised
+        WrongUseOfCaptureByAppOrWithFunc Excepetion
+        """
+        selected = self.fanorona.selected_pawn
+        if selected is None:
+            return []
+        row = selected.row
+        col = selected.column
+        if abs(row-new_row) > 1 or abs(col-new_col) > 1:
+            raise WrongUseOfCaptureByAppOrWithFunc()
+
+        direction = direction_between(row, col, new_row, new_col)
+        if direction is None:
+            return []
+        # enemy's pawns in a row right behind the place the pawn leaves
+        return self._captured_along(
+            RAYS[(row, col)][OPPOSITE[direction]], selected.colour)
+
+    def _captured_along(self, ray, colour):
+        """
+        Returns list of (row, col) of enemy's pawns that stand one
+        after another at the start of passed ray (tuple of places)
+        """
+        colour_to_remove = BLACK if colour == WHITE else WHITE
+        captured = []
+        for row, col in ray:
+            if self.fanorona.pawns._colour_of_pawn(row, col) != colour_to_remove:
+                break
+            captured.append((row, col))
+        return captured
+
+    def empty_space_validator_list(self, list_of_poss):
+        """Returns new list with places from list_of_poss that are empty"""
+        is_place_empty = self.fanorona.pawns.is_place_empty
+        return [(row, col) for row, col in list_of_poss
+                if is_place_empty(row, col)[0]]
+
+    def last_move_validator_poss(self):
+        """
+        Returns new list with possibilities that don't go in the direction
+        of the last move of the selected pawn
+        """
+        last_move = self.fanorona.last_move
+        if last_move is None:
+            return list(self.fanorona.possibilities)
+        pawn = self.fanorona.selected_pawn
+        return [(row, col) for row, col in self.fanorona.possibilities
+                if self.get_last_move(pawn, row, col) != last_move]
+
+    def possibilities_of_pawn(self, pawn: "Pawn"):
+        return list(NEIGHBOURS.get((pawn.row, pawn.column), ()))
+
+    def _possible_captures(self, pawn: "Pawn", poss, approach):
+        """
+        Returns places from poss that would capture by APPROACH
+        (approach=True) or WITHDRAWAL (approach=False)
+        """
+        pawn_row = pawn.row
+        pawn_col = pawn.column
+        pawns = self.fanorona.pawns
+        poss_captures = []
+        for row, col in poss:
+            direction = direction_between(pawn_row, pawn_col, row, col)
+            if direction is None:
+                continue
+            if approach:
+                ray = RAYS[(row, col)][direction]
+            else:
+                ray = RAYS[(pawn_row, pawn_col)][OPPOSITE[direction]]
+            if ray:
+                if_empty, colour = pawns.is_place_empty(*ray[0])
+                if not if_empty and colour != pawn.colour:
+                    poss_captures.append((row, col))
+        return poss_captures
+
+    def possible_captures_approach(self, pawn: "Pawn", poss):
+        return self._possible_captures(pawn, poss, True)
+
+    def possible_captures_withdrowal(self, pawn: "Pawns", poss):
+        return self._possible_captures(pawn, poss, False)
+
+    def get_last_move(self, pawn: "Pawn", new_row, new_col):
+        return direction_between(pawn.row, pawn.column, new_row, new_col)
+
+    def check_for_winner(self):
+        """
+        If there is a winner, return its colour,
+        if there is not, return None
+        """
+        if ROWS == 3 and COLS == 3:
+            # three in a row (see bitboard.THREE_IN_A_ROW)
+            pawns = self.fanorona.pawns
+            return line_winner(pawns._white_mask, pawns._black_mask)
+        else:
+            pawns = self.fanorona.pawns
+            if pawns.blacks == 0:
+                return WHITE
+            elif pawns.whites == 0:
+                return BLACK
+            return None
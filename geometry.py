@@ -0,0 +1,90 @@
+from constants import ROWS, COLS
+from constants import is_even
+
+DIRECTIONS = {
+    'N': (-1, 0), 'S': (1, 0), 'E': (0, 1), 'W': (0, -1),
+    'NE': (-1, 1), 'NW': (-1, -1), 'SE': (1, 1), 'SW': (1, -1)
+}
+OPPOSITE = {
+    'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E',
+    'NE': 'SW', 'SW': 'NE', 'NW': 'SE', 'SE': 'NW'
+}
+# direction by signs of (row difference, column difference)
+DIRECTION_OF_VECTOR = {
+    vector: direction for direction, vector in DIRECTIONS.items()
+}
+
+
+def has_line(row, col, direction, rows=ROWS, cols=COLS):
+    """
+    Checks if there is a line going from (row, col) one step in the
+    direction; diagonal lines go only through places where row+col
+    is even (strong intersections)
+    """
+    d_row, d_col = DIRECTIONS[direction]
+    if not (1 <= row+d_row <= rows and 1 <= col+d_col <= cols):
+        return False
+    if d_row != 0 and d_col != 0:
+        return is_even(row+col)
+    return True
+
+
+def _order_of_directions(row, col, rows, cols):
+    """
+    Returns directions in the order in which neighbours of (row, col)
+    are listed, it depends on the side of the board the place is on
+    """
+    if row != 1 and row != rows and col != 1 and col != cols:
+        return ['N', 'S', 'W', 'E', 'NW', 'SE', 'NE', 'SW']
+    elif row == rows:
+        return ['N', 'NE', 'NW', 'E', 'W']
+    elif row == 1:
+        return ['S', 'SE', 'SW', 'E', 'W']
+    elif col == 1:
+        return ['E', 'NE', 'SE', 'N', 'S']
+    return ['W', 'NW', 'SW', 'N', 'S']
+
+
+def build_tables(rows, cols):
+    """
+    Returns (neighbours, rays) for the board with passed number
+    of rows and columns
+
+    neighbours - dict, neighbours[(row, col)] is a tuple of places
+    connected with (row, col) by a line e.g. ((1, 2), (2, 1))
+    rays - dict, rays[(row, col)][direction] is a tuple of places beyond
+    (row, col) in the direction, in order of the distance, up to the
+    edge of the board
+    """
+    neighbours = {}
+    rays = {}
+    for row in range(1, rows+1):
+        for col in range(1, cols+1):
+            neighbours[(row, col)] = tuple(
+                (row+DIRECTIONS[direction][0], col+DIRECTIONS[direction][1])
+                for direction in _order_of_directions(row, col, rows, cols)
+                if has_line(row, col, direction, rows, cols))
+
+            rays_of_place = {}
+            for direction, (d_row, d_col) in DIRECTIONS.items():
+                ray = []
+                n_row, n_col = row+d_row, col+d_col
+                while 1 <= n_row <= rows and 1 <= n_col <= cols:
+                    ray.append((n_row, n_col))
+                    n_row, n_col = n_row+d_row, n_col+d_col
+                rays_of_place[direction] = tuple(ray)
+            rays[(row, col)] = rays_of_place
+    return neighbours, rays
+
+
+NEIGHBOURS, RAYS = build_tables(ROWS, COLS)
+
+
+def direction_between(row, col, new_row, new_col):
+    """
+    Returns direction e.g. 'N', 'SW' of going from (row, col) towards
+    (new_row, new_col) or None if it's the same place
+    """
+    d_row = (new_row > row) - (new_row < row)
+    d_col = (new_col > col) - (new_col < col)
+    return DIRECTION_OF_VECTOR.get((d_row, d_col))
@@ -3,9 +3,15 @@ from board import Board
 from pawn import Pawn
 from pawns import Pawns
 from fanorona import Fanorona
-from constants import RED, FPS, ROWS, COLS, BLACK
+from constants import FPS, ROWS, COLS, BLACK
 from constants import SOUND_EFFECTS, MIN_WIDTH, MIN_HEIGHT
-from bot import FanoronaBot
+from constants import DIRTY_RECT_RENDERING, EVENT_DRIVEN_LOOP
+from constants import IDLE_WAIT_TIMEOUT, BOT_IN_BACKGROUND, BOT_DELAY
+from constants import RECORD_GAMES, GAME_RECORDS_PATH
+from bot import FanoronaBot, BotWorker
+from position import Position
+from records import GameRecordWriter, record_step
+from functools import partial
 from constants import MainArguemntRandomException
 from constants import MainArguemntCompException
 from user_interface import user_interface
@@ -24,22 +30,46 @@ win_sound = pygame.mixer.Sound("Audio/win-sound.wav")
 win_sound.set_volume(0.3)
 
 
-def determine_clicked_square(board: "Board", pawns: "Pawns"):
+def determine_clicked_square(board: "Board", pawns: "Pawns", mouse_pos=None):
     """
-    Returns either an instance of clicked Pawn or tuple - center of
-    clicked Rect (square box)
+    Returns either an instance of clicked Pawn or tuple - (row, col) of
+    clicked empty square box or None if no square box was clicked
 
-    Should be called after click event
+    Should be called after click event, by default the current position
+    of the mouse is used
     """
-    mouse_pos = pygame.mouse.get_pos()
-    for rectangles_row in board.rectangles_boxes:
-        for rectangle in rectangles_row:
-            if rectangle.collidepoint(mouse_pos):
-                for pawn in pawns.pawns:
-                    center_of_pawn = pawn._take_the_center_of_pawn(board)
-                    if rectangle.center == center_of_pawn:
-                        return pawn
-                return rectangle.center
+    if mouse_pos is None:
+        mouse_pos = pygame.mouse.get_pos()
+    clicked = board.row_col_from_position(mouse_pos)
+    if clicked is None:
+        return None
+    pawn = pawns.row_column_pawn(*clicked)
+    if pawn is not None:
+        return pawn
+    return clicked
+
+
+# posted by BotWorker when the turn of the bot is computed
+BOT_READY_EVENT = pygame.USEREVENT + 1
+# time to make the next step of the computed turn
+BOT_STEP_EVENT = pygame.USEREVENT + 2
+
+
+def schedule_bot_move(delay):
+    """Posts USEREVENT once after delay (ms), it makes the bot move"""
+    pygame.time.set_timer(pygame.USEREVENT, delay, 1)
+
+
+def wait_for_events(draw_needed):
+    """
+    Returns list of events for the event driven loop, sleeps until
+    some event comes (at most IDLE_WAIT_TIMEOUT ms) unless something
+    is waiting to be drawn
+    """
+    if draw_needed:
+        return pygame.event.get()
+    events = [pygame.event.wait(IDLE_WAIT_TIMEOUT)]
+    return events + pygame.event.get()
 
 
 def main_comp(comp=0, random=0):
@@ -54,10 +84,16 @@ def main_comp(comp=0, random=0):
 
     comp = 1 and random = 0 means playing vs computer that makes
     good moves depending on the number of possible captures
+
+    comp = 1 and random = 2 means playing vs computer that searches
+    a few turns ahead (alpha-beta search)
+
+    comp = 1 and random = 3 means playing vs computer that picks turns
+    with Monte Carlo Tree Search (random playouts)
     """
     if comp not in [0, 1]:
         raise MainArguemntCompException()
-    if random not in [0, 1]:
+    if random not in [0, 1, 2, 3]:
         raise MainArguemntRandomException()
 
     window = pygame.display.set_mode((1600, 900), pygame.RESIZABLE)
@@ -65,29 +101,42 @@ def main_comp(comp=0, random=0):
     clock = pygame.time.Clock()
     fanorona = Fanorona()
     play = True
+    draw_needed = True
+    worker = BotWorker(random, BOT_READY_EVENT)
+    # steps of the computed turn of the bot that are still to be made
+    bot_steps = []
+    writer = None
+    if RECORD_GAMES == 1:
+        writer = GameRecordWriter(GAME_RECORDS_PATH)
+        fanorona.on_step = partial(record_step, writer, fanorona)
+    if EVENT_DRIVEN_LOOP == 1:
+        # moving the mouse changes nothing, so it shouldn't wake the loop
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
 
     if SOUND_EFFECTS == 1:
         game_start_sound.play(0)  # 0 means play one time
 
     while play:
-        clock.tick(FPS)
-        window.fill(RED)
-
-        fanorona.printer.draw(window)
+        if EVENT_DRIVEN_LOOP == 1:
+            events = wait_for_events(draw_needed)
+            for event in events:
+                if event.type != pygame.NOEVENT:
+                    draw_needed = True
+        else:
+            clock.tick(FPS)
+            events = pygame.event.get()
+            draw_needed = True
 
-        if fanorona.logic.check_for_winner():
-            if SOUND_EFFECTS == 1:
-                win_sound.play(0)
-            fanorona.printer.draw_winner(window)
-
-        for event in pygame.event.get():
+        for event in events:
+            if event.type == pygame.WINDOWEXPOSED:
+                fanorona.printer.invalidate()
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_f:
                     if fanorona.round == 1:
                         if fanorona.selected_pawn is None:
                             fanorona.change_turn()
                             if comp == 1:
-                                pygame.time.set_timer(pygame.USEREVENT, 250)
+                                schedule_bot_move(250)
             if event.type == pygame.QUIT:
                 play = False
             if event.type == pygame.VIDEORESIZE:
@@ -100,14 +149,15 @@ def main_comp(comp=0, random=0):
                 window = pygame.display.set_mode(
                     (width, height), pygame.RESIZABLE)
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # left click
+                bot_moves = comp == 1 and fanorona.turn == BLACK
+                if event.button == 1 and not bot_moves:  # left click
                     board = fanorona.board
                     pawns = fanorona.pawns
-                    clicked_pawn_or_center_empty_space = (
-                        determine_clicked_square(board, pawns)
+                    clicked_pawn_or_empty_space = (
+                        determine_clicked_square(board, pawns, event.pos)
                         )
-                    if isinstance(clicked_pawn_or_center_empty_space, Pawn):
-                        clicked_pawn = clicked_pawn_or_center_empty_space
+                    if isinstance(clicked_pawn_or_empty_space, Pawn):
+                        clicked_pawn = clicked_pawn_or_empty_space
                         if ROWS == 3 and COLS == 3:
                             if fanorona.turn == clicked_pawn.colour:
                                 fanorona.pick_your_pawn(clicked_pawn)
@@ -121,14 +171,11 @@ def main_comp(comp=0, random=0):
                                 fanorona.turn_problematic_move(
                                     clicked_row, clicked_col, move_sound)
                                 if fanorona.turn == BLACK and comp == 1:
-                                    pygame.time.set_timer(
-                                        pygame.USEREVENT, 500)
-
-                    elif isinstance(clicked_pawn_or_center_empty_space, tuple):
-                        center_empty_space = clicked_pawn_or_center_empty_space
-                        x, y = board.row_col_from_center_of_square(
-                                center_empty_space)
-                        clicked_row, clicked_col = x, y
+                                    schedule_bot_move(500)
+
+                    elif isinstance(clicked_pawn_or_empty_space, tuple):
+                        clicked_empty_space = clicked_pawn_or_empty_space
+                        clicked_row, clicked_col = clicked_empty_space
                         if ROWS == 3 and COLS == 3:
                             if fanorona.selected_pawn is not None:
                                 possibilities = fanorona.possibilities
@@ -137,8 +184,7 @@ def main_comp(comp=0, random=0):
                                             clicked_row, clicked_col,
                                             move_sound)
                                 if comp == 1:
-                                    pygame.time.set_timer(
-                                        pygame.USEREVENT, 400)
+                                    schedule_bot_move(400)
                         else:
                             if fanorona.selected_pawn is not None:
                                 capt_mv_w = fanorona.capturing_moves_withdrawal
@@ -155,16 +201,14 @@ def main_comp(comp=0, random=0):
                                             clicked_row, clicked_col,
                                             move_sound)
                                         if fanorona.turn == BLACK and comp == 1:
-                                            pygame.time.set_timer(
-                                                pygame.USEREVENT, 400)
+                                            schedule_bot_move(400)
 
                                     if fanorona.capturing_moves_approach:
                                         fanorona.turn_approach(
                                             clicked_row, clicked_col,
                                             move_sound)
                                         if fanorona.turn == BLACK and comp == 1:
-                                            pygame.time.set_timer(
-                                                pygame.USEREVENT, 400)
+                                            schedule_bot_move(400)
 
                                     c1 = not fanorona.capturing_moves_withdrawal
                                     c2 = not fanorona.capturing_moves_approach
@@ -173,19 +217,76 @@ def main_comp(comp=0, random=0):
                                         fanorona.turn_paika(
                                             clicked_row, clicked_col, move_sound)
                                         if fanorona.turn == BLACK and comp == 1:
-                                            pygame.time.set_timer(
-                                                pygame.USEREVENT, 400)
+                                            schedule_bot_move(400)
             if event.type == pygame.USEREVENT:
                 if ROWS == 3 and COLS == 3:
-                    FanoronaBot.make_random_paika_move(
-                        window, fanorona, move_sound)
+                    if random == 1:
+                        FanoronaBot.make_random_paika_move(
+                            window, fanorona, move_sound)
+                    else:
+                        FanoronaBot.make_perfect_paika_move(
+                            window, fanorona, move_sound)
+                elif BOT_IN_BACKGROUND == 1:
+                    if fanorona.turn == BLACK and not bot_steps:
+                        worker.start(fanorona)
                 else:
                     fanorona.update_able_to_capture()
                     if random == 0:
                         FanoronaBot.make_good_move(window, fanorona, move_sound)
+                    elif random == 2:
+                        FanoronaBot.make_search_move(
+                            window, fanorona, move_sound)
+                    elif random == 3:
+                        FanoronaBot.make_mcts_move(
+                            window, fanorona, move_sound)
                     else:
                         FanoronaBot.make_random_move(window, fanorona, move_sound)
-        pygame.display.update()
+            if event.type == BOT_READY_EVENT:
+                computed = worker.result()
+                if computed is not None:
+                    snapshot, steps = computed
+                    now = Position.from_fanorona(fanorona).snapshot()
+                    # the game could have changed (e.g. reset) meanwhile
+                    if steps and snapshot == now:
+                        FanoronaBot.pick_pawn_of_step(fanorona, steps[0])
+                        bot_steps = list(steps)
+                        pygame.time.set_timer(BOT_STEP_EVENT, BOT_DELAY, 1)
+            if event.type == BOT_STEP_EVENT and bot_steps:
+                FanoronaBot.make_step(fanorona, bot_steps.pop(0), move_sound)
+                if bot_steps:
+                    pygame.time.set_timer(BOT_STEP_EVENT, BOT_DELAY, 1)
+                elif fanorona.turn == BLACK:
+                    # just in case the turn couldn't be finished as planned
+                    FanoronaBot.make_good_move(window, fanorona, move_sound)
+
+        if not draw_needed:
+            continue
+        draw_needed = False
+        if DIRTY_RECT_RENDERING == 1:
+            dirty_rects = fanorona.printer.draw_dirty(window)
+        else:
+            fanorona.printer.draw(window)
+
+        winner = fanorona.logic.check_for_winner()
+        if winner is not None:
+            if writer is not None and writer.in_game():
+                writer.end_game(winner)
+            if SOUND_EFFECTS == 1:
+                win_sound.play(0)
+            fanorona.printer.draw_winner(window)
+            # the game has been reset, so it has to be drawn again
+            draw_needed = True
+
+        if DIRTY_RECT_RENDERING == 1:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.update()
+    worker.shutdown()
+    if writer is not None:
+        # unfinished game is kept without the winner
+        if writer.in_game():
+            writer.end_game()
+        writer.close()
     pygame.quit()
 
 
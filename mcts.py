@@ -0,0 +1,149 @@
+from math import log, sqrt
+from random import Random
+from time import perf_counter
+from position import Position
+from search import generate_turns, make_turn, enemy_of
+from constants import MCTS_ITERATIONS, MCTS_TIME_BUDGET, MCTS_EXPLORATION
+from constants import MCTS_PLAYOUT_ROUNDS
+
+
+def playout(position: "Position", generator: "Random", max_rounds):
+    """
+    Plays random allowed steps on passed position (it is changed) until
+    the end of the game; returns colour of the winner or None if the game
+    wasn't finished before round max_rounds; side that can't move loses
+    """
+    while position.round_number <= max_rounds:
+        winner = position.winner()
+        if winner is not None:
+            return winner
+        steps = position.legal_steps()
+        if not steps:
+            return enemy_of(position.turn)
+        position.make_move(generator.choice(steps))
+    return None
+
+
+class _Node:
+    """
+    Node of the search tree, it is reached by the turn (steps) made by
+    the side with 'colour', 'wins' are counted from the point of view
+    of that side (a draw counts as half of the win)
+    """
+    __slots__ = ('steps', 'parent', 'colour', 'children', 'untried',
+                 'visits', 'wins')
+
+    def __init__(self, steps, parent, colour, untried):
+        self.steps = steps
+        self.parent = parent
+        self.colour = colour
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+    def best_child(self, exploration):
+        """Returns child with the highest UCT score"""
+        log_visits = log(self.visits)
+        return max(self.children, key=lambda child: (
+            child.wins / child.visits
+            + exploration * sqrt(log_visits / child.visits)))
+
+
+class MonteCarloSearch:
+    """
+    Class used for searching the best turn with Monte Carlo Tree Search
+    (UCT), every iteration adds one node to the tree of complete turns
+    and plays one random game (playout) from it on Position, so nothing
+    but the copy of the position is changed
+
+    ...
+    Attributes
+    ----------
+    iterations: int
+        maximal number of playouts for one turn
+    time_budget: float
+        number of seconds that one search can take
+    exploration: float
+        constant of UCT, bigger one makes the search try worse turns
+        more often
+    playout_rounds: int
+        playouts longer than that many rounds are counted as draws
+    playouts: int
+        number of playouts made during the last search
+    seconds: float
+        time taken by the last search
+
+    Methods
+    -------
+    best_turn(position)
+        returns steps of the most visited turn of the side to move
+        or None if there is no allowed turn
+    playouts_per_second()
+        returns speed of the last search
+    """
+    def __init__(self, iterations=MCTS_ITERATIONS,
+                 time_budget=MCTS_TIME_BUDGET, exploration=MCTS_EXPLORATION,
+                 playout_rounds=MCTS_PLAYOUT_ROUNDS, seed=None):
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.playout_rounds = playout_rounds
+        self.playouts = 0
+        self.seconds = 0.0
+        self._generator = Random(seed)
+
+    def best_turn(self, position: "Position"):
+        """
+        Returns steps of the most visited turn after iterations playouts
+        or after the time budget is used; passed position isn't changed
+        """
+        start = perf_counter()
+        deadline = start + self.time_budget
+        self.playouts = 0
+        snapshot = position.snapshot()
+        root = _Node(None, None, enemy_of(position.turn),
+                     [turn[0] for turn in generate_turns(position)])
+        if len(root.untried) < 2:
+            self.seconds = perf_counter() - start
+            return root.untried[0] if root.untried else None
+
+        while self.playouts < self.iterations:
+            self._iterate(root, Position.from_snapshot(snapshot))
+            self.playouts += 1
+            if perf_counter() > deadline:
+                break
+        self.seconds = perf_counter() - start
+        return max(root.children, key=lambda child: child.visits).steps
+
+    def _iterate(self, root, position):
+        """Selection, expansion, playout and backpropagation"""
+        generator = self._generator
+        node = root
+        while not node.untried and node.children:
+            node = node.best_child(self.exploration)
+            make_turn(position, node.steps)
+
+        if node.untried:
+            steps = node.untried.pop(generator.randrange(len(node.untried)))
+            colour = position.turn
+            make_turn(position, steps)
+            untried = []
+            if position.winner() is None:
+                untried = [turn[0] for turn in generate_turns(position)]
+            child = _Node(steps, node, colour, untried)
+            node.children.append(child)
+            node = child
+
+        winner = playout(
+            position, generator, position.round_number + self.playout_rounds)
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.colour:
+                node.wins += 1
+            node = node.parent
+
+    def playouts_per_second(self):
+        return self.playouts / self.seconds if self.seconds else 0.0
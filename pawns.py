@@ -1,6 +1,6 @@
 from pawn import Pawn
+from bitboard import FULL_MASK, index_of
 from constants import ROWS, COLS, WHITE, BLACK
-from constants import WHITE2, BLACK2
 
 
 class Pawns:
@@ -18,15 +18,35 @@ class Pawns:
         a number of white pawns
     blacks: int
         a number of black pawns
+    _grid: list
+        two-dim list (ROWS x COLS) - occupancy index, holds an instance
+        of Pawn placed at each place or None if the place is empty;
+        it makes every probe of the place O(1) instead of scanning 'pawns'
+    _white_mask: int
+    _black_mask: int
+        masks of places taken by white/black pawns (see bitboard.py),
+        kept up-to-date together with the occupancy index
+    _changed: int
+        mask of places where pawns have appeared or disappeared since
+        the last call of _take_changes()
 
     Methods
     -------
-    draw(window, board)
-        draws each Pawn in 'pawns' attribute
     _starting_positions()
         adds to 'pawns' attribute instances of class Pawn that are
         placed on the right place according to the size of the board;
-        also keeps attributes 'blacks', 'whites' up-to-date
+        also keeps attributes 'blacks', 'whites' up-to-date and rebuilds
+        the occupancy index
+    _build_index()
+        fills the occupancy index '_grid' with pawns from 'pawns'
+    _update_index(pawn, old_row, old_col)
+        moves passed Pawn from (old_row, old_col) to its current place
+        in the occupancy index, it is called by Pawn.move()
+    _index_pawn(row, col)
+        returns an instance of Pawn from the occupancy index or None
+        if the place is empty or outside the board
+    _take_changes()
+        returns mask of places changed since the last call and forgets it
     clear_highlights()
         sets attribute 'if_selected' of each pawn in 'pawns' to False
     clear_if_capture()
@@ -46,8 +66,6 @@ class Pawns:
     _colour_of_pawn(row, col)
         takes a number of rows and columns and returns colour of Pawn
         that is placed there or no if the place is empty
-    _change_colours_to_default()
-        changes colour of every Pawn in 'pawns' to default (BLACK/WHITE)
     highlight_pawn(pawn)
         calls clear_highlights() method of this class (clears highlight of each
         Pawn in 'pawns') and sets attribute 'if_selected' of passed Pawn
@@ -60,19 +78,16 @@ class Pawns:
         self.pawns = pawns if pawns else []
         self.whites = 0
         self.blacks = 0
+        self._grid = [[None] * COLS for _ in range(ROWS)]
+        self._white_mask = 0
+        self._black_mask = 0
+        self._changed = FULL_MASK
         # when self.pawns is empty, new pawns are created
         # and placed at starting positions
         if not self.pawns:
             self._starting_positions()
-
-    def draw(self, window, board):
-        """
-        Draws each Pawn that is in the 'pawns'
-
-        'pawns' - attribute that store instances of Pawn in a list
-        """
-        for pawn in self.pawns:
-            pawn.draw(window, board)
+        else:
+            self._build_index()
 
     def _starting_positions(self):
         """
@@ -132,6 +147,70 @@ class Pawns:
                 self.blacks += 1
                 list_of_pawns.append(pawn2)
         self.pawns = list_of_pawns
+        self._build_index()
+
+    def _build_index(self):
+        """
+        Fills the occupancy index '_grid' with pawns from 'pawns'
+        and binds every Pawn to this instance, so Pawn.move() keeps
+        the index up-to-date
+        """
+        self._grid = [[None] * COLS for _ in range(ROWS)]
+        self._white_mask = 0
+        self._black_mask = 0
+        self._changed = FULL_MASK
+        for pawn in self.pawns:
+            pawn._pawns = self
+            if 1 <= pawn.row <= ROWS and 1 <= pawn.column <= COLS:
+                self._grid[pawn.row-1][pawn.column-1] = pawn
+                self._update_masks(pawn, pawn.row, pawn.column, True)
+
+    def _update_index(self, pawn, old_row, old_col):
+        """
+        Moves passed Pawn in the occupancy index from (old_row, old_col)
+        to the place where it is now
+        """
+        if 1 <= old_row <= ROWS and 1 <= old_col <= COLS:
+            if self._grid[old_row-1][old_col-1] is pawn:
+                self._grid[old_row-1][old_col-1] = None
+                self._update_masks(pawn, old_row, old_col, False)
+        if 1 <= pawn.row <= ROWS and 1 <= pawn.column <= COLS:
+            self._grid[pawn.row-1][pawn.column-1] = pawn
+            self._update_masks(pawn, pawn.row, pawn.column, True)
+
+    def _update_masks(self, pawn, row, col, taken):
+        """
+        Sets (taken=True) or clears the bit of place (row, col) in the mask
+        of the side of passed Pawn and marks the place as changed
+        """
+        bit = 1 << index_of(row, col)
+        self._changed |= bit
+        if pawn.colour == WHITE:
+            if taken:
+                self._white_mask |= bit
+            else:
+                self._white_mask &= ~bit
+        elif pawn.colour == BLACK:
+            if taken:
+                self._black_mask |= bit
+            else:
+                self._black_mask &= ~bit
+
+    def _take_changes(self):
+        """Returns mask of places changed since the last call"""
+        changed = self._changed
+        self._changed = 0
+        return changed
+
+    def _index_pawn(self, row, col):
+        """
+        Returns an instance of Pawn placed at (row, col) according to
+        the occupancy index or None if the place is empty or outside
+        the board
+        """
+        if 1 <= row <= ROWS and 1 <= col <= COLS:
+            return self._grid[row-1][col-1]
+        return None
 
     def clear_highlights(self):
         """
@@ -159,9 +238,9 @@ class Pawns:
 
         If a place is certainly wrong (negativ values) returns None
         """
-        for pawn in self.pawns:
-            if pawn.row == row and pawn.column == col:
-                return False, pawn.colour
+        pawn = self._index_pawn(row, col)
+        if pawn is not None:
+            return False, pawn.colour
         if row >= 1 and col >= 1:
             return True, None
         return None
@@ -171,40 +250,30 @@ class Pawns:
         Takes a number of rows and columns and removes the pawn
         that is placed there
         """
-        for pawn in self.pawns:
-            if pawn.row == row and pawn.column == col:
-                self.pawns.remove(pawn)
+        pawn = self._index_pawn(row, col)
+        if pawn is not None:
+            self._grid[row-1][col-1] = None
+            self._update_masks(pawn, row, col, False)
+            pawn._pawns = None
+            self.pawns.remove(pawn)
 
     def row_column_pawn(self, row, col):
         """
         Takes a number of rows and columns and returns an instance of
         Pawn that is placed there; if this place is empty, returns None
         """
-        for pawn in self.pawns:
-            if pawn.row == row and pawn.column == col:
-                return pawn
-        return None
+        return self._index_pawn(row, col)
 
     def _colour_of_pawn(self, row, col):
         """
         Returns colour of the pawn at the place with row, col
         (row - a number of rows, col - a number of columns) or None
         """
-        for pawn in self.pawns:
-            if pawn.row == row and pawn.column == col:
-                return pawn.colour
+        pawn = self._index_pawn(row, col)
+        if pawn is not None:
+            return pawn.colour
         return None
 
-    def _change_colours_to_default(self):
-        """
-        Changes colour of pawns to default (BLACK/WHITE)
-        """
-        for pawn in self.pawns:
-            if pawn.colour == WHITE2:
-                pawn.colour = WHITE
-            elif pawn.colour == BLACK2:
-                pawn.colour = BLACK
-
     def highlight_pawn(self, pawn):
         """
         Changes attribute 'if_selected' of clicked Pawn
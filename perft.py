@@ -0,0 +1,214 @@
+import argparse
+from copy import deepcopy
+from random import Random
+from time import perf_counter
+from bitboard import index_of
+from engine import Fanorona
+from position import Position
+from search import generate_turns, make_turn, unmake_turn
+from selfplay import random_player
+
+# perft counts leaves of the tree of complete turns (the whole capture
+# chain is one move); the same counts from the old rules (engine.Fanorona)
+# and the new ones (Position) mean that both generate the same turns
+
+# a number of random turns played before every seeded position
+MAX_OPENING_TURNS = 30
+
+
+def perft(position: "Position", depth):
+    """Returns a number of leaves of the tree of turns with passed depth"""
+    if depth == 0:
+        return 1
+    if position.winner() is not None:
+        return 0
+    turns = generate_turns(position)
+    if depth == 1:
+        return len(turns)
+    nodes = 0
+    for steps, _, _ in turns:
+        deltas = make_turn(position, steps)
+        nodes += perft(position, depth-1)
+        unmake_turn(position, deltas)
+    return nodes
+
+
+def divide(position: "Position", depth):
+    """Returns dict, number of leaves under every turn (steps) of the root"""
+    counts = {}
+    for steps, _, _ in generate_turns(position):
+        deltas = make_turn(position, steps)
+        counts[steps] = perft(position, depth-1)
+        unmake_turn(position, deltas)
+    return counts
+
+
+def engine_turns(fanorona: "Fanorona"):
+    """
+    Returns list of (steps, game after the turn) of every turn of the side
+    to move made with turn methods of engine.Fanorona, steps are written
+    the same way as by generate_turns(); passed game isn't changed
+    """
+    turns = []
+    fanorona.update_able_to_capture()
+    if fanorona.able_to_capture:
+        places = [(pawn.row, pawn.column)
+                  for pawn in fanorona.able_to_capture]
+    else:
+        places = [(pawn.row, pawn.column) for pawn in fanorona.pawns.pawns
+                  if pawn.colour == fanorona.turn]
+    fanorona.clear_able_to_capture()
+    for row, col in places:
+        game = deepcopy(fanorona)
+        game.pick_your_pawn(game.pawns.row_column_pawn(row, col))
+        _extend_engine_turn(game, (), turns)
+    return turns
+
+
+def _extend_engine_turn(fanorona, steps, turns):
+    """Appends to turns every way of finishing the turn of selected pawn"""
+    colour = fanorona.turn
+    pawn = fanorona.selected_pawn
+    from_index = index_of(pawn.row, pawn.column)
+    moves = [('APPROACH', move) for move in fanorona.capturing_moves_approach]
+    moves += [
+        ('WITHDRAWAL', move) for move in fanorona.capturing_moves_withdrawal]
+    if not moves and not steps:
+        moves = [('PAIKA', move) for move in fanorona.possibilities]
+    for kind, (row, col) in moves:
+        game = deepcopy(fanorona)
+        if kind == 'APPROACH':
+            game.turn_approach(row, col)
+        elif kind == 'WITHDRAWAL':
+            game.turn_withdrawal(row, col)
+        else:
+            game.turn_paika(row, col)
+        new_steps = steps + ((from_index, index_of(row, col), kind),)
+        if game.turn == colour:
+            _extend_engine_turn(game, new_steps, turns)
+        else:
+            turns.append((new_steps, game))
+
+
+def seeded_positions(count, seed):
+    """
+    Returns list of Position reached by random turns from the start of
+    the game, the same seed gives the same positions; positions where
+    the game is over are skipped
+    """
+    generator = Random(seed)
+    positions = []
+    while len(positions) < count:
+        position = Position.from_fanorona(Fanorona())
+        for _ in range(generator.randint(0, MAX_OPENING_TURNS)):
+            random_player(position, generator)
+            if position.winner() is not None:
+                break
+        if position.winner() is None and position.legal_steps():
+            positions.append(position)
+    return positions
+
+
+def random_engine_turn(fanorona: "Fanorona", generator: "Random"):
+    """
+    Plays random allowed turn on engine.Fanorona the same way
+    as FanoronaBot.make_random_move but without drawing; returns False
+    if the side to move can't move
+    """
+    colour = fanorona.turn
+    fanorona.update_able_to_capture()
+    if fanorona.able_to_capture:
+        fanorona.pick_your_pawn(generator.choice(fanorona.able_to_capture))
+        while fanorona.turn == colour:
+            moves = [
+                (fanorona.turn_approach, move)
+                for move in fanorona.capturing_moves_approach]
+            moves += [
+                (fanorona.turn_withdrawal, move)
+                for move in fanorona.capturing_moves_withdrawal]
+            turn, (row, col) = generator.choice(moves)
+            turn(row, col)
+        return True
+    own_pawns = [
+        pawn for pawn in fanorona.pawns.pawns if pawn.colour == colour]
+    generator.shuffle(own_pawns)
+    for pawn in own_pawns:
+        fanorona.pick_your_pawn(pawn)
+        if fanorona.possibilities:
+            row, col = generator.choice(fanorona.possibilities)
+            fanorona.turn_paika(row, col)
+            return True
+    return False
+
+
+def engine_perft(fanorona: "Fanorona", depth):
+    """The same as perft() but counted with engine.Fanorona"""
+    if depth == 0:
+        return 1
+    if fanorona.logic.check_for_winner() is not None:
+        return 0
+    turns = engine_turns(fanorona)
+    if depth == 1:
+        return len(turns)
+    return sum(engine_perft(game, depth-1) for _, game in turns)
+
+
+def engine_divide(fanorona: "Fanorona", depth):
+    """The same as divide() but counted with engine.Fanorona"""
+    return {
+        steps: engine_perft(game, depth-1)
+        for steps, game in engine_turns(fanorona)}
+
+
+def compare(counts, engine_counts):
+    """
+    Returns sorted list of (steps, count, engine count) of root turns
+    whose counts differ, count is None if the turn is missing
+    """
+    differences = []
+    for steps in sorted(set(counts) | set(engine_counts)):
+        count = counts.get(steps)
+        engine_count = engine_counts.get(steps)
+        if count != engine_count:
+            differences.append((steps, count, engine_count))
+    return differences
+
+
+def _timed(function, *arguments):
+    start = perf_counter()
+    result = function(*arguments)
+    return result, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Counts leaves of the tree of turns from the start")
+    parser.add_argument("depth", type=int, help="depth in full turns")
+    parser.add_argument(
+        "--no-engine", action="store_true",
+        help="don't count with engine.Fanorona (it is much slower)")
+    arguments = parser.parse_args()
+
+    position = Position.from_fanorona(Fanorona())
+    counts, seconds = _timed(divide, position, arguments.depth)
+    nodes = sum(counts.values())
+    for steps, count in sorted(counts.items()):
+        print(f"{steps}: {count}")
+    print(f"Position: {nodes} nodes, {nodes/max(seconds, 1e-9):,.0f} nodes/s")
+    if arguments.no_engine:
+        return None
+
+    engine_counts, seconds = _timed(engine_divide, Fanorona(), arguments.depth)
+    engine_nodes = sum(engine_counts.values())
+    print(f"engine.Fanorona: {engine_nodes} nodes, "
+          f"{engine_nodes/max(seconds, 1e-9):,.0f} nodes/s")
+    differences = compare(counts, engine_counts)
+    for steps, count, engine_count in differences:
+        print(f"Difference {steps}: Position {count}, "
+              f"engine.Fanorona {engine_count}")
+    if not differences:
+        print("Counts are the same")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+from collections import namedtuple
+from bitboard import Bitboard, bits, index_of, point_of, direction_of
+from engine import Fanorona
+from pawn import Pawn
+from pawns import Pawns
+from constants import WHITE, BLACK
+
+# immutable and hashable copy of the whole position
+Snapshot = namedtuple('Snapshot', [
+    'white_mask', 'black_mask', 'turn', 'round_number',
+    'chain_index', 'last_direction', 'visited'])
+
+# what make_move() changed, it is enough to undo the step
+Delta = namedtuple('Delta', [
+    'from_index', 'to_index', 'captured', 'turn', 'round_number',
+    'chain_index', 'last_direction', 'visited'])
+
+# complete turn: index of the pawn that makes it, steps for make_move()
+# and a number of captured enemy's pawns
+Turn = namedtuple('Turn', ['start', 'steps', 'captured'])
+
+
+class Position(Bitboard):
+    """
+    Class used for representing the position of Fanorona game during
+    search and analysis; it is Bitboard with the side to move, the number
+    of round and the state of the capture chain, steps are made and undone
+    in place, so exploring positions doesn't need copying anything
+
+    ...
+    Attributes
+    ----------
+    turn: Colour
+        colour of the side to move, WHITE or BLACK (constants.Colour)
+    round_number: int
+        a number of round, in rounds 1 and 2 only one capture is allowed
+    chain_index: int or None
+        index of the pawn that continues capturing or None at the start
+        of the turn
+    last_direction: str or None
+        direction of the last capture in the chain e.g. 'N'
+    visited: int
+        mask of places the pawn was on during the chain
+
+    Methods
+    -------
+    from_fanorona(fanorona: "Fanorona")
+        class method, returns Position of passed game
+    from_snapshot(snapshot: "Snapshot")
+        class method, returns Position from Snapshot
+    to_fanorona()
+        returns engine.Fanorona with the same pawns, turn and round
+    snapshot()
+        returns immutable, hashable Snapshot of the position
+    legal_steps()
+        returns list of allowed steps (from_index, to_index, kind), kind is
+        'APPROACH', 'WITHDRAWAL' or 'PAIKA'
+    turns()
+        generator of every complete allowed turn (Turn) of the side to move
+    make_move(step)
+        makes the step, continues the chain or ends the turn, returns Delta
+    unmake_move(delta)
+        undoes the step described by Delta returned by make_move()
+    winner()
+        returns colour of the side that won or None
+    """
+    def __init__(self, white_mask=0, black_mask=0, turn=WHITE,
+                 round_number=1, chain_index=None, last_direction=None,
+                 visited=0):
+        super().__init__(white_mask, black_mask)
+        self.turn = turn
+        self.round_number = round_number
+        self.chain_index = chain_index
+        self.last_direction = last_direction
+        self.visited = visited
+
+    @classmethod
+    def from_fanorona(cls, fanorona):
+        """Creates Position of passed game (engine.Fanorona)"""
+        bitboard = Bitboard.from_pawns(fanorona.pawns)
+        position = cls(
+            bitboard.white_mask, bitboard.black_mask, fanorona.turn,
+            fanorona.round)
+        if fanorona.change is False and fanorona.selected_pawn is not None:
+            pawn = fanorona.selected_pawn
+            position.chain_index = index_of(pawn.row, pawn.column)
+            position.last_direction = fanorona.last_move
+            for row, col in fanorona.where_was_pawn:
+                position.visited |= 1 << index_of(row, col)
+        return position
+
+    @classmethod
+    def from_snapshot(cls, snapshot: "Snapshot"):
+        return cls(*snapshot)
+
+    def to_fanorona(self):
+        """
+        Creates engine.Fanorona with pawns of the position, the side to
+        move and the number of round; the state of the chain isn't
+        copied, so it should be called at the start of the turn
+        """
+        pawns = [Pawn(*point_of(index), BLACK)
+                 for index in bits(self.black_mask)]
+        pawns += [Pawn(*point_of(index), WHITE)
+                  for index in bits(self.white_mask)]
+        fanorona = Fanorona()
+        fanorona.pawns = Pawns(pawns)
+        fanorona.pawns.blacks = self.black_mask.bit_count()
+        fanorona.pawns.whites = self.white_mask.bit_count()
+        fanorona.turn = self.turn
+        fanorona.round = self.round_number
+        return fanorona
+
+    def snapshot(self):
+        return Snapshot(
+            self.white_mask, self.black_mask, self.turn, self.round_number,
+            self.chain_index, self.last_direction, self.visited)
+
+    def legal_steps(self):
+        """
+        Returns allowed steps: continuation of the chain, captures if any
+        capture is possible or paika moves
+        """
+        colour = self.turn
+        if self.chain_index is not None:
+            return [
+                (self.chain_index, to_index, kind)
+                for to_index, kind, _, _ in self.capture_steps(
+                    self.chain_index, colour, self.last_direction,
+                    self.visited)]
+        starts = self.capturing_mask(colour)
+        if starts:
+            return [
+                (index, to_index, kind)
+                for index in bits(starts)
+                for to_index, kind, _, _ in self.capture_steps(index, colour)]
+        return [(from_index, to_index, 'PAIKA')
+                for from_index, to_index in self.paika_moves(colour)]
+
+    def turns(self):
+        """
+        Yields every complete allowed turn of the side to move as Turn,
+        capture chains are continued as long as they must be (just as
+        in generate_turns() of search.py); turns are searched lazily on
+        a copy, so the position isn't changed even between yielded turns
+        """
+        position = Position.from_snapshot(self.snapshot())
+        enemy = position.masks(position.turn)[1].bit_count()
+        yield from position._extend_turns((), enemy)
+
+    def _extend_turns(self, steps, enemy):
+        """Yields every way of finishing the turn after steps"""
+        colour = self.turn
+        for step in self.legal_steps():
+            delta = self.make_move(step)
+            new_steps = steps + (step,)
+            if self.chain_index is None:
+                captured = enemy - self.masks(colour)[1].bit_count()
+                yield Turn(new_steps[0][0], new_steps, captured)
+            else:
+                yield from self._extend_turns(new_steps, enemy)
+            self.unmake_move(delta)
+
+    def make_move(self, step):
+        """
+        Makes the step (from_index, to_index, kind) of the side to move,
+        the turn ends unless the pawn can (and must) continue capturing;
+        returns Delta needed by unmake_move()
+        """
+        from_index, to_index, kind = step
+        colour = self.turn
+        if kind == 'APPROACH':
+            captured = self.captured_by_approach(from_index, to_index, colour)
+        elif kind == 'WITHDRAWAL':
+            captured = self.captured_by_withdrawal(
+                from_index, to_index, colour)
+        else:
+            captured = 0
+        delta = Delta(
+            from_index, to_index, captured, colour, self.round_number,
+            self.chain_index, self.last_direction, self.visited)
+        self.make_step(from_index, to_index, captured, colour)
+
+        if captured and self.round_number not in [1, 2]:
+            direction = direction_of(from_index, to_index)
+            visited = self.visited or (1 << from_index)
+            visited |= 1 << to_index
+            if self.capture_steps(to_index, colour, direction, visited):
+                self.chain_index = to_index
+                self.last_direction = direction
+                self.visited = visited
+                return delta
+
+        self.turn = BLACK if colour == WHITE else WHITE
+        self.round_number += 1
+        self.chain_index = None
+        self.last_direction = None
+        self.visited = 0
+        return delta
+
+    def unmake_move(self, delta: "Delta"):
+        """Undoes the step described by passed Delta"""
+        moved = (1 << delta.from_index) | (1 << delta.to_index)
+        if delta.turn == WHITE:
+            self.white_mask ^= moved
+            self.black_mask |= delta.captured
+        else:
+            self.black_mask ^= moved
+            self.white_mask |= delta.captured
+        self.turn = delta.turn
+        self.round_number = delta.round_number
+        self.chain_index = delta.chain_index
+        self.last_direction = delta.last_direction
+        self.visited = delta.visited
+
+    def winner(self):
+        """Returns colour of the side that captured all enemy's pawns"""
+        if not self.black_mask:
+            return WHITE
+        if not self.white_mask:
+            return BLACK
+        return None
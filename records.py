@@ -0,0 +1,194 @@
+import struct
+from collections import namedtuple
+from position import Position
+from constants import ROWS, COLS, WHITE, BLACK
+from constants import GameRecordFileError
+
+# File of game records starts with MAGIC and then games follow one
+# after another, every game is:
+#   header - rows, cols, side that starts, winner (NO_WINNER if there
+#            is none) and number of steps
+#   start layout - white mask and black mask, (rows*cols + 7) // 8 bytes
+#            each, places are indexed as in bitboard.py
+#   steps - bit-packed (from_index, to_index, kind), the first step takes
+#            the lowest bits; indexes take as many bits as the biggest
+#            index of the board needs and kind takes 2 bits
+# Turns aren't marked, the chain goes on as long as the rules say,
+# so they are found again by replaying steps (see positions())
+MAGIC = b'FGR1'
+HEADER = struct.Struct('<BBBBI')
+KINDS = ('PAIKA', 'APPROACH', 'WITHDRAWAL')
+KIND_BITS = 2
+NO_WINNER = 2
+
+GameRecord = namedtuple('GameRecord', [
+    'rows', 'cols', 'turn', 'winner', 'white_mask', 'black_mask', 'steps'])
+
+
+def _mask_size(rows, cols):
+    return (rows*cols + 7) // 8
+
+
+def _index_bits(rows, cols):
+    return max(rows*cols - 1, 1).bit_length()
+
+
+def pack_steps(steps, rows=ROWS, cols=COLS):
+    """Returns bytes with bit-packed steps (from_index, to_index, kind)"""
+    index_bits = _index_bits(rows, cols)
+    step_bits = 2*index_bits + KIND_BITS
+    packed = 0
+    for number, (from_index, to_index, kind) in enumerate(steps):
+        code = (from_index | to_index << index_bits
+                | KINDS.index(kind) << 2*index_bits)
+        packed |= code << number*step_bits
+    return packed.to_bytes((len(steps)*step_bits + 7) // 8, 'little')
+
+
+def unpack_steps(data, count, rows=ROWS, cols=COLS):
+    """Returns tuple of count steps packed by pack_steps()"""
+    index_bits = _index_bits(rows, cols)
+    step_bits = 2*index_bits + KIND_BITS
+    index_mask = (1 << index_bits) - 1
+    packed = int.from_bytes(data, 'little')
+    steps = []
+    for _ in range(count):
+        steps.append((
+            packed & index_mask, packed >> index_bits & index_mask,
+            KINDS[packed >> 2*index_bits & (1 << KIND_BITS) - 1]))
+        packed >>= step_bits
+    return tuple(steps)
+
+
+class GameRecordWriter:
+    """
+    Class used for appending games to the file of game records, steps
+    of the game are kept until end_game() writes the whole game, so
+    every game in the file is complete
+
+    ...
+    Attributes
+    ----------
+    path: str
+        path of the file, games are appended to it
+    games: int
+        number of games written by this writer
+
+    Methods
+    -------
+    start_game(white_mask, black_mask, turn, rows=ROWS, cols=COLS)
+        starts the new game from passed layout, turn is the side
+        that starts
+    in_game()
+        returns True if the game is started and not written yet
+    add_step(step)
+        adds step (from_index, to_index, kind) to the game
+    end_game(winner=None)
+        writes the game and its winner to the file
+    write_game(record: "GameRecord")
+        writes the whole game at once
+    close()
+        closes the file, the started game isn't written
+    """
+    def __init__(self, path):
+        self.path = path
+        self.games = 0
+        self._file = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._game = None
+        self._steps = []
+
+    def start_game(self, white_mask, black_mask, turn, rows=ROWS, cols=COLS):
+        self._game = (rows, cols, turn, white_mask, black_mask)
+        self._steps = []
+
+    def in_game(self):
+        return self._game is not None
+
+    def add_step(self, step):
+        self._steps.append(step)
+
+    def end_game(self, winner=None):
+        rows, cols, turn, white_mask, black_mask = self._game
+        self.write_game(GameRecord(
+            rows, cols, turn, winner, white_mask, black_mask, self._steps))
+        self._game = None
+        self._steps = []
+
+    def write_game(self, record: "GameRecord"):
+        size = _mask_size(record.rows, record.cols)
+        winner = NO_WINNER if record.winner is None else int(record.winner)
+        self._file.write(HEADER.pack(
+            record.rows, record.cols, int(record.turn), winner,
+            len(record.steps)))
+        self._file.write(record.white_mask.to_bytes(size, 'little'))
+        self._file.write(record.black_mask.to_bytes(size, 'little'))
+        self._file.write(pack_steps(record.steps, record.rows, record.cols))
+        self._file.flush()
+        self.games += 1
+
+    def close(self):
+        self._file.close()
+
+
+def _read_exactly(file, size, path):
+    data = file.read(size)
+    if len(data) != size:
+        raise GameRecordFileError(path)
+    return data
+
+
+def read_games(path):
+    """
+    Yields GameRecord of every game from the file one by one, only one
+    game is in memory at the time
+    """
+    colours = (WHITE, BLACK)
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise GameRecordFileError(path)
+        while True:
+            header = file.read(HEADER.size)
+            if not header:
+                return
+            if len(header) != HEADER.size:
+                raise GameRecordFileError(path)
+            rows, cols, turn, winner, count = HEADER.unpack(header)
+            size = _mask_size(rows, cols)
+            white_mask = int.from_bytes(
+                _read_exactly(file, size, path), 'little')
+            black_mask = int.from_bytes(
+                _read_exactly(file, size, path), 'little')
+            step_bits = 2*_index_bits(rows, cols) + KIND_BITS
+            data = _read_exactly(file, (count*step_bits + 7) // 8, path)
+            yield GameRecord(
+                rows, cols, colours[turn],
+                None if winner == NO_WINNER else colours[winner],
+                white_mask, black_mask, unpack_steps(data, count, rows, cols))
+
+
+def positions(record: "GameRecord"):
+    """
+    Yields Snapshot of the position before every step of the game and
+    after the last one, the game has to be played on the board of
+    the current size
+    """
+    position = Position(record.white_mask, record.black_mask, record.turn)
+    yield position.snapshot()
+    for step in record.steps:
+        position.make_move(step)
+        yield position.snapshot()
+
+
+def record_step(writer: "GameRecordWriter", fanorona, step):
+    """
+    Adds step of engine.Fanorona to the game of the writer, the game
+    is started from the layout before the first step; it is meant
+    to be engine.Fanorona.on_step
+    """
+    if not writer.in_game():
+        pawns = fanorona.pawns
+        writer.start_game(
+            pawns._white_mask, pawns._black_mask, fanorona.turn)
+    writer.add_step(step)
@@ -0,0 +1,288 @@
+import pygame
+from pygame import font
+from board import Board
+from constants import WHITE, BLACK
+from constants import WHITE_RGB, BLACK_RGB, WHITE2_RGB, BLACK2_RGB
+from constants import GREEN, RED2, ORANGE, PINK, YELLOW
+from constants import ROWS, COLS, IF_DRAW_NUM_OF_ROUND
+
+# Rendering layer of Fanorona game, everything that needs pygame
+# to draw pawns and the game is here, so engine can be used without it
+font.init()
+FONT = font.SysFont('calibri', 40, True)
+FONT_SMALL = font.SysFont('calibri', 20, True)
+# RGB colours of pawns (and players) with colour from constants.Colour
+RGB_OF_COLOUR = {WHITE: WHITE_RGB, BLACK: BLACK_RGB}
+# RGB colours of pawns that can be picked to be captured
+RGB_TO_CHOOSE = {WHITE: WHITE2_RGB, BLACK: BLACK2_RGB}
+
+
+def draw_pawn(window, pawn, board: "Board", row=None, col=None,
+              to_choose=False):
+    """
+    Draws the Pawn on the board and draws highlighting
+    if the Pawn 'if_selected' attribute is True
+
+    Can also take row, col where it should be drawn, by
+    default it's current row, col of the Pawn; if to_choose is True
+    the Pawn is drawn as the one that can be picked to be captured
+    """
+    square_size = board._square_size
+    circle_radius = int(0.8*square_size/2)
+    circle_radius_HIGHLIGHT = int(0.9*square_size/2)
+    if row is None and col is None:
+        row = pawn.row
+        col = pawn.column
+    center = pawn._take_the_center_of_pawn(board, row, col)
+    if pawn.if_capture:
+        if ROWS != 3 or COLS != 3:
+            pygame.draw.circle(window, PINK, center, circle_radius_HIGHLIGHT)
+    if pawn.if_selected:
+        pygame.draw.circle(window, ORANGE, center, circle_radius_HIGHLIGHT)
+    rgb_of_colour = RGB_TO_CHOOSE if to_choose else RGB_OF_COLOUR
+    pygame.draw.circle(
+        window, rgb_of_colour[pawn.colour], center, circle_radius)
+
+
+def draw_pawns(window, pawns, board: "Board", to_choose=()):
+    """
+    Draws each Pawn that is in the 'pawns' attribute of passed Pawns,
+    pawns on places (row, col) from to_choose are drawn as the ones
+    that can be picked to be captured
+    """
+    for pawn in pawns.pawns:
+        draw_pawn(window, pawn, board,
+                  to_choose=(pawn.row, pawn.column) in to_choose)
+
+
+class FanoronaPrinter:
+    """
+    Class used for taking care of all the drawings of Fanorona game
+
+    ....
+    Attributes
+    ----------
+    fanorona:
+        an instance of class Fanorona
+    _last_frame: tuple or None
+        what was drawn by the last call of draw_dirty() - size of the
+        window, state of the header and state of every place; None means
+        that the whole window has to be drawn again
+
+    Methods:
+    --------
+    draw(window)
+        takes as argument window (pygame.display)
+        draws everything that should be on the screen
+        draws board, draws, pawns, indicators, texts
+
+        this method should be called in while game loop
+    draw_dirty(window)
+        draws only parts of the window that changed since the last call
+        and returns list of their Rect for pygame.display.update(),
+        when nothing has changed nothing is drawn
+    invalidate()
+        makes the next draw_dirty() draw the whole window
+    update_highlights()
+        updates pawns able to capture that are highlighted
+    hints()
+        returns dict, colour of the hint at every place that has one
+    places_to_choose()
+        returns set of places of pawns that can be picked to be captured
+    draw_round_indicator(window)
+        draws small circle that informs whose turn is it
+        and also shows a number of the round in the upper
+        left corner
+    draw_hints(window)
+        draws hints about where selected_pawn can be moved
+        into
+        it shows the player possible captures/paika_moves
+    draw_winner(window)
+        draws information about who won on the screen
+        should be called in case of winning
+    draw_clue_about_changing_round(window)
+        draws the text on the screen that informs the player
+        that he can let his opponents start if he wants to
+    """
+    def __init__(self, fanorona):
+        self.fanorona = fanorona
+        self._last_frame = None
+
+    def invalidate(self):
+        """
+        Makes the next draw_dirty() draw the whole window, e.g. when
+        the window was covered
+        """
+        self._last_frame = None
+
+    def update_highlights(self):
+        """Updates pawns that are able to capture (highlighted ones)"""
+        if self.fanorona.selected_pawn is None:
+            if ROWS != 3 or COLS != 3:
+                self.fanorona.clear_able_to_capture()
+                self.fanorona.update_able_to_capture()
+        else:
+            self.fanorona.clear_able_to_capture()
+
+    def draw(self, window):
+        """
+        Draws board, turn indicator, possibilities on selected Pawn
+        and a number of round depending on the constant
+        """
+        self.update_highlights()
+        self._draw_all(window)
+        # the window may differ from what draw_dirty() remembers
+        self.invalidate()
+
+    def _draw_all(self, window):
+        self.fanorona.board.draw_board(window)
+
+        draw_pawns(window, self.fanorona.pawns, self.fanorona.board,
+                   self.places_to_choose())
+
+        self.draw_round_indicator(window)
+
+        if self._if_draw_clue():
+            self.draw_clue_about_changing_round(window)
+
+        if self.fanorona.problematic_cap is False:
+            self.draw_hints(window)
+
+    def places_to_choose(self):
+        """
+        Returns set of places (row, col) of pawns that can be picked
+        to be captured after problematic capture
+        """
+        if self.fanorona.problematic_cap is False:
+            return set()
+        return (set(self.fanorona.approach_choices)
+                | set(self.fanorona.withdrowal_choices))
+
+    def _if_draw_clue(self):
+        if self.fanorona.round == 1 and self.fanorona.selected_pawn is None:
+            return ROWS != 3 or COLS != 3
+        return False
+
+    def draw_dirty(self, window):
+        """
+        Draws only places (and the header with the round indicator)
+        whose look has changed since the last call, returns list of
+        Rect that were drawn; the first call and the call after resizing
+        draw the whole window
+        """
+        self.update_highlights()
+        frame = self._frame(window)
+        last_frame = self._last_frame
+        self._last_frame = frame
+        size, header, places = frame
+        if last_frame is None or last_frame[0] != size:
+            self._draw_all(window)
+            return [window.get_rect()]
+
+        _, last_header, last_places = last_frame
+        dirty = []
+        if header != last_header:
+            dirty.append(self._header_rect(window))
+        rectangles = self.fanorona.board.rectangles_boxes
+        for place in places.keys() | last_places.keys():
+            if places.get(place) != last_places.get(place):
+                row, col = place
+                dirty.append(rectangles[row-1][col-1])
+        if not dirty:
+            return dirty
+        # everything is drawn, but only inside dirty rectangles
+        window.set_clip(dirty[0].unionall(dirty[1:]))
+        self._draw_all(window)
+        window.set_clip(None)
+        return dirty
+
+    def _frame(self, window):
+        """
+        Returns (size of the window, state of the header, dict with state
+        of every place that has a pawn or a hint)
+        """
+        header = (self.fanorona.turn, self.fanorona.round,
+                  self._if_draw_clue())
+        places = {}
+        to_choose = self.places_to_choose()
+        for pawn in self.fanorona.pawns.pawns:
+            place = (pawn.row, pawn.column)
+            places[place] = (pawn.colour, place in to_choose,
+                             pawn.if_selected, pawn.if_capture, None)
+        if self.fanorona.problematic_cap is False:
+            for place, colour in self.hints().items():
+                places[place] = places.get(place, (None,)*4)[:4] + (colour,)
+        return window.get_size(), header, places
+
+    def _header_rect(self, window):
+        """Returns Rect with the round indicator and the clue"""
+        _, height = FONT_SMALL.size("Round")
+        return pygame.Rect(0, 0, window.get_width(), 25 + height)
+
+    def draw_round_indicator(self, window):
+        colour = RGB_OF_COLOUR[self.fanorona.turn]
+        pygame.draw.circle(window, colour, (15, 15), 10)
+
+        if IF_DRAW_NUM_OF_ROUND == 1:
+            text = "Round: " + str(self.fanorona.round)
+            img_font = FONT_SMALL.render(text, True, WHITE_RGB)
+            window.blit(img_font, (35, 8))
+
+    def hints(self):
+        """
+        Returns dict, colour of the hint at every place where selected
+        pawn can be moved e.g. {(2, 3): GREEN}
+        """
+        hints = {}
+        capt_mv_app = self.fanorona.capturing_moves_approach
+        capt_mv_with = self.fanorona.capturing_moves_withdrawal
+        if not capt_mv_app and not capt_mv_with:
+            for place in self.fanorona.possibilities:
+                hints[place] = GREEN
+        for place in capt_mv_app:
+            hints[place] = RED2
+        for place in capt_mv_with:
+            # PINK means that capture can be either by approach
+            # or by withdrawal
+            hints[place] = PINK if place in capt_mv_app else ORANGE
+        return hints
+
+    def draw_hints(self, window):
+        help_circle_radius = int(self.fanorona.board._square_size * (0.2))
+        for (row, col), colour in self.hints().items():
+            center = self.fanorona.board.centers_of_squares[row-1][col-1]
+            pygame.draw.circle(window, colour, center, help_circle_radius)
+
+    def draw_winner(self, window):
+        """
+        Draws who the winner is, waits 4s, resets the game
+
+        If there is no winner, raises NoWinnerError
+        """
+        colour_won = self.fanorona.logic.check_for_winner()
+        if colour_won == WHITE:
+            who_won_text = "White won!"
+        else:
+            who_won_text = "Black won!"
+        img_font = FONT.render(
+            who_won_text, True, RGB_OF_COLOUR[colour_won])
+        font_width, _ = FONT.size(who_won_text)
+        width = window.get_width()
+        x = (width // 2)-(font_width//2)
+        window.blit(img_font, (x, 10))
+        self.invalidate()
+        pygame.display.update()
+        pygame.time.delay(4000)
+        self.fanorona.reset()
+
+    def draw_clue_about_changing_round(self, window):
+        """
+        Draws the text that informat about possibility of
+        giving away your round
+        """
+        text = "You can give away your round by pressing 'F'..."
+        img_font = FONT_SMALL.render(text, True, YELLOW)
+        font_width, _ = FONT_SMALL.size(text)
+        width = window.get_width()
+        x = (width // 2)-(font_width//2)
+        window.blit(img_font, (x, 25))
@@ -0,0 +1,283 @@
+from time import perf_counter
+from position import Position
+from constants import WHITE, BLACK
+from constants import SEARCH_MAX_DEPTH, SEARCH_TIME_BUDGET
+from transposition import Zobrist, TranspositionTable
+from transposition import EXACT, LOWER_BOUND, UPPER_BOUND
+
+WIN_SCORE = 100000
+# scores above it mean that the win was found
+WIN_THRESHOLD = WIN_SCORE - 1000
+PAWN_VALUE = 100
+# how often (in nodes) the clock is checked
+NODES_BETWEEN_CLOCK_CHECKS = 512
+
+
+def enemy_of(colour):
+    """Returns colour of the opponent"""
+    return BLACK if colour == WHITE else WHITE
+
+
+def generate_turns(position: "Position"):
+    """
+    Returns list of complete turns of the side to move; every turn is
+    (steps, white_mask, black_mask) where steps is a tuple of
+    (from_index, to_index, 'APPROACH'/'WITHDRAWAL'/'PAIKA') and masks
+    describe the position after the turn
+
+    If some capture is possible, only capturing turns are returned and
+    every capture chain is continued as long as it can be (except
+    rounds 1 and 2 where only one capture is allowed), otherwise paika
+    moves are returned; passed position is the same after the call
+    """
+    turns = []
+    _extend_turn(position, (), turns)
+    return turns
+
+
+def _extend_turn(position, steps, turns):
+    """Appends to turns every way of finishing the turn after steps"""
+    for step in position.legal_steps():
+        delta = position.make_move(step)
+        new_steps = steps + (step,)
+        if position.chain_index is None:
+            turns.append(
+                (new_steps, position.white_mask, position.black_mask))
+        else:
+            _extend_turn(position, new_steps, turns)
+        position.unmake_move(delta)
+
+
+def make_turn(position: "Position", steps):
+    """Makes all steps of the turn, returns list of Delta for undoing"""
+    return [position.make_move(step) for step in steps]
+
+
+def unmake_turn(position: "Position", deltas):
+    """Undoes the turn made by make_turn()"""
+    for delta in reversed(deltas):
+        position.unmake_move(delta)
+
+
+def evaluate(position: "Position", colour):
+    """
+    Returns score of the position from the point of view of the side
+    with passed colour, it depends on the difference of pawns
+    """
+    own, enemy = position.masks(colour)
+    return PAWN_VALUE * (own.bit_count() - enemy.bit_count())
+
+
+class SearchTimeout(Exception):
+    def __init__(self):
+        super().__init__("Time budget of the search has been used")
+
+
+class AlphaBetaSearch:
+    """
+    Class used for searching the best turn with negamax and alpha-beta
+    pruning over complete turns (with whole capture chains), the search
+    is deepened iteratively until max_depth or the time budget is reached
+
+    ...
+    Attributes
+    ----------
+    max_depth: int
+        maximal depth of the search in full turns
+    time_budget: float
+        number of seconds that one search can take
+    nodes: int
+        number of positions visited during the last search
+    depth_reached: int
+        depth of the last completed iteration of the last search
+    zobrist: Zobrist
+        keys used for hashing positions
+    table: TranspositionTable
+        results of already searched positions, it is kept between
+        searches, its 'hits' and 'misses' can be used for tuning
+
+    Methods
+    -------
+    best_turn(position)
+        returns steps of the best turn found for the side to move
+        or None if there is no allowed turn
+    negamax(position, depth, alpha, beta, ply, key)
+        returns score of the position for the side to move, key is
+        the Zobrist hash of the position
+    """
+    def __init__(self, max_depth=SEARCH_MAX_DEPTH,
+                 time_budget=SEARCH_TIME_BUDGET, table=None):
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self.nodes = 0
+        self.depth_reached = 0
+        self.zobrist = Zobrist()
+        self.table = table if table is not None else TranspositionTable()
+        self._deadline = None
+
+    def best_turn(self, position: "Position"):
+        """
+        Returns steps of the best turn, the result of the deepest
+        completed iteration is used when the time is over
+        """
+        self.nodes = 0
+        self.depth_reached = 0
+        self._deadline = perf_counter() + self.time_budget
+        self.table.new_search()
+        key = self._hash(position)
+
+        turns = generate_turns(position)
+        if not turns:
+            return None
+        turns.sort(key=lambda turn: self._captured(position, turn),
+                   reverse=True)
+        best = turns[0]
+        if len(turns) == 1:
+            return best[0]
+
+        for depth in range(1, self.max_depth+1):
+            try:
+                best_score = -WIN_SCORE-1
+                best_in_iteration = None
+                alpha = -WIN_SCORE-1
+                for turn in turns:
+                    child_key = self._child_key(key, position, turn)
+                    deltas = make_turn(position, turn[0])
+                    try:
+                        score = -self.negamax(
+                            position, depth-1, -WIN_SCORE-1, -alpha, 1,
+                            child_key)
+                    finally:
+                        unmake_turn(position, deltas)
+                    if score > best_score:
+                        best_score = score
+                        best_in_iteration = turn
+                    alpha = max(alpha, score)
+            except SearchTimeout:
+                break
+            best = best_in_iteration
+            self.depth_reached = depth
+            # the best turn is searched first in the next iteration
+            turns.remove(best)
+            turns.insert(0, best)
+            if best_score >= WIN_SCORE - depth:
+                break
+        return best[0]
+
+    def negamax(self, position: "Position", depth, alpha, beta, ply, key):
+        """
+        Returns score of the position for the side to move, raises
+        SearchTimeout when the time budget is used
+        """
+        self.nodes += 1
+        if self.nodes % NODES_BETWEEN_CLOCK_CHECKS == 0:
+            if perf_counter() > self._deadline:
+                raise SearchTimeout()
+
+        own, enemy = position.masks(position.turn)
+        if not enemy:
+            return WIN_SCORE - ply
+        if not own:
+            return -WIN_SCORE + ply
+        if depth == 0:
+            return evaluate(position, position.turn)
+
+        original_alpha = alpha
+        best_steps = None
+        entry = self.table.probe(key)
+        if entry is not None:
+            stored_depth, stored_score, flag, best_steps = entry
+            if stored_depth >= depth:
+                score = _score_from_table(stored_score, ply)
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        turns = generate_turns(position)
+        if not turns:
+            # side that can't move loses
+            return -WIN_SCORE + ply
+        turns.sort(key=lambda turn: (
+            turn[0] == best_steps, self._captured(position, turn)),
+            reverse=True)
+
+        best_score = -WIN_SCORE-1
+        for turn in turns:
+            child_key = self._child_key(key, position, turn)
+            deltas = make_turn(position, turn[0])
+            try:
+                score = -self.negamax(
+                    position, depth-1, -beta, -alpha, ply+1, child_key)
+            finally:
+                unmake_turn(position, deltas)
+            if score > best_score:
+                best_score = score
+                best_steps = turn[0]
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.store(
+            key, depth, _score_to_table(best_score, ply), flag, best_steps)
+        return best_score
+
+    def _hash(self, position):
+        """Returns the hash of the position"""
+        return self.zobrist.hash_position(
+            position.white_mask, position.black_mask, position.turn,
+            position.round_number, position.last_direction,
+            position.visited)
+
+    def _child_key(self, key, position, turn):
+        """Returns the hash of the position after the turn"""
+        _, white_mask, black_mask = turn
+        key ^= self.zobrist.pawns_key(
+            position.white_mask ^ white_mask,
+            position.black_mask ^ black_mask)
+        key ^= self.zobrist.side_key
+        key ^= self.zobrist.phase_change_key(
+            position.round_number, position.round_number+1)
+        if position.chain_index is not None:
+            # the chain ends with the turn, so its state is removed
+            key ^= self.zobrist.chain_key(
+                position.last_direction, position.visited)
+        return key
+
+    @staticmethod
+    def _captured(position, turn):
+        """Returns number of enemy's pawns captured during the turn"""
+        _, enemy = position.masks(position.turn)
+        _, white_mask, black_mask = turn
+        enemy_after = black_mask if position.turn == WHITE else white_mask
+        return enemy.bit_count() - enemy_after.bit_count()
+
+
+def _score_to_table(score, ply):
+    """
+    Scores of won positions are stored as distance from the stored
+    position, not from the root of the search
+    """
+    if score > WIN_THRESHOLD:
+        return score + ply
+    if score < -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    if score > WIN_THRESHOLD:
+        return score - ply
+    if score < -WIN_THRESHOLD:
+        return score + ply
+    return score
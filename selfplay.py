@@ -0,0 +1,324 @@
+import argparse
+from collections import namedtuple
+from multiprocessing import Pool
+from random import Random
+from engine import Fanorona
+from position import Position
+from search import AlphaBetaSearch
+from mcts import MonteCarloSearch
+from records import GameRecordWriter, GameRecord
+from constants import WHITE, BLACK
+from constants import SELFPLAY_MAX_ROUNDS, SELFPLAY_SEARCH_DEPTH
+from constants import SELFPLAY_MCTS_ITERATIONS, ROWS, COLS
+from constants import UnknownPlayerError
+
+# result of one game, winner is 'first', 'second' or None (draw)
+GameResult = namedtuple('GameResult', [
+    'seed', 'first_colour', 'winner', 'rounds'])
+
+
+def random_player(position: "Position", generator: "Random"):
+    """
+    Makes random allowed steps until the end of the turn,
+    returns list of made steps
+    """
+    made = []
+    colour = position.turn
+    while position.turn == colour and position.winner() is None:
+        steps = position.legal_steps()
+        if not steps:
+            break
+        made.append(generator.choice(steps))
+        position.make_move(made[-1])
+    return made
+
+
+def greedy_player(position: "Position", generator: "Random"):
+    """
+    Makes steps that capture the most enemy's pawns (just as
+    FanoronaBot.make_good_move) and random paika moves; returns list
+    of made steps
+    """
+    made = []
+    colour = position.turn
+    while position.turn == colour and position.winner() is None:
+        steps = position.legal_steps()
+        if not steps:
+            break
+        if steps[0][2] == 'PAIKA':
+            made.append(generator.choice(steps))
+            position.make_move(made[-1])
+            continue
+        best_steps = []
+        best_captured = 0
+        for step in steps:
+            from_index, to_index, kind = step
+            if kind == 'APPROACH':
+                captured = position.captured_by_approach(
+                    from_index, to_index, colour)
+            else:
+                captured = position.captured_by_withdrawal(
+                    from_index, to_index, colour)
+            captured = captured.bit_count()
+            if captured > best_captured:
+                best_steps = [step]
+                best_captured = captured
+            elif captured == best_captured:
+                best_steps.append(step)
+        made.append(generator.choice(best_steps))
+        position.make_move(made[-1])
+    return made
+
+
+def alphabeta_player(depth):
+    """Returns player that makes turns found by AlphaBetaSearch"""
+    search = AlphaBetaSearch(max_depth=depth, time_budget=float('inf'))
+
+    def player(position: "Position", generator: "Random"):
+        steps = search.best_turn(position)
+        if steps is None:
+            return []
+        for step in steps:
+            position.make_move(step)
+        return list(steps)
+    return player
+
+
+def mcts_player(iterations):
+    """
+    Returns player that makes turns found by MonteCarloSearch with
+    passed number of playouts, playouts are seeded by the generator
+    """
+    def player(position: "Position", generator: "Random"):
+        search = MonteCarloSearch(
+            iterations=iterations, time_budget=float('inf'),
+            seed=generator.getrandbits(32))
+        steps = search.best_turn(position)
+        if steps is None:
+            return []
+        for step in steps:
+            position.make_move(step)
+        return list(steps)
+    return player
+
+
+def make_player(name):
+    """
+    Returns player (function that makes the whole turn on passed
+    Position and returns list of its steps) with passed name: 'random',
+    'greedy', 'alphabeta' or 'alphabeta:<depth>' e.g. 'alphabeta:3',
+    'mcts' or 'mcts:<playouts>' e.g. 'mcts:500'
+    """
+    if name == 'random':
+        return random_player
+    if name == 'greedy':
+        return greedy_player
+    if name.startswith('alphabeta'):
+        _, _, depth = name.partition(':')
+        return alphabeta_player(int(depth) if depth else SELFPLAY_SEARCH_DEPTH)
+    if name.startswith('mcts'):
+        _, _, iterations = name.partition(':')
+        return mcts_player(
+            int(iterations) if iterations else SELFPLAY_MCTS_ITERATIONS)
+    raise UnknownPlayerError(name)
+
+
+def play_game(first, second, seed, max_rounds=SELFPLAY_MAX_ROUNDS,
+              on_turn=None):
+    """
+    Plays one game between players with passed names, 'first' plays
+    WHITE when seed is even and BLACK when it's odd; returns GameResult
+
+    on_turn(snapshot, steps) is called after every turn with Snapshot
+    of the position before the turn and list of its steps
+    """
+    generator = Random(seed)
+    first_colour = WHITE if seed % 2 == 0 else BLACK
+    players = {
+        first_colour: ('first', make_player(first)),
+        BLACK if first_colour == WHITE else WHITE: (
+            'second', make_player(second))
+    }
+    position = Position.from_fanorona(Fanorona())
+    winner = None
+    while position.round_number <= max_rounds:
+        colour = position.turn
+        label, player = players[colour]
+        round_number = position.round_number
+        snapshot = position.snapshot()
+        steps = player(position, generator)
+        if on_turn is not None and steps:
+            on_turn(snapshot, steps)
+        if position.winner() is not None:
+            winner = players[position.winner()][0]
+            break
+        if position.round_number == round_number:
+            # player couldn't move, so he lost
+            winner = players[BLACK if colour == WHITE else WHITE][0]
+            break
+    return GameResult(seed, first_colour, winner, position.round_number-1)
+
+
+def _play_game_task(arguments):
+    """
+    Plays one game, returns GameResult and list of all steps of the game
+    if it is recorded (None otherwise)
+    """
+    first, second, seed, max_rounds, record = arguments
+    if not record:
+        return play_game(first, second, seed, max_rounds), None
+    steps = []
+
+    def on_turn(snapshot, turn_steps):
+        steps.extend(turn_steps)
+    return play_game(first, second, seed, max_rounds, on_turn), steps
+
+
+def _write_record(writer: "GameRecordWriter", start: "Position",
+                  result: "GameResult", steps):
+    """Writes the game played from start (Position) to the game records"""
+    winner = None
+    if result.winner is not None:
+        second_colour = BLACK if result.first_colour == WHITE else WHITE
+        winner = (result.first_colour if result.winner == 'first'
+                  else second_colour)
+    writer.write_game(GameRecord(
+        ROWS, COLS, start.turn, winner, start.white_mask, start.black_mask,
+        steps))
+
+
+def run_tasks(task, tasks, processes=None):
+    """
+    Yields task(arguments) of all tasks, they are run across a pool of
+    processes in the order they finish; processes=1 runs them one by one
+    in the current process
+    """
+    if processes == 1:
+        yield from map(task, tasks)
+        return
+    with Pool(processes) as pool:
+        yield from pool.imap_unordered(task, tasks)
+
+
+class SelfPlayStats:
+    """
+    Class used for aggregating results of self-play games
+
+    ...
+    Attributes
+    ----------
+    games: int
+        a number of played games
+    wins: dict
+        a number of won games by 'first' and 'second' player
+    wins_as_white: dict
+        a number of games won by 'first' and 'second' playing WHITE
+    draws: int
+        a number of games that reached the limit of rounds
+    lengths: list
+        numbers of rounds of every game
+
+    Methods
+    -------
+    add(result: "GameResult")
+        adds result of the game to the statistics
+    average_length()
+        returns average number of rounds of the game
+    report()
+        returns string with summary of the statistics
+    """
+    def __init__(self):
+        self.games = 0
+        self.wins = {'first': 0, 'second': 0}
+        self.wins_as_white = {'first': 0, 'second': 0}
+        self.draws = 0
+        self.lengths = []
+
+    def add(self, result: "GameResult"):
+        self.games += 1
+        self.lengths.append(result.rounds)
+        if result.winner is None:
+            self.draws += 1
+            return None
+        self.wins[result.winner] += 1
+        winner_is_first = result.winner == 'first'
+        if winner_is_first == (result.first_colour == WHITE):
+            self.wins_as_white[result.winner] += 1
+
+    def average_length(self):
+        if not self.lengths:
+            return 0.0
+        return sum(self.lengths) / len(self.lengths)
+
+    def report(self):
+        lines = [
+            f"Games: {self.games}",
+            f"First wins: {self.wins['first']} "
+            f"({self.wins_as_white['first']} as white)",
+            f"Second wins: {self.wins['second']} "
+            f"({self.wins_as_white['second']} as white)",
+            f"Draws: {self.draws}",
+            f"Average length: {self.average_length():.1f} rounds",
+        ]
+        if self.lengths:
+            lines.append(
+                f"Shortest/longest: {min(self.lengths)}/"
+                f"{max(self.lengths)} rounds")
+        return "\n".join(lines)
+
+
+def run_selfplay(first, second, games, processes=None, seed=0,
+                 max_rounds=SELFPLAY_MAX_ROUNDS, record_path=None):
+    """
+    Plays games between players with passed names across a pool of
+    processes, game number i is played with seed+i (players swap colours
+    every game); returns SelfPlayStats
+
+    processes=1 plays all games in the current process, games are
+    appended to the file of game records at record_path (see records.py)
+    as they finish if it is passed
+    """
+    make_player(first)
+    make_player(second)
+    record = record_path is not None
+    tasks = [
+        (first, second, seed+i, max_rounds, record) for i in range(games)]
+    stats = SelfPlayStats()
+    writer = GameRecordWriter(record_path) if record else None
+    start = Position.from_fanorona(Fanorona()) if record else None
+    try:
+        for result, steps in run_tasks(_play_game_task, tasks, processes):
+            stats.add(result)
+            if writer is not None:
+                _write_record(writer, start, result, steps)
+    finally:
+        if writer is not None:
+            writer.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Plays Fanorona games between two bots without window")
+    parser.add_argument(
+        "first", help="random, greedy, alphabeta[:depth] or mcts[:playouts]")
+    parser.add_argument(
+        "second", help="random, greedy, alphabeta[:depth] or mcts[:playouts]")
+    parser.add_argument("-n", "--games", type=int, default=100)
+    parser.add_argument("-p", "--processes", type=int, default=None)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument(
+        "-r", "--max-rounds", type=int, default=SELFPLAY_MAX_ROUNDS)
+    parser.add_argument(
+        "--record", default=None,
+        help="file the games are appended to (see records.py)")
+    arguments = parser.parse_args()
+    stats = run_selfplay(
+        arguments.first, arguments.second, arguments.games,
+        arguments.processes, arguments.seed, arguments.max_rounds,
+        arguments.record)
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+from itertools import combinations
+from math import comb
+from bitboard import NUM_OF_POINTS, bits
+from position import Position
+from search import generate_turns, enemy_of
+from constants import ROWS, COLS, WHITE, BLACK
+from constants import TABLEBASE_PATH, TABLEBASE_PAWNS
+from constants import TablebaseFileError
+
+# Endgame tablebase keeps the result of perfect play of every position
+# with at most 'max_pawns' pawns (both sides have at least one) at the
+# start of the turn after the first rounds, so the whole chain of
+# captures is one turn.
+#
+# Positions with w white and b black pawns make a section of the file,
+# inside it the position has index
+#     (rank(white_mask) * comb(NUM_OF_POINTS, b) + rank(black_mask)) * 2
+#     + side to move
+# where rank() is the number of the set of places in colex order, so
+# the value is found without any search; places taken by both sides
+# are wasted, but it keeps the index simple.
+#
+# Every value is uint16: 0 - not a position, 1 - draw, 2 + 2*d - the
+# side to move wins in d turns, 3 + 2*d - it loses in d turns
+HEADER = struct.Struct('<4sBBB')
+MAGIC = b'FTB1'
+VALUE = struct.Struct('<H')
+
+WIN = 1
+DRAW = 0
+LOSS = -1
+# round used for positions of the tablebase, all of them are after
+# the first rounds where only one capture is allowed
+ENDGAME_ROUND = 3
+
+
+def _rank(mask):
+    """Returns number of the set of places of the mask in colex order"""
+    return sum(comb(index, i+1) for i, index in enumerate(bits(mask)))
+
+
+def _sections(max_pawns):
+    """
+    Returns dict (whites, blacks): (first index, size) of sections,
+    in the order they are written to the file
+    """
+    sections = {}
+    start = 0
+    for whites in range(1, max_pawns):
+        for blacks in range(1, max_pawns - whites + 1):
+            size = comb(NUM_OF_POINTS, whites) * comb(NUM_OF_POINTS, blacks)
+            sections[(whites, blacks)] = (start, size * 2)
+            start += size * 2
+    return sections
+
+
+def _encode(result, distance):
+    if result == DRAW:
+        return 1
+    return 2 + 2*distance + (result == LOSS)
+
+
+def _decode(value):
+    """Returns (result, distance) of the value or None if it is empty"""
+    if value == 0:
+        return None
+    if value == 1:
+        return DRAW, 0
+    distance, lost = divmod(value - 2, 2)
+    return (LOSS if lost else WIN), distance
+
+
+class _Indexer:
+    """Translates (white_mask, black_mask, turn) into index of the value"""
+    def __init__(self, max_pawns):
+        self.max_pawns = max_pawns
+        self.sections = _sections(max_pawns)
+        self.size = sum(size for _, size in self.sections.values())
+
+    def index(self, white_mask, black_mask, turn):
+        """Returns index of the position or None if it isn't covered"""
+        whites = white_mask.bit_count()
+        blacks = black_mask.bit_count()
+        section = self.sections.get((whites, blacks))
+        if section is None:
+            return None
+        start, _ = section
+        return start + 2 * (
+            _rank(white_mask) * comb(NUM_OF_POINTS, blacks)
+            + _rank(black_mask)) + int(turn)
+
+    def positions(self):
+        """Yields (index, white_mask, black_mask, turn) of every position"""
+        for (whites, blacks) in self.sections:
+            for white_places in combinations(range(NUM_OF_POINTS), whites):
+                white_mask = sum(1 << index for index in white_places)
+                for black_places in combinations(
+                        range(NUM_OF_POINTS), blacks):
+                    black_mask = sum(1 << index for index in black_places)
+                    if white_mask & black_mask:
+                        continue
+                    for turn in [WHITE, BLACK]:
+                        yield (self.index(white_mask, black_mask, turn),
+                               white_mask, black_mask, turn)
+
+
+def solve(max_pawns=TABLEBASE_PAWNS):
+    """
+    Returns array of values (see the top of the module) of every
+    position with at most max_pawns pawns
+
+    Turns are generated forwards once to link every position with
+    its predecessors, then results are spread backwards from positions
+    where the game ends (retrograde analysis), so every position gets
+    the shortest win or the longest loss; positions that are left
+    are draws
+    """
+    indexer = _Indexer(max_pawns)
+    values = array('H', bytes(2 * indexer.size))
+    remaining = {}
+    predecessors = {}
+    lost = []
+    won = []
+    for index, white_mask, black_mask, turn in indexer.positions():
+        position = Position(white_mask, black_mask, turn, ENDGAME_ROUND)
+        enemy = enemy_of(turn)
+        successors = set()
+        for _, white_after, black_after in generate_turns(position):
+            if not (black_after if turn == WHITE else white_after):
+                successors = None
+                break
+            successors.add(indexer.index(white_after, black_after, enemy))
+        if successors is None:
+            # all enemy's pawns can be captured at once
+            values[index] = _encode(WIN, 1)
+            won.append(index)
+        elif not successors:
+            # side that can't move loses
+            values[index] = _encode(LOSS, 0)
+            lost.append(index)
+        else:
+            remaining[index] = len(successors)
+            for successor in successors:
+                predecessors.setdefault(successor, []).append(index)
+
+    # distances in the queue never decrease
+    queue = deque(lost + won)
+    while queue:
+        index = queue.popleft()
+        result, distance = _decode(values[index])
+        for predecessor in predecessors.get(index, []):
+            if values[predecessor]:
+                continue
+            if result == LOSS:
+                values[predecessor] = _encode(WIN, distance + 1)
+                queue.append(predecessor)
+            else:
+                remaining[predecessor] -= 1
+                if remaining[predecessor] == 0:
+                    values[predecessor] = _encode(LOSS, distance + 1)
+                    queue.append(predecessor)
+
+    for index in remaining:
+        if not values[index]:
+            values[index] = _encode(DRAW, 0)
+    return values
+
+
+def write_tablebase(values, max_pawns, path=TABLEBASE_PATH):
+    """Writes values returned by solve() with the header to the file"""
+    if sys.byteorder != 'little':
+        values = array('H', values)
+        values.byteswap()
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, ROWS, COLS, max_pawns))
+        values.tofile(file)
+
+
+class EndgameTablebase:
+    """
+    Class used for probing the endgame tablebase file, the file is
+    mapped to memory, so probing is just computing the index and
+    reading two bytes
+
+    ...
+    Attributes
+    ----------
+    path: str
+        path of the tablebase file
+    max_pawns: int
+        maximal number of pawns of positions in the tablebase
+
+    Methods
+    -------
+    probe(position)
+        returns (WIN/DRAW/LOSS, distance in turns) for the side to move
+        or None if the position isn't in the tablebase
+    best_turn(position)
+        returns steps of the turn that keeps the best result or None
+        if the position isn't in the tablebase
+    close()
+        unmaps the file
+    """
+    def __init__(self, path=TABLEBASE_PATH):
+        self.path = path
+        with open(path, 'rb') as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise TablebaseFileError(path)
+            magic, rows, cols, self.max_pawns = HEADER.unpack(header)
+            self._indexer = _Indexer(self.max_pawns)
+            expected = HEADER.size + VALUE.size * self._indexer.size
+            if (magic != MAGIC or (rows, cols) != (ROWS, COLS)
+                    or os.path.getsize(path) != expected):
+                raise TablebaseFileError(path)
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _value(self, white_mask, black_mask, turn):
+        index = self._indexer.index(white_mask, black_mask, turn)
+        if index is None:
+            return None
+        return _decode(VALUE.unpack_from(
+            self._map, HEADER.size + VALUE.size * index)[0])
+
+    def probe(self, position: "Position"):
+        if position.chain_index is not None:
+            return None
+        if position.round_number < ENDGAME_ROUND:
+            return None
+        return self._value(
+            position.white_mask, position.black_mask, position.turn)
+
+    def best_turn(self, position: "Position"):
+        """
+        Returns steps of the turn that wins the fastest, keeps the draw
+        or loses the slowest; passed position isn't changed
+        """
+        if self.probe(position) is None:
+            return None
+        enemy = enemy_of(position.turn)
+        best = None
+        best_score = None
+        for steps, white_after, black_after in generate_turns(position):
+            if not (black_after if enemy == BLACK else white_after):
+                return steps
+            result, distance = self._value(white_after, black_after, enemy)
+            # result of the enemy, so its loss is the best
+            if result == LOSS:
+                score = (2, -distance)
+            elif result == DRAW:
+                score = (1, 0)
+            else:
+                score = (0, distance)
+            if best_score is None or score > best_score:
+                best = steps
+                best_score = score
+        return best
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solves endgames with few pawns and writes the tablebase")
+    parser.add_argument(
+        "pawns", type=int, nargs="?", default=TABLEBASE_PAWNS,
+        help="maximal number of pawns of both sides")
+    parser.add_argument("-o", "--output", default=TABLEBASE_PATH)
+    arguments = parser.parse_args()
+    values = solve(arguments.pawns)
+    write_tablebase(values, arguments.pawns, arguments.output)
+    results = [_decode(value) for value in values if value]
+    wins = len([result for result in results if result[0] == WIN])
+    draws = len([result for result in results if result[0] == DRAW])
+    print(f"{len(results)} positions: {wins} wins, {draws} draws, "
+          f"{len(results) - wins - draws} losses of the side to move")
+
+
+if __name__ == "__main__":
+    main()
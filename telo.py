@@ -0,0 +1,235 @@
+import argparse
+from collections import deque
+from itertools import combinations
+from geometry import build_tables
+from bitboard import line_winner
+from constants import WHITE, BLACK
+
+# Fanorona on the 3x3 board (see rules.txt) has only paika moves and
+# is won by three pawns in a row, so every game is a walk over at most
+# 84 * 20 placements of pawns with the side to move; they are all solved
+# once and the best move of every one of them is kept in telo_table.py
+#
+# place (row, col) has index (row-1)*3 + (col-1), the same as in
+# bitboard.py when the board is 3x3
+SIZE = 3
+NUM_OF_PLACES = SIZE * SIZE
+PAWNS_OF_SIDE = 3
+TABLE_MODULE = "telo_table.py"
+
+WIN = 1
+DRAW = 0
+LOSS = -1
+# results as they are stored in the table
+_RESULT_CODES = {DRAW: 0, WIN: 1, LOSS: 2}
+_RESULTS_OF_CODES = {code: result for result, code in _RESULT_CODES.items()}
+NO_MOVE = 255
+
+
+def _index(row, col):
+    return (row-1)*SIZE + (col-1)
+
+
+def _build_neighbours():
+    neighbours, _ = build_tables(SIZE, SIZE)
+    masks = [0] * NUM_OF_PLACES
+    for (row, col), places in neighbours.items():
+        for place in places:
+            masks[_index(row, col)] |= 1 << _index(*place)
+    return masks
+
+
+NEIGHBOUR_MASKS = _build_neighbours()
+
+
+def placements():
+    """
+    Returns list of (white_mask, black_mask) of every placement of
+    three pawns of both sides, in the order of the table
+    """
+    result = []
+    for white_places in combinations(range(NUM_OF_PLACES), PAWNS_OF_SIDE):
+        white_mask = sum(1 << index for index in white_places)
+        free = [index for index in range(NUM_OF_PLACES)
+                if not white_mask >> index & 1]
+        for black_places in combinations(free, PAWNS_OF_SIDE):
+            result.append(
+                (white_mask, sum(1 << index for index in black_places)))
+    return result
+
+
+def paika_moves(white_mask, black_mask, turn):
+    """Returns list of moves (from_index, to_index) of the side to move"""
+    own = white_mask if turn == WHITE else black_mask
+    empty = ~(white_mask | black_mask)
+    moves = []
+    for from_index in range(NUM_OF_PLACES):
+        if own >> from_index & 1:
+            targets = NEIGHBOUR_MASKS[from_index] & empty
+            moves += [(from_index, to_index)
+                      for to_index in range(NUM_OF_PLACES)
+                      if targets >> to_index & 1]
+    return moves
+
+
+def _after(white_mask, black_mask, turn, move):
+    moved = (1 << move[0]) | (1 << move[1])
+    if turn == WHITE:
+        return white_mask ^ moved, black_mask
+    return white_mask, black_mask ^ moved
+
+
+def solve():
+    """
+    Returns dict (white_mask, black_mask, turn): (result, distance,
+    best move) for the side to move, distance is in moves; the game is
+    lost when the enemy has three in a row or there is no allowed move
+
+    Results are spread backwards from finished games, the fastest win,
+    the slowest loss or a move that keeps the draw is picked
+    """
+    solved = {}
+    remaining = {}
+    predecessors = {}
+    queue = []
+    for white_mask, black_mask in placements():
+        for turn in [WHITE, BLACK]:
+            state = (white_mask, black_mask, turn)
+            winner = line_winner(white_mask, black_mask)
+            moves = paika_moves(white_mask, black_mask, turn)
+            if winner is not None or not moves:
+                result = WIN if winner == turn else LOSS
+                solved[state] = (result, 0, None)
+                queue.append(state)
+                continue
+            enemy = BLACK if turn == WHITE else WHITE
+            remaining[state] = len(moves)
+            for move in moves:
+                after = _after(white_mask, black_mask, turn, move) + (enemy,)
+                predecessors.setdefault(after, []).append((state, move))
+
+    queue = deque(queue)
+    while queue:
+        state = queue.popleft()
+        result, distance, _ = solved[state]
+        for predecessor, move in predecessors.get(state, []):
+            if predecessor in solved:
+                continue
+            if result == LOSS:
+                solved[predecessor] = (WIN, distance + 1, move)
+                queue.append(predecessor)
+            else:
+                remaining[predecessor] -= 1
+                if remaining[predecessor] == 0:
+                    # the slowest loss, it is the last one found
+                    solved[predecessor] = (LOSS, distance + 1, move)
+                    queue.append(predecessor)
+
+    for state in remaining:
+        if state not in solved:
+            white_mask, black_mask, turn = state
+            enemy = BLACK if turn == WHITE else WHITE
+            for move in paika_moves(white_mask, black_mask, turn):
+                after = _after(white_mask, black_mask, turn, move) + (enemy,)
+                if after not in solved or solved[after][0] == DRAW:
+                    break
+            solved[state] = (DRAW, 0, move)
+    return solved
+
+
+def table_bytes(solved):
+    """
+    Returns bytes with two bytes (result code, from_index*9 + to_index
+    or NO_MOVE) for every placement and side to move, in the order
+    of placements()
+    """
+    data = bytearray()
+    for white_mask, black_mask in placements():
+        for turn in [WHITE, BLACK]:
+            result, _, move = solved[(white_mask, black_mask, turn)]
+            data.append(_RESULT_CODES[result])
+            data.append(
+                NO_MOVE if move is None else move[0]*NUM_OF_PLACES + move[1])
+    return bytes(data)
+
+
+def write_table_module(data, path=TABLE_MODULE):
+    """Writes the table as the Python module with a bytes literal"""
+    hex_data = data.hex()
+    lines = [hex_data[i:i+72] for i in range(0, len(hex_data), 72)]
+    with open(path, 'w') as file:
+        file.write("# made by telo.py, results and best moves of the 3x3 board\n")
+        file.write("TABLE = bytes.fromhex(\n")
+        for line in lines:
+            file.write(f"    '{line}'\n")
+        file.write(")\n")
+
+
+def _load_table():
+    """
+    Returns the shipped table, it is solved again if there is no
+    telo_table.py (it takes less than a second)
+    """
+    try:
+        from telo_table import TABLE
+    except ImportError:
+        TABLE = table_bytes(solve())
+    return TABLE
+
+
+_TABLE = None
+_POSITION_OF = {
+    placement: number for number, placement in enumerate(placements())}
+
+
+def _entry(white_mask, black_mask, turn):
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = _load_table()
+    number = _POSITION_OF.get((white_mask, black_mask))
+    if number is None:
+        return None
+    offset = 4 * number + 2 * int(turn)
+    return _TABLE[offset], _TABLE[offset+1]
+
+
+def result_of(white_mask, black_mask, turn):
+    """
+    Returns WIN/DRAW/LOSS of the side to move with perfect play or None
+    if it isn't a placement of three pawns of both sides
+    """
+    entry = _entry(white_mask, black_mask, turn)
+    if entry is None:
+        return None
+    return _RESULTS_OF_CODES[entry[0]]
+
+
+def best_move(white_mask, black_mask, turn):
+    """
+    Returns the move (from_index, to_index) of perfect play or None
+    if the game is over or it isn't a placement of the table
+    """
+    entry = _entry(white_mask, black_mask, turn)
+    if entry is None or entry[1] == NO_MOVE:
+        return None
+    return divmod(entry[1], NUM_OF_PLACES)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solves Fanorona on the 3x3 board and writes the table")
+    parser.add_argument("-o", "--output", default=TABLE_MODULE)
+    arguments = parser.parse_args()
+    solved = solve()
+    write_table_module(table_bytes(solved), arguments.output)
+    start = solved[(
+        sum(1 << _index(*place) for place in [(3, 1), (3, 2), (2, 1)]),
+        sum(1 << _index(*place) for place in [(1, 2), (1, 3), (2, 3)]),
+        WHITE)]
+    print(f"{len(solved)} positions solved, the start is "
+          f"{ {WIN: 'won', DRAW: 'drawn', LOSS: 'lost'}[start[0]] } "
+          f"by white")
+
+
+if __name__ == "__main__":
+    main()
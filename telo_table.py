@@ -0,0 +1,190 @@
+# made by telo.py, results and best moves of the 3x3 board
+TABLE = bytes.fromhex(
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff0221012c02ff01ff0221014502210129020401310204014702ff01ff'
+    '020401430204014c020d0143020b012f020b0126010b0126020b012c020b012b0121012a'
+    '02040135021f01310104014c02ff01ff022c0135022c013d02290145022b014d02030139'
+    '022c014702ff01ff02030139020301390203014d0126012f0126012f0126012f01260247'
+    '0126023d01260121012601350126012f0126012f02ff01ff02350121010d011f00040143'
+    '000d014c02ff01ff020301450003014f010d01430004014c010d014c012f0226012f0026'
+    '012f0026012f021f012f021f012f0121012f012c012f012b012f012a02ff01ff023d0117'
+    '01040116000401430004014c0203012c00030147020301290204014702ff01ff010d0143'
+    '02ff01ff000b0147020b014d000401430104014c01040143010b0126010b01260103024d'
+    '010d024302470121010401160104011f0104014c0147012c02ff01ff0203012901040131'
+    '02ff01ff0104014c02ff01ff010b022c020b014d0104013a0104014c0104013a0203012f'
+    '010b0126000301390104014c024f0121010d0116010d011f010d01430103022b02ff01ff'
+    '02030145010d0131010d0131010d014302ff01ff014f023d010b0221010d013a010d0143'
+    '010d023a0203012f0003012f01030239010d0143002101350217013d02ff01ff0217014f'
+    '0004013100040131010401310104013a0004014c0104014c000101350121012a0101024f'
+    '0201012c0201012b0121012a02040135011f0131011f023102ff01ff022c00210117003d'
+    '001700470017014d00030139000300450103004f01170039000300390103004501250235'
+    '0125022101250221012502470125023d01250121012501350125023d0125024502ff01ff'
+    '003501210116011f0016011f0016011f0203013d02ff01ff0203014f0116013a0016013a'
+    '0116014c0113023d0135012c001301210131021f0131011f020401210135012c0203012b'
+    '0203012a02ff01ff0017022c0104010d0104011f0104000d003d003502ff01ff003d014f'
+    '01040131010400310104014c02ff01ff001700470017014d010401430104014c01040043'
+    '01030235013d024f0117024d0104024c014500210004010d0116001f0004000d01470027'
+    '00030029001700270003000d010400310003000d02ff01ff011302250017014d0143013a'
+    '0143014c0143001f00030139010102250003002501430031004f00210116010d0116001f'
+    '0116011f0003022b004f013d02ff01ff0116000d011601310116013a02ff01ff014f023d'
+    '011702210116013a011601430116023a0003013900030045010302390116003a012a0235'
+    '022c0117012a0145012a0217022b012f012a0145012a010b022c0147022b014f012a0145'
+    '02010113012a014702ff01ff0201011302010113012a0145022c01350201014f012a0145'
+    '02ff01ff0121022c0104010d01040116010401160235013d02ff01ff0221014f0104013a'
+    '0104014c0104014c02ff01ff0201011300010113010401430104014c0104014c0135012c'
+    '0201012b0121012a02ff01ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff0145022a0145020d011f010d0145020d'
+    '0145002a0247010b0145002a000401310145010b001f014c0145012c02ff01ff01450129'
+    '011f013102ff01ff0004014c0201012f014501260001014d011f014c014d0217011f0216'
+    '011f010d011f01160121020b024f013d02ff01ff011f0131011f0131011f013a01010213'
+    '02ff01ff02010113011f0131011f0131011f01430201012f0001012f01010229011f0143'
+    '013502210135023d013502470103024f0135020b01350047002a000b0135024701030039'
+    '0103020b0135023d01350047002a001301350247010300390103024501350247012f003d'
+    '002a012102ff01ff013d0017012702350127021701270217003d0035022c000b0026014f'
+    '0127020b0127010b0127020b013d001300010113000100130127014702ff01ff01270217'
+    '0001002f013d002f0101004d0127022f0147021701470235014702170145001701470035'
+    '0147020b00260021014700350026010b0026003901470235014702170101001301470235'
+    '02ff01ff0101001301470235010102210101024d0101023901ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff013a000d'
+    '01390227013101160131000d012f000b0004011f0004000b02ff01ff003d014f0131014c'
+    '0001002b000100130001001300010113000100130131004301350025003d002501040043'
+    '010302270143000d0147022c0143010d01430016002f000b0143001f0004000b002f010b'
+    '002f00270003000b004501210143011f0001001302ff01ff010100130004014c0135022c'
+    '004500250131003a010300250131010d014f022b0131010d01310116002f010b0131011f'
+    '0131011f0203013d02ff01ff0131013a020101210131011f0131014302ff01ff02030113'
+    '01310143014f023d012f02450131023a01030239013a010d013902170143020d0143010d'
+    '0047010b003a010d003a010d0147012c0039010b0204010b02010117013a0116003a0116'
+    '0147012c0203012902ff01ff02ff01ff0201014d013a014c02030126013a000d014d0217'
+    '013a0216013a0116004d000b013a010d013a011f013d020b02ff01ff013a0131004d0117'
+    '013a0116013a00160101021300010113013a001602ff01ff00010229013a01430001002f'
+    '0143010d014d0217014302160143010d0045010b0143010d0143011f0145022f0203010b'
+    '0143013102010121014301160143011f0101021302ff01ff0143013102ff01ff014d0229'
+    '0143013a0203012f022101350017013d0217014702ff01ff000d013a000d0143010d0131'
+    '010d013a000d013a010d0143011b0024011b0024011b0224011b012c011b012b011b012a'
+    '011b0135011b023d011b024502ff01ff022c012102ff01ff022a01450217014d022b0139'
+    '022c0147022b014f021701390217014d0217014d0124011b0124011b0124011b0124011b'
+    '0124011b01240121012401350124023d0124024502ff01ff0235012a02ff01ff020d0145'
+    '0216011f023501270235014702ff01ff020d01430216013a021601430109012402350124'
+    '0209011b0116013a0231011f020d01210135012c0209012b0209012a02ff01ff0117022c'
+    '010d0104010d011f010d011f023d01350217014702ff01ff010d0143010d0131010d0143'
+    '02ff01ff0009011b0217011b010d0143010d014c010d014301090235013d024f0117024d'
+    '010d024c0145012a0116010402ff01ff0116011f024701350217012702ff01ff0116013a'
+    '011601310116013a02ff01ff010901240217011b0116013a0116014c0116013a02470139'
+    '0109022a0009014d0116014c0217012a0116010402ff01ff020d0145024f010302170127'
+    '00170145000d013a00160143010d014302ff01ff01090124010901240116013a000d0143'
+    '010d0243024f013900090145011702390116014301210035022c0017002101450021004f'
+    '000b012f000b002f0121002f010b0047000b004d0121004502090135002c014702ff01ff'
+    '021b01470209014f012a0145002c01350126012f0126022f02ff01ff0021022c010d0104'
+    '010d0004010d01160035003d0035014702ff01ff010d003a010d013a010d014302ff01ff'
+    '002101450021004f010d0143010d014c010d00430135012c020b012b0121012a02ff01ff'
+    '003d0117011f0116001f0116001f0116020b0135020b014702ff01ff001f0143011f0131'
+    '011f01430109012c01090024010901290109014702ff01ff010902170109002401090126'
+    '010902240109023100470017011f0016011f0104011f011600470135000b022c02ff01ff'
+    '011f0004011f0131011f013a0147012c02ff01ff02210129011f013102ff01ff011f014c'
+    '000b012f010b0126000b004d011f0031014d0017011f0016000d0104000d0004000b002a'
+    '014f002600210026000b0004000b0004010d003a011b022a02ff01ff00210145011f0131'
+    '011f0016011f0143000b012f000b002401090226010d003a013500210035003d00270147'
+    '022b000302ff01ff002a0145020b0121012c0147020b013d022f01450109001b0009001b'
+    '0009011b0135003900090039010900450124021b0124011b002a012102ff01ff013d0217'
+    '013d020300290003013d004f013d0235010b0247013d024f010b002f013d024f010b0203'
+    '013d02350029001b013d004f002c014702ff01ff0109004d010b002f013d024f010b024d'
+    '010b022f01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff02ff01ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff014f0217014f0203014f003d00270017014f022102ff01ff'
+    '002a0145014f003d0027002f010b00390109021b0109021b0109001b0109023d01090245'
+    '010902170109021b0109001b0109021b010902390131000401390003000d0003000d0116'
+    '012f022c013100040131011f0035014702ff01ff013101430009002b0009001600090016'
+    '00350024013d0024010d004c0009001b0009011b010d0043010b02240131000400450003'
+    '01310104013101160145012a02ff01ff0131011f020b012702ff01ff0131013a00450121'
+    '0131011f0131001602ff01ff0009022a0131014c010901240009011b0131001f00090039'
+    '01310104004f01030031010400310104010b012a02ff01ff010b0145010b0127010b0026'
+    '010b0204024f01210131011f0031011f02ff01ff0209014501310143010b0124010b0026'
+    '010b021f010b0226013a010400390103013a0116013a01160147022c013a0104013a011f'
+    '020b013502ff01ff013a013102470117013a0116013a011f0147012c0239012902ff01ff'
+    '02ff01ff020b011b013a014c010b0126014c000400390003013a0016000d0003014f022b'
+    '014c0104014c001f0039010300390026000b0003004d0117013a011600090017013d0227'
+    '004d0024013a003102ff01ff0109001b000d0143010b0024014c010400450103014c0116'
+    '014c01040145012a014c010402ff01ff020b0103020b0127014c013102450121014c0116'
+    '014c011f0145022a02ff01ff014c013102ff01ff01090124014c013a020b012f01210235'
+    '0117023d012102450121024f002b00010121004501210201011702010117004d01210245'
+    '002b0009012100450121024f011702470117004d01210245002c0135011b004f01210245'
+    '02ff01ff0135022c01160104011601040116010d001301010221014702ff01ff0116013a'
+    '0116013a011601430235013d02ff01ff022101090116013a0116010d0116014c0135012c'
+    '0213012b0121012a02ff01ff013d022c011f010d011f0104011f010d023d013502170147'
+    '02ff01ff011f0143011f0131011f0143001b010902ff01ff02170109011f0131011f0131'
+    '011f014c011b0247013d024f0117024d011f024c0145022901430004014300040143010d'
+    '004701350113000102ff01ff00130001014301310016013a001b0009001b0029001b0109'
+    '00160009011f003100170009004700240121022401170024011f004c014d022b014c000d'
+    '014c0004011f01040013002a001300010013010100130001001300010116003a011b0009'
+    '004f013d02ff01ff0016000900160131011f013a004f0024012100240117022501160043'
+    '012c0221012c0203012c0147022b010302ff01ff012c014502130101012c014702130101'
+    '02130101012c0109012c0147022a011b012c0147022b013d022a0145012c01470213013d'
+    '022a012102ff01ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff0145022101450203014700030145020301130201'
+    '02ff01ff0113020101130001011302010113000101450021002401090145002100240035'
+    '014502090024004d01130235011302210113024d0113023901290221014f000301290203'
+    '012902030113000102ff01ff01290145001300010013010101290203004f002101290109'
+    '012902210024013d022a0009012902390113001b0013001b0129021b0113003901310204'
+    '01390203013101040131010d011302010131011f0131011f0235014702ff01ff01310143'
+    '013502090131011f0131011f02ff01ff023d01090131014c00130147023d011b01310143'
+    '01130227014702040147022c014702040131010d0147012a02ff01ff0131011f01470127'
+    '02ff01ff0016013a0147002c014701090016011f0147002c024501090031013a01470124'
+    '0245011b0131013a0013013901ff02ff01ff02ff01ff02ff01ff02ff01ff02ff02ff01ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff02ff01ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01430204013902030143010d0143010d'
+    '01130201014301040143011f0247013502ff01ff014301310147021b0143010d0143011f'
+    '00390109021701090143013102ff01ff0217011b0143014c01390227014c020401390203'
+    '014c0004014c010401130201014c0104014c00040039010300130101014c0004014f021b'
+    '014c010d014c011f0039000902ff01ff014c013102ff01ff0013001b014c014300130227'
+    '0143020d014d0203014c010d0143010d0145012a014c010402ff01ff0245010302170127'
+    '004301040145012a0043010d0217010900450109004d0109004c010d02ff01ff02170124'
+    '014c013a0213013902ff01ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff02ff01ff0226012f022c010b023d014f023d0113'
+    '02290113023d014f022c0135023d014f0229014d01240109012401090124010901240109'
+    '0124010b012401090124014702ff01ff012402170124022f02ff01ff0026012f0147000b'
+    '0221010b012c01350047001702450117002501350245012f0229000101240209011b0009'
+    '01240109001b00090026010b001b01090147001302ff01ff001b0013011b002f02ff01ff'
+    '0026012f014d020b014d020b01210013014d0017014d00170025003d00250045014d0201'
+    '011b0209011b0209011b0209011b0009011b0009011b0209011b023d011b0245011b0217'
+    '011b022f02ff01ff012f0126013a0104013a010d02350125013a0143013a011602350147'
+    '02ff01ff013a0143011b0124013a0116013a011602ff01ff023d0109013a014c02350113'
+    '001b0113013a014c011b022602ff01ff012f0126014300040143010d0221012501430104'
+    '01430116002f000102ff01ff0143013a011b01240143010d0143000d002f010b001b0109'
+    '0143000d02ff01ff001b00130143014c001b022602ff01ff012f0126014c0104014c0104'
+    '02210125014c0104014c0143002f010102210101014c013a011b0124014c010d014c0116'
+    '024f013d02ff01ff014c013a02ff01ff02210113014c0143012f022602ff01ff02470126'
+    '021f012f023a010d02470125021f0131023a01160247013502ff01ff023a0131011b0124'
+    '013a01160243010d02470124021b0109021f010b0147012c021b012902ff01ff021b0126'
+    '02ff01ff023d0126021f012f013a0104023d0125011f0131001f0116003d012f024d0101'
+    '003a0131011b0124011f0231013a0116011b012402ff01ff001f0131013d0213024d0113'
+    '013a0131001b012f02ff01ff012101260121012f01430104012101250121020400430104'
+    '0121002a004d010100430104012101240121020d0143010d0121002a024d010b0043010d'
+    '0121022a02ff01ff01430131021b012f02ff01ff012f020b012f020b012f020b01350001'
+    '0139000301390003012f0201012f0201012f02030024011b013902470139024f012f000b'
+    '012f000b012f020b002400470024004f01390213012f021b02ff01ff0126020b0126010b'
+    '012f0003012a0121024701030045000302ff01ff012f0001002f00010024011b02350109'
+    '01450009002401090024000b0024010b0247011b0024012102270013012f001b02ff01ff'
+    '0126010b0126010b0126010b024f0101024f013d0227010102ff01ff0126014501260203'
+    '0224011b024f013d022a0109012601090126010b0126010b024f013d022a012102270139'
+    '0126021b02ff01ff012c020b012c012f02390103012c0201012c013502390103012c0135'
+    '0229010102390103012c011b012c013502390117012c0135022601090226010b012c0135'
+    '0229011702ff01ff0226012f02ff01ff012b020b012b012f01390003012b0201012b0203'
+    '00250003012b0201014d000100250103012b011b012b020901390009012b020b004d000b'
+    '00390009012b021300240117013900130226001b02ff01ff012a0121012a012f024d0103'
+    '012a0121012a0203024d0117012a012102ff01ff02250103012a011b012a0209024d0117'
+    '012a0121022401090224010b012a0121024d0117022701130226011b02ff01ff01350204'
+    '013501260143010d0135020401350125003a01160135022c0143011f02ff01ff0135011b'
+    '01350124014301160135002c003a010d023901090135002c0043011600390113022f011b'
+    '02ff01ff0131021f012f0126014c01040131011f023d012500310116014f0201014c011f'
+    '02390101023d011b023d0124014c0116012f01260031011f02ff01ff004f011b004c011f'
+    '02390113002f011b02ff01ff014c0104012f01260243010d0231011f02450125024c0104'
+    '0145012a02ff01ff022f01270245011b02450124024c010d022f012a02310109022f010b'
+    '02450121024c011f02ff01ff022f012402ff01ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff'
+    '01ff02ff01ff02ff01ff02ff01ff02ff01ff02ff02ff01ff'
+)
@@ -0,0 +1,28 @@
+from random import Random
+from benchmark import engine_playout
+from perft import seeded_positions
+from benchmark import run_benchmark, BENCHMARKS
+from position import Position
+
+
+def test_to_fanorona_keeps_position():
+    for position in seeded_positions(5, 2):
+        fanorona = position.to_fanorona()
+        assert Position.from_fanorona(fanorona).snapshot() == (
+            position.snapshot())
+
+
+def test_engine_playout_ends():
+    fanorona = seeded_positions(1, 4)[0].to_fanorona()
+    engine_playout(fanorona, Random(0), max_rounds=500)
+    assert fanorona.logic.check_for_winner() is not None or (
+        fanorona.round > 500)
+
+
+def test_run_every_benchmark():
+    positions = seeded_positions(2, 5)
+    for name in BENCHMARKS:
+        result = run_benchmark(name, positions, min_time=0)
+        assert result.name == name
+        assert result.ops > 0
+        assert result.peak_memory >= 0
@@ -0,0 +1,108 @@
+from bitboard import Bitboard, index_of, point_of, direction_of, bits
+from bitboard import INFLUENCE, influenced_by, line_winner, THREE_IN_A_ROW
+from fanorona import Fanorona
+from constants import WHITE, BLACK
+from pawn import Pawn
+from pawns import Pawns
+from random import Random
+
+
+def test_index_and_point():
+    assert index_of(1, 1) == 0
+    assert point_of(index_of(3, 7)) == (3, 7)
+    assert list(bits(0b10110)) == [1, 2, 4]
+
+
+def test_direction_of():
+    assert direction_of(index_of(2, 2), index_of(1, 2)) == 'N'
+    assert direction_of(index_of(2, 2), index_of(3, 3)) == 'SE'
+    # there is no diagonal line going from (1, 2)
+    assert direction_of(index_of(1, 2), index_of(2, 3)) is None
+
+
+def test_from_pawns():
+    pawns = Pawns([Pawn(1, 1, WHITE), Pawn(2, 3, BLACK)])
+    bitboard = Bitboard.from_pawns(pawns)
+    assert bitboard.white_mask == 1 << index_of(1, 1)
+    assert bitboard.black_mask == 1 << index_of(2, 3)
+
+
+def test_starting_position_captures():
+    bitboard = Bitboard.from_pawns(Pawns())
+    approach = bitboard.approach_moves(WHITE)
+    withdrawal = bitboard.withdrawal_moves(WHITE)
+    to_center = index_of(3, 5)
+    assert sorted(approach) == sorted([
+        (index_of(4, 5), to_center), (index_of(3, 4), to_center),
+        (index_of(4, 4), to_center), (index_of(4, 6), to_center)])
+    assert withdrawal == [(index_of(3, 4), to_center)]
+    assert len(bitboard.paika_moves(WHITE)) == 4
+
+
+def test_captured_by_approach_and_withdrawal():
+    pawns = Pawns([
+        Pawn(1, 2, WHITE), Pawn(3, 2, BLACK), Pawn(4, 2, BLACK),
+        Pawn(1, 1, BLACK)])
+    bitboard = Bitboard.from_pawns(pawns)
+    captured = bitboard.captured_by_approach(
+        index_of(1, 2), index_of(2, 2), WHITE)
+    assert [point_of(i) for i in bits(captured)] == [(3, 2), (4, 2)]
+    captured = bitboard.captured_by_withdrawal(
+        index_of(1, 2), index_of(1, 3), WHITE)
+    assert [point_of(i) for i in bits(captured)] == [(1, 1)]
+
+
+def test_make_step():
+    pawns = Pawns([Pawn(1, 2, WHITE), Pawn(1, 4, BLACK)])
+    bitboard = Bitboard.from_pawns(pawns)
+    captured = bitboard.captured_by_approach(
+        index_of(1, 2), index_of(1, 3), WHITE)
+    bitboard.make_step(index_of(1, 2), index_of(1, 3), captured, WHITE)
+    assert bitboard.white_mask == 1 << index_of(1, 3)
+    assert bitboard.black_mask == 0
+
+
+def test_capturing_mask_matches_logic():
+    generator = Random(7)
+    places = [(row, col) for row in range(1, 6) for col in range(1, 10)]
+    for _ in range(30):
+        fanorona = Fanorona()
+        chosen = generator.sample(places, 20)
+        fanorona.pawns = Pawns([
+            Pawn(row, col, generator.choice([WHITE, BLACK]))
+            for row, col in chosen])
+        bitboard = fanorona.logic.bitboard()
+        for colour in [WHITE, BLACK]:
+            expected = 0
+            for pawn in fanorona.pawns.pawns:
+                if pawn.colour != colour:
+                    continue
+                poss = fanorona.logic.possibilities_of_pawn(pawn)
+                poss = fanorona.logic.empty_space_validator_list(poss)
+                cap1 = fanorona.logic.possible_captures_approach(pawn, poss)
+                cap2 = fanorona.logic.possible_captures_withdrowal(pawn, poss)
+                if cap1 or cap2:
+                    expected |= 1 << index_of(pawn.row, pawn.column)
+            assert bitboard.capturing_mask(colour) == expected
+
+
+def test_influence():
+    assert INFLUENCE[index_of(1, 1)] == (
+        1 << index_of(1, 1) | 1 << index_of(1, 2) | 1 << index_of(1, 3)
+        | 1 << index_of(2, 1) | 1 << index_of(3, 1)
+        | 1 << index_of(2, 2) | 1 << index_of(3, 3))
+    assert influenced_by(0) == 0
+    assert influenced_by(1 << index_of(3, 5)).bit_count() == 17
+
+
+def test_line_winner():
+    def mask_of(*places):
+        return sum(1 << (row-1)*3 + (col-1) for row, col in places)
+    assert len(THREE_IN_A_ROW) == 8
+    assert line_winner(
+        mask_of((3, 1), (3, 2), (2, 1)), mask_of((1, 2), (1, 3), (2, 3))
+    ) is None
+    assert line_winner(mask_of((1, 1), (2, 2), (3, 3)), 0) == WHITE
+    assert line_winner(mask_of((1, 3), (2, 2), (3, 1)), 0) == WHITE
+    assert line_winner(0, mask_of((1, 3), (2, 3), (3, 3))) == BLACK
+    assert line_winner(mask_of((1, 1), (2, 2), (3, 2)), 0) is None
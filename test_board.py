@@ -1,5 +1,6 @@
+import pygame
 from board import Board
-from constants import ROWS, COLS
+from constants import ROWS, COLS, RED
 
 
 def test_init():
@@ -22,3 +23,45 @@ def test_row_col_method():
     assert board.row_col_from_center_of_square((15, 12)) == (1, 5)
     assert board.row_col_from_center_of_square((19, 20)) == (2, 5)
     assert board.row_col_from_center_of_square((20, 20)) is None
+
+
+def test_draw_board_is_cached_until_resize():
+    board = Board()
+    window = pygame.Surface((800, 500))
+    board.draw_board(window)
+    rectangles = board.rectangles_boxes
+    surface = board._surface
+    board.draw_board(window)
+    assert board.rectangles_boxes is rectangles
+    assert board._surface is surface
+    board.draw_board(pygame.Surface((900, 600)))
+    assert board.rectangles_boxes is not rectangles
+    assert board._surface.get_size() == (900, 600)
+
+
+def test_draw_board_looks_like_drawing():
+    board = Board()
+    window = pygame.Surface((800, 500))
+    board.draw_board(window)
+    expected = pygame.Surface((800, 500))
+    expected.fill(RED)
+    board.draw(expected)
+    assert pygame.image.tostring(window, 'RGB') == pygame.image.tostring(
+        expected, 'RGB')
+
+
+def test_row_col_from_position_like_rectangles():
+    board = Board()
+    board.draw_board(pygame.Surface((800, 500)))
+    for x in range(0, 800, 3):
+        for y in range(0, 500, 3):
+            expected = None
+            for row, rectangles_row in enumerate(board.rectangles_boxes):
+                for col, rectangle in enumerate(rectangles_row):
+                    if rectangle.collidepoint((x, y)):
+                        expected = (row+1, col+1)
+            assert board.row_col_from_position((x, y)) == expected
+
+
+def test_row_col_from_position_no_board():
+    assert Board().row_col_from_position((10, 10)) is None
@@ -0,0 +1,87 @@
+import pytest
+from book import build_book, write_book, book_entries, position_key
+from book import OpeningBook, RECORD
+from position import Position
+from engine import Fanorona
+from search import generate_turns
+from constants import BookFileError
+
+
+def start():
+    return Position.from_fanorona(Fanorona())
+
+
+def make_book(tmp_path, games=20, min_games=1):
+    path = tmp_path / "book.bin"
+    moves = build_book('greedy', 'random', games, processes=1, rounds=4)
+    records = write_book(moves, path, min_games)
+    return path, moves, records
+
+
+def test_book_entries_of_turn():
+    position = start()
+    steps, _, _ = generate_turns(position)[0]
+    entries = list(book_entries(position.snapshot(), steps))
+    assert entries == [(position_key(position), steps[0], position.turn)]
+
+
+def test_build_book_is_deterministic():
+    first = build_book('random', 'random', 5, processes=1, rounds=3)
+    second = build_book('random', 'random', 5, processes=1, rounds=3)
+    assert first == second
+    for games, points in first.values():
+        assert 0 <= points <= 2 * games
+
+
+def test_write_book_sorted_records(tmp_path):
+    path, moves, records = make_book(tmp_path)
+    data = path.read_bytes()
+    assert len(data) == records * RECORD.size == len(moves) * RECORD.size
+    keys = [record[0] for record in RECORD.iter_unpack(data)]
+    assert keys == sorted(keys)
+
+
+def test_write_book_min_games(tmp_path):
+    path, moves, records = make_book(tmp_path, min_games=5)
+    assert records == len(
+        [stats for stats in moves.values() if stats[0] >= 5])
+
+
+def test_opening_book_moves(tmp_path):
+    path, moves, _ = make_book(tmp_path)
+    book = OpeningBook(path)
+    position = start()
+    found = book.moves(position)
+    key = position_key(position)
+    assert sorted(found) == sorted(
+        (step, games, points)
+        for (stored_key, step), (games, points) in moves.items()
+        if stored_key == key)
+    scores = [move.points / move.games for move in found]
+    assert scores == sorted(scores, reverse=True)
+    book.close()
+
+
+def test_opening_book_best_turn(tmp_path):
+    path, _, _ = make_book(tmp_path)
+    book = OpeningBook(path)
+    position = start()
+    snapshot = position.snapshot()
+    steps = book.best_turn(position)
+    assert position.snapshot() == snapshot
+    assert tuple(steps) in [turn[0] for turn in generate_turns(position)]
+    # position that was never played
+    position.round_number = 50
+    assert book.best_turn(position) is None
+    book.close()
+
+
+def test_opening_book_empty_and_broken_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    book = OpeningBook(path)
+    assert book.size == 0
+    assert book.best_turn(start()) is None
+    path.write_bytes(b"123")
+    with pytest.raises(BookFileError):
+        OpeningBook(path)
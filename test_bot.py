@@ -1,5 +1,13 @@
 from bot import Best_move_picker
 from bot import Best_pawn_picker
+from bot import FanoronaBot, BotWorker, think
+from mcts import MonteCarloSearch
+from book import OpeningBook, build_book, write_book
+from tablebase import EndgameTablebase, solve, write_tablebase
+from bitboard import index_of
+from position import Position
+from search import generate_turns
+from time import sleep
 from fanorona import Fanorona
 from constants import WHITE, BLACK
 from pawn import Pawn
@@ -125,3 +133,77 @@ def test_best_move_picker_calc_double_test_forced():
     best_move_app = Best_move_picker._calc_best_approach_move(fanorona)
     assert best_move_app[0] == 2
     assert best_move_app[1] == (3, 4)
+
+
+def test_think_returns_allowed_turn():
+    fanorona = Fanorona()
+    position = Position.from_fanorona(fanorona)
+    allowed = [steps for steps, _, _ in generate_turns(position)]
+    for level in [0, 1, 2]:
+        assert tuple(think(level, position.snapshot(), seed=1)) in allowed
+
+
+def test_think_monte_carlo():
+    position = Position.from_fanorona(Fanorona())
+    allowed = [steps for steps, _, _ in generate_turns(position)]
+    FanoronaBot._monte_carlo = MonteCarloSearch(iterations=20, seed=1)
+    try:
+        assert think(3, position.snapshot()) in allowed
+    finally:
+        FanoronaBot._monte_carlo = None
+
+
+def test_think_takes_turn_from_opening_book(tmp_path):
+    path = tmp_path / "book.bin"
+    write_book(build_book('greedy', 'greedy', 10, processes=1, rounds=2),
+               path, min_games=1)
+    book = OpeningBook(path)
+    position = Position.from_fanorona(Fanorona())
+    FanoronaBot._book, FanoronaBot._book_opened = book, True
+    try:
+        assert think(2, position.snapshot()) == book.best_turn(position)
+        assert FanoronaBot.book_turn(position) is not None
+    finally:
+        FanoronaBot._book, FanoronaBot._book_opened = None, False
+        book.close()
+
+
+def test_think_takes_turn_from_tablebase(tmp_path):
+    path = tmp_path / "tablebase.bin"
+    write_tablebase(solve(2), 2, path)
+    tablebase = EndgameTablebase(path)
+    position = Position(
+        1 << index_of(1, 1), 1 << index_of(1, 3), BLACK, 10)
+    FanoronaBot._tablebase, FanoronaBot._tablebase_opened = tablebase, True
+    try:
+        for level in [0, 2, 3]:
+            assert think(level, position.snapshot()) == (
+                (index_of(1, 3), index_of(1, 2), 'APPROACH'),)
+    finally:
+        FanoronaBot._tablebase = None
+        FanoronaBot._tablebase_opened = False
+        tablebase.close()
+
+
+def test_make_step_plays_computed_turn():
+    fanorona = Fanorona()
+    steps = think(0, Position.from_fanorona(fanorona).snapshot(), seed=1)
+    FanoronaBot.pick_pawn_of_step(fanorona, steps[0])
+    for step in steps:
+        FanoronaBot.make_step(fanorona, step)
+    assert fanorona.turn == BLACK
+    assert fanorona.pawns.blacks < 22
+
+
+def test_bot_worker():
+    fanorona = Fanorona()
+    worker = BotWorker(1)
+    assert worker.result() is None
+    assert worker.start(fanorona) is True
+    while worker.busy():
+        sleep(0.01)
+    snapshot, steps = worker.result()
+    assert snapshot == Position.from_fanorona(fanorona).snapshot()
+    assert steps
+    assert worker.result() is None
+    worker.shutdown()
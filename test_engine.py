@@ -0,0 +1,35 @@
+from engine import Fanorona, FanoronaLogic
+from constants import WHITE, BLACK
+from pawn import Pawn
+from pawns import Pawns
+import subprocess
+import sys
+
+
+def test_engine_does_not_import_pygame():
+    code = ("import sys, engine, search; "
+            "sys.exit('pygame' in sys.modules)")
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+
+def test_init_without_drawing():
+    fanorona = Fanorona()
+    assert isinstance(fanorona.logic, FanoronaLogic) is True
+    assert isinstance(fanorona.pawns, Pawns) is True
+    assert not hasattr(fanorona, 'board')
+    assert not hasattr(fanorona, 'printer')
+
+
+def test_turn_without_drawing():
+    fanorona = Fanorona()
+    fanorona.round = 1
+    pawn1 = Pawn(1, 2, WHITE)
+    pawn2 = Pawn(1, 3, BLACK)
+    pawn3 = Pawn(3, 2, BLACK)
+    fanorona.pawns = Pawns([pawn1, pawn2, pawn3])
+    fanorona.pawns.whites = 1
+    fanorona.pawns.blacks = 2
+    fanorona.pick_your_pawn(pawn1)
+    fanorona.turn_approach(2, 2)
+    assert fanorona.pawns.blacks == 1
+    assert fanorona.turn == BLACK
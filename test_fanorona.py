@@ -4,6 +4,9 @@ from pawns import Pawns
 from pawn import Pawn
 from fanorona import FanoronaPrinter, FanoronaLogic
 from constants import WHITE, BLACK
+from bitboard import Bitboard, bits, index_of
+from perft import random_engine_turn
+from random import Random
 
 
 def test_init():
@@ -166,6 +169,30 @@ def test_return_able_to_capture():
     assert fanorona.return_able_to_capture() == [pawn1, pawn2]
 
 
+def test_return_able_to_capture_follows_turns():
+    fanorona = Fanorona()
+    generator = Random(11)
+    for _ in range(40):
+        bitboard = Bitboard.from_pawns(fanorona.pawns)
+        expected = bitboard.capturing_mask(WHITE) | bitboard.capturing_mask(
+            BLACK)
+        able = fanorona.return_able_to_capture()
+        assert sorted(index_of(pawn.row, pawn.column) for pawn in able) == (
+            list(bits(expected)))
+        if not random_engine_turn(fanorona, generator):
+            break
+
+
+def test_return_able_to_capture_when_nothing_changed():
+    fanorona = Fanorona()
+    able = fanorona.return_able_to_capture()
+
+    def fail():
+        raise AssertionError("nothing has changed")
+    fanorona.logic.bitboard = fail
+    assert fanorona.return_able_to_capture() == able
+
+
 def test_last_move():
     fanorona = Fanorona()
     pawn1 = Pawn(1, 2, WHITE)
@@ -316,6 +343,8 @@ def test_problematic_move_withdrawal():
     fanorona.indicate_problematic_capture(1, 3)
     assert fanorona.approach_choices == [(1, 4), (1, 5)]
     assert fanorona.withdrowal_choices == [(1, 1)]
+    assert [pawn.colour for pawn in fanorona.pawns.pawns] == [
+        BLACK, WHITE, BLACK, BLACK]
 
     fanorona.turn_problematic_move(1, 1)
     assert fanorona.round == 5
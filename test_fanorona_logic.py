@@ -324,3 +324,21 @@ def test_check_for_winner():
     fanorona.pawns.blacks = 1
     fanorona.pawns.whites = 0
     assert f_logic.check_for_winner() == BLACK
+
+
+def test_validators_dont_change_passed_lists():
+    fanorona = Fanorona()
+    f_logic = FanoronaLogic(fanorona)
+    pawn = Pawn(1, 2, WHITE)
+    fanorona.pawns = Pawns([pawn, Pawn(1, 1, BLACK)])
+    fanorona.selected_pawn = pawn
+    poss = [(1, 1), (2, 2), (1, 3), (1, 1)]
+    assert f_logic.empty_space_validator_list(poss) == [(2, 2), (1, 3)]
+    assert poss == [(1, 1), (2, 2), (1, 3), (1, 1)]
+    fanorona.possibilities = poss
+    fanorona.last_move = 'W'
+    assert f_logic.last_move_validator_poss() == [(2, 2), (1, 3)]
+    fanorona.last_move = None
+    new_poss = f_logic.last_move_validator_poss()
+    assert new_poss == poss
+    assert new_poss is not poss
@@ -0,0 +1,42 @@
+from geometry import build_tables, direction_between, has_line
+from geometry import NEIGHBOURS, RAYS
+from constants import ROWS, COLS
+
+
+def test_tables_cover_board():
+    assert len(NEIGHBOURS) == ROWS * COLS
+    assert len(RAYS) == ROWS * COLS
+
+
+def test_neighbours_order():
+    # order is the same as in FanoronaLogic.possibilities_of_pawn
+    assert NEIGHBOURS[(2, 2)] == (
+        (1, 2), (3, 2), (2, 1), (2, 3), (1, 1), (3, 3), (1, 3), (3, 1))
+    assert NEIGHBOURS[(1, 1)] == ((2, 1), (2, 2), (1, 2))
+    assert NEIGHBOURS[(3, 2)] == ((2, 2), (4, 2), (3, 1), (3, 3))
+
+
+def test_rays():
+    assert RAYS[(1, 1)]['SE'] == ((2, 2), (3, 3), (4, 4), (5, 5))
+    assert RAYS[(3, 5)]['W'] == ((3, 4), (3, 3), (3, 2), (3, 1))
+    assert RAYS[(1, 1)]['N'] == ()
+
+
+def test_has_line():
+    assert has_line(1, 1, 'SE') is True
+    assert has_line(1, 2, 'SE') is False
+    assert has_line(1, 2, 'N') is False
+
+
+def test_build_tables_3x3():
+    neighbours, rays = build_tables(3, 3)
+    assert len(neighbours) == 9
+    assert len(neighbours[(2, 2)]) == 8
+    assert neighbours[(1, 2)] == ((2, 2), (1, 3), (1, 1))
+    assert rays[(1, 1)]['S'] == ((2, 1), (3, 1))
+
+
+def test_direction_between():
+    assert direction_between(2, 2, 1, 2) == 'N'
+    assert direction_between(2, 2, 3, 1) == 'SW'
+    assert direction_between(2, 2, 2, 2) is None
@@ -0,0 +1,74 @@
+from random import Random
+from mcts import MonteCarloSearch, playout
+from search import generate_turns
+from bitboard import index_of
+from position import Position
+from engine import Fanorona
+from pawn import Pawn
+from pawns import Pawns
+from constants import WHITE, BLACK
+
+
+def position_of(pawns, round_number=3, turn=WHITE):
+    fanorona = Fanorona()
+    fanorona.pawns = Pawns(pawns)
+    fanorona.round = round_number
+    fanorona.turn = turn
+    return Position.from_fanorona(fanorona)
+
+
+def test_playout_ends_the_game():
+    position = Position.from_fanorona(Fanorona())
+    winner = playout(position, Random(1), 1000)
+    assert winner in [WHITE, BLACK]
+    assert position.winner() == winner
+
+
+def test_playout_round_limit():
+    position = Position.from_fanorona(Fanorona())
+    assert playout(position, Random(1), 2) is None
+    assert position.round_number == 3
+
+
+def test_playout_side_that_cant_move_loses():
+    position = position_of([
+        Pawn(1, 1, BLACK), Pawn(1, 2, WHITE), Pawn(2, 1, WHITE),
+        Pawn(2, 2, WHITE)], turn=BLACK)
+    assert playout(position, Random(1), 100) == WHITE
+
+
+def test_best_turn_is_allowed_and_position_unchanged():
+    position = Position.from_fanorona(Fanorona())
+    snapshot = position.snapshot()
+    allowed = [steps for steps, _, _ in generate_turns(position)]
+    search = MonteCarloSearch(iterations=50, time_budget=10, seed=1)
+    assert search.best_turn(position) in allowed
+    assert position.snapshot() == snapshot
+    assert search.playouts == 50
+    assert search.playouts_per_second() > 0
+
+
+def test_best_turn_is_deterministic_with_seed():
+    position = Position.from_fanorona(Fanorona())
+    first = MonteCarloSearch(iterations=30, time_budget=10, seed=2)
+    second = MonteCarloSearch(iterations=30, time_budget=10, seed=2)
+    assert first.best_turn(position) == second.best_turn(position)
+
+
+def test_best_turn_only_one_or_no_turn():
+    search = MonteCarloSearch(iterations=50, time_budget=10, seed=1)
+    position = position_of([Pawn(1, 1, WHITE), Pawn(1, 3, BLACK)])
+    assert search.best_turn(position) == (
+        (index_of(1, 1), index_of(1, 2), 'APPROACH'),)
+    assert search.playouts == 0
+    position = position_of([Pawn(1, 1, BLACK)])
+    assert search.best_turn(position) is None
+
+
+def test_best_turn_finds_win():
+    position = position_of([
+        Pawn(1, 1, WHITE), Pawn(5, 3, WHITE),
+        Pawn(1, 3, BLACK), Pawn(2, 3, BLACK), Pawn(3, 3, BLACK)])
+    search = MonteCarloSearch(iterations=300, time_budget=10, seed=1)
+    assert search.best_turn(position) == (
+        (index_of(5, 3), index_of(4, 3), 'APPROACH'),)
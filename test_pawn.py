@@ -1,5 +1,5 @@
 from pawn import Pawn
-from pawn import Board
+from board import Board
 from constants import WHITE
 
 
@@ -31,4 +31,10 @@ def test_take_the_center_of_pawn():
 def test_str():
     pawn = Pawn(5, 12, WHITE)
     assert str(pawn) == ("Row: 5, Column: 12, "
-                         "colour: (255, 255, 255), selected: False")
+                         "colour: WHITE, selected: False")
+
+
+def test_pawn_has_slots():
+    pawn = Pawn(1, 2, WHITE)
+    assert not hasattr(pawn, '__dict__')
+    assert pawn.colour == 0
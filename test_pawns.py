@@ -1,6 +1,7 @@
 from pawns import Pawns
 from pawn import Pawn
-from constants import WHITE, BLACK, WHITE2
+from constants import WHITE, BLACK
+from bitboard import Bitboard, FULL_MASK, index_of
 
 
 def test_init():
@@ -70,21 +71,57 @@ def test_colour_of_pawn():
     assert pawns._colour_of_pawn(3, 3) == BLACK
 
 
-def test_colour_of_pawns_to_default():
-    pawn = Pawn(1, 1, WHITE)
-    pawn2 = Pawn(2, 2, WHITE)
-    pawn3 = Pawn(3, 3, WHITE2)
-    pawns = Pawns([pawn, pawn2, pawn3])
-    pawns._change_colours_to_default()
-    assert pawn3.colour == WHITE
-
-
 def test_hihglight_pawn():
     pawn = Pawn(1, 1, WHITE, True)
     pawn2 = Pawn(2, 2, WHITE, True)
-    pawn3 = Pawn(3, 3, WHITE2, False)
+    pawn3 = Pawn(3, 3, BLACK, False)
     pawns = Pawns([pawn, pawn2, pawn3])
     pawns.highlight_pawn(pawn3)
     assert pawn.if_selected is False
     assert pawn2.if_selected is False
     assert pawn3.if_selected is True
+
+
+def test_index_follows_move():
+    pawn = Pawn(1, 1, WHITE)
+    pawn2 = Pawn(2, 2, BLACK)
+    pawns = Pawns([pawn, pawn2])
+    pawn.move(1, 2)
+    assert pawns.is_place_empty(1, 1) == (True, None)
+    assert pawns.row_column_pawn(1, 2) == pawn
+    assert pawns._colour_of_pawn(1, 2) == WHITE
+
+
+def test_index_after_remove_pawn():
+    pawn = Pawn(1, 1, WHITE)
+    pawn2 = Pawn(2, 2, BLACK)
+    pawns = Pawns([pawn, pawn2])
+    pawns.remove_pawn(2, 2)
+    assert pawns.row_column_pawn(2, 2) is None
+    assert pawns.is_place_empty(2, 2) == (True, None)
+    # removed pawn is no longer tracked by the index
+    pawn2.move(1, 1)
+    assert pawns.row_column_pawn(1, 1) == pawn
+
+
+def test_index_starting_positions():
+    pawns = Pawns()
+    for pawn in pawns.pawns:
+        assert pawns.row_column_pawn(pawn.row, pawn.column) == pawn
+    assert pawns.is_place_empty(3, 5) == (True, None)
+
+
+def test_masks_follow_moves_and_removes():
+    pawns = Pawns()
+    bitboard = Bitboard.from_pawns(pawns)
+    assert pawns._white_mask == bitboard.white_mask
+    assert pawns._black_mask == bitboard.black_mask
+    assert pawns._take_changes() == FULL_MASK
+    assert pawns._take_changes() == 0
+    pawns.row_column_pawn(4, 5).move(3, 5)
+    pawns.remove_pawn(2, 5)
+    bitboard = Bitboard.from_pawns(pawns)
+    assert pawns._white_mask == bitboard.white_mask
+    assert pawns._black_mask == bitboard.black_mask
+    assert pawns._take_changes() == (
+        1 << index_of(4, 5) | 1 << index_of(3, 5) | 1 << index_of(2, 5))
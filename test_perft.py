@@ -0,0 +1,58 @@
+from perft import perft, divide, engine_perft, engine_divide, compare
+from perft import random_engine_turn, seeded_positions
+from position import Position
+from engine import Fanorona
+from search import generate_turns
+from random import Random
+
+
+def test_perft_start():
+    position = Position.from_fanorona(Fanorona())
+    assert [perft(position, depth) for depth in range(4)] == [1, 5, 17, 120]
+    assert position.snapshot() == Position.from_fanorona(
+        Fanorona()).snapshot()
+
+
+def test_engine_perft_start():
+    fanorona = Fanorona()
+    assert [engine_perft(fanorona, depth) for depth in range(4)] == [
+        1, 5, 17, 120]
+
+
+def test_divide_the_same_as_engine():
+    position = Position.from_fanorona(Fanorona())
+    counts = divide(position, 3)
+    assert sum(counts.values()) == 120
+    assert compare(counts, engine_divide(Fanorona(), 3)) == []
+
+
+def test_divide_the_same_as_engine_in_seeded_positions():
+    for position in seeded_positions(4, 7):
+        counts = divide(position, 2)
+        engine_counts = engine_divide(position.to_fanorona(), 2)
+        assert compare(counts, engine_counts) == []
+
+
+def test_compare():
+    first = (((1, 2, 'PAIKA'),), 3)
+    second = (((4, 5, 'PAIKA'),), 2)
+    assert compare(dict([first, second]), dict([first])) == [
+        (second[0], 2, None)]
+
+
+def test_random_engine_turn_is_allowed_turn():
+    for seed, position in enumerate(seeded_positions(10, 3)):
+        allowed = {(white, black)
+                   for _, white, black in generate_turns(position)}
+        fanorona = position.to_fanorona()
+        assert random_engine_turn(fanorona, Random(seed))
+        after = Position.from_fanorona(fanorona)
+        assert (after.white_mask, after.black_mask) in allowed
+        assert after.turn != position.turn
+
+
+def test_seeded_positions_are_deterministic():
+    first = [position.snapshot() for position in seeded_positions(5, 1)]
+    second = [position.snapshot() for position in seeded_positions(5, 1)]
+    assert first == second
+    assert len(first) == 5
@@ -0,0 +1,129 @@
+from position import Position, Snapshot
+from search import generate_turns
+from bitboard import index_of
+from engine import Fanorona
+from constants import WHITE, BLACK
+from pawn import Pawn
+from pawns import Pawns
+from random import Random
+
+
+def test_from_fanorona_starting():
+    position = Position.from_fanorona(Fanorona())
+    assert position.white_mask.bit_count() == 22
+    assert position.black_mask.bit_count() == 22
+    assert position.turn == WHITE
+    assert position.round_number == 1
+    assert position.chain_index is None
+
+
+def test_from_fanorona_chain():
+    fanorona = Fanorona()
+    pawn = Pawn(2, 2, WHITE)
+    fanorona.pawns = Pawns([pawn, Pawn(4, 4, BLACK)])
+    fanorona.selected_pawn = pawn
+    fanorona.change = False
+    fanorona.last_move = 'S'
+    fanorona.where_was_pawn = [(1, 2), (2, 2)]
+    position = Position.from_fanorona(fanorona)
+    assert position.chain_index == index_of(2, 2)
+    assert position.last_direction == 'S'
+    assert position.visited == (1 << index_of(1, 2)) | (1 << index_of(2, 2))
+
+
+def test_snapshot_is_hashable():
+    position = Position.from_fanorona(Fanorona())
+    snapshot = position.snapshot()
+    assert isinstance(snapshot, Snapshot)
+    assert {snapshot: 1}[position.snapshot()] == 1
+    assert Position.from_snapshot(snapshot).snapshot() == snapshot
+
+
+def test_make_move_ends_turn_in_first_round():
+    position = Position.from_fanorona(Fanorona())
+    step = (index_of(4, 5), index_of(3, 5), 'APPROACH')
+    delta = position.make_move(step)
+    assert delta.captured.bit_count() == 2
+    assert position.turn == BLACK
+    assert position.round_number == 2
+    assert position.black_mask.bit_count() == 20
+
+
+def test_make_move_continues_chain():
+    fanorona = Fanorona()
+    fanorona.round = 3
+    fanorona.pawns = Pawns([
+        Pawn(1, 2, WHITE), Pawn(1, 3, BLACK), Pawn(1, 4, BLACK),
+        Pawn(3, 2, BLACK), Pawn(2, 4, BLACK), Pawn(1, 1, WHITE)])
+    position = Position.from_fanorona(fanorona)
+    position.make_move((index_of(1, 2), index_of(2, 2), 'APPROACH'))
+    assert position.turn == WHITE
+    assert position.chain_index == index_of(2, 2)
+    assert position.last_direction == 'S'
+    steps = position.legal_steps()
+    assert steps
+    assert all(step[0] == index_of(2, 2) for step in steps)
+
+
+def test_make_and_unmake_restore_position():
+    generator = Random(3)
+    position = Position.from_fanorona(Fanorona())
+    history = []
+    for _ in range(60):
+        steps = position.legal_steps()
+        if not steps:
+            break
+        snapshot = position.snapshot()
+        delta = position.make_move(generator.choice(steps))
+        history.append((snapshot, delta))
+    for snapshot, delta in reversed(history):
+        position.unmake_move(delta)
+        assert position.snapshot() == snapshot
+
+
+def test_winner():
+    assert Position(1, 0).winner() == WHITE
+    assert Position(0, 1).winner() == BLACK
+    assert Position(1, 1).winner() is None
+
+
+def test_turns_the_same_as_generate_turns():
+    generator = Random(5)
+    position = Position.from_fanorona(Fanorona())
+    position.round_number = 3
+    for _ in range(20):
+        turns = list(position.turns())
+        generated = generate_turns(position)
+        assert [turn.steps for turn in turns] == [
+            steps for steps, _, _ in generated]
+        if not turns:
+            break
+        for turn in turns:
+            assert turn.start == turn.steps[0][0]
+        turn = generator.choice(turns)
+        for step in turn.steps:
+            position.make_move(step)
+
+
+def test_turns_count_captured():
+    position = Position.from_fanorona(Fanorona())
+    turns = list(position.turns())
+    assert len(turns) == 5
+    _, enemy = position.masks(WHITE)
+    for turn in turns:
+        for step in turn.steps:
+            position.make_move(step)
+        assert turn.captured == (
+            enemy.bit_count() - position.black_mask.bit_count())
+        position = Position.from_fanorona(Fanorona())
+
+
+def test_turns_are_lazy_and_dont_change_position():
+    position = Position.from_fanorona(Fanorona())
+    snapshot = position.snapshot()
+    turns = position.turns()
+    next(turns)
+    assert position.snapshot() == snapshot
+    next(turns)
+    turns.close()
+    assert position.snapshot() == snapshot
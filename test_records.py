@@ -0,0 +1,129 @@
+import pytest
+from records import GameRecordWriter, GameRecord, read_games, positions
+from records import pack_steps, unpack_steps, record_step, MAGIC
+from engine import Fanorona
+from position import Position
+from bitboard import index_of
+from selfplay import play_game, run_selfplay
+from constants import WHITE, BLACK, GameRecordFileError
+
+
+def start_record(steps, winner=None):
+    start = Position.from_fanorona(Fanorona())
+    return GameRecord(
+        5, 9, WHITE, winner, start.white_mask, start.black_mask, steps)
+
+
+def game_steps(seed):
+    steps = []
+    play_game('random', 'greedy', seed, on_turn=lambda _, turn_steps: (
+        steps.extend(turn_steps)))
+    return steps
+
+
+def test_pack_steps_round_trip():
+    steps = [(0, 44, 'PAIKA'), (22, 13, 'APPROACH'), (44, 0, 'WITHDRAWAL')]
+    data = pack_steps(steps, 5, 9)
+    # 6 bits of both indexes and 2 bits of the kind
+    assert len(data) == 6
+    assert unpack_steps(data, 3, 5, 9) == tuple(steps)
+
+
+def test_pack_steps_small_board():
+    steps = [(8, 0, 'PAIKA'), (4, 5, 'PAIKA')]
+    assert len(pack_steps(steps, 3, 3)) == 3
+    assert unpack_steps(pack_steps(steps, 3, 3), 2, 3, 3) == tuple(steps)
+
+
+def test_write_and_read_games(tmp_path):
+    path = tmp_path / "games.fgr"
+    records = [start_record(game_steps(seed), WHITE) for seed in range(3)]
+    records.append(start_record([], None))
+    with open(path, 'wb'):
+        pass
+    writer = GameRecordWriter(path)
+    for record in records:
+        writer.write_game(record)
+    writer.close()
+    read = list(read_games(path))
+    assert [record._replace(steps=list(record.steps))
+            for record in read] == records
+    assert writer.games == 4
+
+
+def test_writer_appends_to_existing_file(tmp_path):
+    path = tmp_path / "games.fgr"
+    for winner in [WHITE, BLACK]:
+        writer = GameRecordWriter(path)
+        writer.start_game(1, 2, BLACK)
+        writer.add_step((0, 1, 'PAIKA'))
+        writer.end_game(winner)
+        writer.close()
+    assert path.read_bytes().count(MAGIC) == 1
+    games = list(read_games(path))
+    assert [game.winner for game in games] == [WHITE, BLACK]
+    assert games[0].steps == ((0, 1, 'PAIKA'),)
+
+
+def test_read_games_is_lazy(tmp_path):
+    path = tmp_path / "games.fgr"
+    writer = GameRecordWriter(path)
+    writer.write_game(start_record(game_steps(0)))
+    games = read_games(path)
+    assert next(games).winner is None
+    writer.write_game(start_record(game_steps(1)))
+    writer.close()
+    assert len(list(games)) == 1
+
+
+def test_read_games_bad_file(tmp_path):
+    path = tmp_path / "games.fgr"
+    path.write_bytes(b'nope')
+    with pytest.raises(GameRecordFileError):
+        list(read_games(path))
+    writer = GameRecordWriter(tmp_path / "cut.fgr")
+    writer.write_game(start_record(game_steps(0)))
+    writer.close()
+    data = (tmp_path / "cut.fgr").read_bytes()
+    (tmp_path / "cut.fgr").write_bytes(data[:-1])
+    with pytest.raises(GameRecordFileError):
+        list(read_games(tmp_path / "cut.fgr"))
+
+
+def test_positions_replay_the_game():
+    steps = game_steps(2)
+    record = start_record(steps)
+    snapshots = list(positions(record))
+    assert len(snapshots) == len(steps) + 1
+    position = Position.from_fanorona(Fanorona())
+    for step in steps:
+        position.make_move(step)
+    assert snapshots[-1] == position.snapshot()
+
+
+def test_record_step_of_engine(tmp_path):
+    path = tmp_path / "games.fgr"
+    writer = GameRecordWriter(path)
+    fanorona = Fanorona()
+    fanorona.on_step = lambda step: record_step(writer, fanorona, step)
+    start = Position.from_fanorona(fanorona)
+    fanorona.pick_your_pawn(fanorona.pawns.row_column_pawn(4, 5))
+    fanorona.update_able_to_capture()
+    fanorona.turn_approach(3, 5)
+    fanorona.reset()
+    assert fanorona.on_step is not None
+    writer.end_game(WHITE)
+    writer.close()
+    game, = read_games(path)
+    assert game.steps == ((index_of(4, 5), index_of(3, 5), 'APPROACH'),)
+    assert (game.white_mask, game.black_mask) == (
+        start.white_mask, start.black_mask)
+
+
+def test_run_selfplay_records_games(tmp_path):
+    path = tmp_path / "games.fgr"
+    stats = run_selfplay(
+        'random', 'random', 3, processes=1, max_rounds=20, record_path=path)
+    games = list(read_games(path))
+    assert len(games) == stats.games == 3
+    assert [game.winner is None for game in games].count(True) == stats.draws
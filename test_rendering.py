@@ -0,0 +1,96 @@
+import pygame
+from fanorona import Fanorona
+from pawn import Pawn
+from pawns import Pawns
+from constants import RED, GREEN, RED2, WHITE, BLACK
+
+
+def full_render(fanorona, size):
+    window = pygame.Surface(size)
+    window.fill(RED)
+    fanorona.printer.draw(window)
+    return pygame.image.tostring(window, 'RGB')
+
+
+def test_hints():
+    fanorona = Fanorona()
+    fanorona.pick_your_pawn(fanorona.pawns.row_column_pawn(4, 5))
+    assert fanorona.printer.hints() == {(3, 5): RED2}
+    fanorona.capturing_moves_approach.clear()
+    fanorona.possibilities = [(3, 5)]
+    assert fanorona.printer.hints() == {(3, 5): GREEN}
+
+
+def test_draw_dirty_nothing_changed():
+    fanorona = Fanorona()
+    window = pygame.Surface((800, 500))
+    assert fanorona.printer.draw_dirty(window) == [window.get_rect()]
+    assert fanorona.printer.draw_dirty(window) == []
+
+
+def test_draw_dirty_after_resize():
+    fanorona = Fanorona()
+    fanorona.printer.draw_dirty(pygame.Surface((800, 500)))
+    window = pygame.Surface((900, 500))
+    assert fanorona.printer.draw_dirty(window) == [window.get_rect()]
+
+
+def test_draw_dirty_only_changed_places():
+    fanorona = Fanorona()
+    window = pygame.Surface((800, 500))
+    fanorona.printer.draw_dirty(window)
+    fanorona.pick_your_pawn(fanorona.pawns.row_column_pawn(4, 5))
+    rectangles = fanorona.board.rectangles_boxes
+    dirty = fanorona.printer.draw_dirty(window)
+    assert rectangles[3][4] in dirty
+    assert rectangles[2][4] in dirty
+    assert rectangles[0][0] not in dirty
+
+
+def test_draw_dirty_looks_like_full_drawing():
+    fanorona = Fanorona()
+    size = (800, 500)
+    window = pygame.Surface(size)
+    fanorona.printer.draw_dirty(window)
+    fanorona.pick_your_pawn(fanorona.pawns.row_column_pawn(4, 5))
+    fanorona.printer.draw_dirty(window)
+    fanorona.turn_approach(3, 5)
+    fanorona.printer.draw_dirty(window)
+    assert pygame.image.tostring(window, 'RGB') == full_render(
+        fanorona, size)
+
+
+def test_invalidate_draws_whole_window():
+    fanorona = Fanorona()
+    window = pygame.Surface((800, 500))
+    fanorona.printer.draw_dirty(window)
+    fanorona.printer.invalidate()
+    assert fanorona.printer.draw_dirty(window) == [window.get_rect()]
+
+
+def test_places_to_choose():
+    fanorona = Fanorona()
+    assert fanorona.printer.places_to_choose() == set()
+    fanorona.round = 4
+    pawn = Pawn(1, 2, WHITE)
+    fanorona.pawns = Pawns([
+        Pawn(1, 1, BLACK), pawn, Pawn(1, 4, BLACK), Pawn(1, 5, BLACK)])
+    fanorona.selected_pawn = pawn
+    fanorona.indicate_problematic_capture(1, 3)
+    assert fanorona.printer.places_to_choose() == {(1, 1), (1, 4), (1, 5)}
+
+
+def test_draw_dirty_places_to_choose():
+    fanorona = Fanorona()
+    fanorona.round = 4
+    pawn = Pawn(1, 2, WHITE)
+    fanorona.pawns = Pawns([
+        Pawn(1, 1, BLACK), pawn, Pawn(1, 4, BLACK), Pawn(1, 5, BLACK)])
+    window = pygame.Surface((800, 500))
+    fanorona.printer.draw_dirty(window)
+    fanorona.selected_pawn = pawn
+    fanorona.indicate_problematic_capture(1, 3)
+    dirty = fanorona.printer.draw_dirty(window)
+    rectangles = fanorona.board.rectangles_boxes
+    assert rectangles[0][0] in dirty
+    assert rectangles[0][4] in dirty
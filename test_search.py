@@ -0,0 +1,140 @@
+from search import AlphaBetaSearch, generate_turns, evaluate, enemy_of
+from search import make_turn, unmake_turn
+from perft import seeded_positions
+from bitboard import index_of, point_of
+from position import Position
+from fanorona import Fanorona
+from constants import WHITE, BLACK
+from pawn import Pawn
+from pawns import Pawns
+
+
+def make_fanorona(pawns, round_number=3, turn=WHITE):
+    fanorona = Fanorona()
+    fanorona.pawns = Pawns(pawns)
+    fanorona.pawns.whites = len([p for p in pawns if p.colour == WHITE])
+    fanorona.pawns.blacks = len([p for p in pawns if p.colour == BLACK])
+    fanorona.round = round_number
+    fanorona.turn = turn
+    return fanorona
+
+
+def play_steps(fanorona, steps):
+    row, col = point_of(steps[0][0])
+    fanorona.update_able_to_capture()
+    fanorona.pick_your_pawn(fanorona.pawns.row_column_pawn(row, col))
+    for _, to_index, kind in steps:
+        row, col = point_of(to_index)
+        if kind == 'APPROACH':
+            fanorona.turn_approach(row, col)
+        elif kind == 'WITHDRAWAL':
+            fanorona.turn_withdrawal(row, col)
+        else:
+            fanorona.turn_paika(row, col)
+
+
+def test_enemy_of():
+    assert enemy_of(WHITE) == BLACK
+    assert enemy_of(BLACK) == WHITE
+
+
+def position_of(pawns, round_number=3, turn=WHITE):
+    return Position.from_fanorona(make_fanorona(pawns, round_number, turn))
+
+
+def test_evaluate():
+    position = position_of(
+        [Pawn(1, 1, WHITE), Pawn(1, 3, WHITE), Pawn(5, 5, BLACK)])
+    assert evaluate(position, WHITE) == 100
+    assert evaluate(position, BLACK) == -100
+
+
+def test_generate_turns_paika():
+    position = position_of([Pawn(1, 1, WHITE), Pawn(5, 9, BLACK)])
+    turns = generate_turns(position)
+    assert len(turns) == 3
+    assert all(steps[0][2] == 'PAIKA' for steps, _, _ in turns)
+
+
+def test_generate_turns_chain():
+    pawns = [
+        Pawn(1, 2, WHITE), Pawn(1, 3, BLACK), Pawn(1, 4, BLACK),
+        Pawn(3, 2, BLACK), Pawn(2, 4, BLACK), Pawn(1, 1, WHITE)]
+    position = position_of(pawns)
+    snapshot = position.snapshot()
+    turns = generate_turns(position)
+    assert position.snapshot() == snapshot
+    longest = max(turns, key=lambda turn: len(turn[0]))
+    assert len(longest[0]) > 1
+    # in the first rounds only one capture is allowed
+    turns = generate_turns(position_of(pawns, 1))
+    assert all(len(steps) == 1 for steps, _, _ in turns)
+
+
+def test_generated_turns_are_playable():
+    pawns = [
+        Pawn(1, 2, WHITE), Pawn(1, 3, BLACK), Pawn(1, 4, BLACK),
+        Pawn(3, 2, BLACK), Pawn(2, 4, BLACK), Pawn(1, 1, WHITE)]
+    position = position_of(pawns)
+    for steps, white_mask, black_mask in generate_turns(position):
+        fanorona = make_fanorona([
+            Pawn(pawn.row, pawn.column, pawn.colour) for pawn in pawns])
+        play_steps(fanorona, steps)
+        assert fanorona.turn == BLACK
+        after = fanorona.logic.bitboard()
+        assert after.white_mask == white_mask
+        assert after.black_mask == black_mask
+
+
+def test_search_takes_winning_capture():
+    pawns = [
+        Pawn(1, 2, WHITE), Pawn(3, 2, BLACK), Pawn(4, 2, BLACK),
+        Pawn(5, 9, WHITE)]
+    search = AlphaBetaSearch(max_depth=3, time_budget=5)
+    steps = search.best_turn(position_of(pawns))
+    assert steps == ((index_of(1, 2), index_of(2, 2), 'APPROACH'),)
+
+
+def test_search_respects_time_budget():
+    search = AlphaBetaSearch(max_depth=50, time_budget=0.2)
+    steps = search.best_turn(Position.from_fanorona(Fanorona()))
+    assert steps is not None
+    assert search.depth_reached < 50
+
+
+def test_search_no_turns():
+    position = position_of([Pawn(5, 9, BLACK)])
+    assert AlphaBetaSearch().best_turn(position) is None
+
+
+def test_search_uses_transposition_table():
+    fanorona = Fanorona()
+    fanorona.round = 3
+    position = Position.from_fanorona(fanorona)
+    search = AlphaBetaSearch(max_depth=3, time_budget=5)
+    first = search.best_turn(position)
+    assert search.table.stores > 0
+    assert search.table.hits > 0
+    assert search.best_turn(position) == first
+
+
+def test_child_key_from_the_middle_of_the_chain():
+    search = AlphaBetaSearch()
+    checked = 0
+    for position in seeded_positions(40, 9):
+        if position.round_number < 3:
+            continue
+        steps = position.legal_steps()
+        if steps[0][2] == 'PAIKA':
+            continue
+        position.make_move(steps[0])
+        if position.chain_index is None:
+            continue
+        key = search._hash(position)
+        for turn in generate_turns(position):
+            child_key = search._child_key(key, position, turn)
+            deltas = make_turn(position, turn[0])
+            assert child_key == search._hash(position)
+            unmake_turn(position, deltas)
+        checked += 1
+    assert checked > 0
@@ -0,0 +1,74 @@
+import pytest
+from selfplay import play_game, run_selfplay, make_player, SelfPlayStats
+from selfplay import GameResult, greedy_player
+from position import Position
+from engine import Fanorona
+from bitboard import index_of
+from random import Random
+from constants import WHITE, BLACK, UnknownPlayerError
+
+
+def test_make_player_unknown():
+    with pytest.raises(UnknownPlayerError):
+        make_player('nobody')
+
+
+def test_play_game_is_deterministic():
+    assert play_game('random', 'greedy', 7) == play_game(
+        'random', 'greedy', 7)
+
+
+def test_play_game_swaps_colours():
+    assert play_game('random', 'random', 4).first_colour == WHITE
+    assert play_game('random', 'random', 5).first_colour == BLACK
+
+
+def test_play_game_mcts_player():
+    result = play_game('mcts:20', 'random', 3, max_rounds=6)
+    assert result == play_game('mcts:20', 'random', 3, max_rounds=6)
+    assert result.rounds <= 6
+
+
+def test_play_game_round_limit():
+    result = play_game('random', 'random', 1, max_rounds=2)
+    assert result.winner is None
+    assert result.rounds == 2
+
+
+def test_greedy_player_takes_the_biggest_capture():
+    position = Position(
+        white_mask=1 << index_of(3, 1),
+        black_mask=(1 << index_of(3, 3)) | (1 << index_of(3, 4)) | (
+            1 << index_of(1, 1)),
+        round_number=1)
+    greedy_player(position, Random(0))
+    assert position.black_mask == 1 << index_of(1, 1)
+    assert position.turn == BLACK
+
+
+def test_greedy_player_finishes_turn():
+    position = Position.from_fanorona(Fanorona())
+    greedy_player(position, Random(0))
+    assert position.turn == BLACK
+    assert position.round_number == 2
+
+
+def test_stats_add():
+    stats = SelfPlayStats()
+    stats.add(GameResult(0, WHITE, 'first', 10))
+    stats.add(GameResult(1, BLACK, 'first', 20))
+    stats.add(GameResult(2, WHITE, None, 30))
+    assert stats.games == 3
+    assert stats.wins == {'first': 2, 'second': 0}
+    assert stats.wins_as_white == {'first': 1, 'second': 0}
+    assert stats.draws == 1
+    assert stats.average_length() == 20
+
+
+def test_run_selfplay_same_results_in_pool():
+    inline = run_selfplay('greedy', 'random', 6, processes=1, seed=3)
+    pooled = run_selfplay('greedy', 'random', 6, processes=2, seed=3)
+    assert inline.games == pooled.games == 6
+    assert inline.wins == pooled.wins
+    assert inline.draws == pooled.draws
+    assert sorted(inline.lengths) == sorted(pooled.lengths)
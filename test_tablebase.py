@@ -0,0 +1,91 @@
+import pytest
+from tablebase import solve, write_tablebase, EndgameTablebase
+from tablebase import _Indexer, _decode, _rank
+from tablebase import WIN, DRAW, LOSS, ENDGAME_ROUND
+from bitboard import index_of, NUM_OF_POINTS
+from position import Position
+from search import generate_turns, enemy_of
+from constants import WHITE, BLACK, TablebaseFileError
+
+
+@pytest.fixture(scope="module")
+def tablebase_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tablebase") / "tablebase.bin"
+    write_tablebase(solve(2), 2, path)
+    return path
+
+
+def mask_of(*places):
+    return sum(1 << index_of(row, col) for row, col in places)
+
+
+def test_rank_is_dense():
+    ranks = sorted(
+        _rank((1 << first) | (1 << second))
+        for first in range(NUM_OF_POINTS)
+        for second in range(first))
+    assert ranks == list(range(len(ranks)))
+
+
+def test_solve_is_consistent():
+    values = solve(2)
+    indexer = _Indexer(2)
+    for index, white_mask, black_mask, turn in indexer.positions():
+        result, distance = _decode(values[index])
+        enemy = enemy_of(turn)
+        position = Position(white_mask, black_mask, turn, ENDGAME_ROUND)
+        after = []
+        for _, white_after, black_after in generate_turns(position):
+            if not (black_after if turn == WHITE else white_after):
+                after.append((LOSS, 0))
+            else:
+                after.append(_decode(values[indexer.index(
+                    white_after, black_after, enemy)]))
+        if result == WIN:
+            assert min(d for r, d in after if r == LOSS) == distance - 1
+        elif result == LOSS:
+            assert all(r == WIN for r, _ in after)
+            assert max([d for _, d in after], default=-1) == distance - 1
+        else:
+            assert all(r != LOSS for r, _ in after)
+            assert any(r == DRAW for r, _ in after)
+
+
+def test_probe(tablebase_path):
+    tablebase = EndgameTablebase(tablebase_path)
+    position = Position(
+        mask_of((1, 1)), mask_of((1, 3)), WHITE, ENDGAME_ROUND)
+    assert tablebase.probe(position) == (WIN, 1)
+    position.turn = BLACK
+    assert tablebase.probe(position) == (WIN, 1)
+    # too many pawns, the first rounds or the chain isn't covered
+    position.white_mask |= mask_of((5, 9))
+    assert tablebase.probe(position) is None
+    position = Position(mask_of((1, 1)), mask_of((5, 9)), WHITE, 1)
+    assert tablebase.probe(position) is None
+    tablebase.close()
+
+
+def test_best_turn(tablebase_path):
+    tablebase = EndgameTablebase(tablebase_path)
+    position = Position(
+        mask_of((1, 1)), mask_of((1, 3)), WHITE, ENDGAME_ROUND)
+    snapshot = position.snapshot()
+    assert tablebase.best_turn(position) == (
+        (index_of(1, 1), index_of(1, 2), 'APPROACH'),)
+    assert position.snapshot() == snapshot
+    position = Position(
+        mask_of((3, 5)), mask_of((1, 1)), WHITE, ENDGAME_ROUND)
+    steps = tablebase.best_turn(position)
+    assert steps in [turn[0] for turn in generate_turns(position)]
+    tablebase.close()
+
+
+def test_broken_file(tmp_path, tablebase_path):
+    path = tmp_path / "broken.bin"
+    path.write_bytes(tablebase_path.read_bytes()[:-2])
+    with pytest.raises(TablebaseFileError):
+        EndgameTablebase(path)
+    path.write_bytes(b"")
+    with pytest.raises(TablebaseFileError):
+        EndgameTablebase(path)
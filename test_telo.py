@@ -0,0 +1,59 @@
+from telo import paika_moves, placements, solve, table_bytes
+from telo import best_move, result_of, _load_table, _after
+from telo import WIN, DRAW, LOSS, NUM_OF_PLACES
+from bitboard import line_winner
+from constants import WHITE, BLACK
+
+
+def mask_of(*places):
+    return sum(1 << (row-1)*3 + (col-1) for row, col in places)
+
+
+START = (mask_of((3, 1), (3, 2), (2, 1)), mask_of((1, 2), (1, 3), (2, 3)))
+
+
+def test_paika_moves():
+    # (2, 2) is connected with every place, (1, 2) isn't diagonally
+    assert paika_moves(mask_of((2, 2)), 0, WHITE) == [
+        (4, index) for index in range(NUM_OF_PLACES) if index != 4]
+    assert paika_moves(mask_of((1, 2)), 0, WHITE) == [(1, 0), (1, 2), (1, 4)]
+    assert paika_moves(*START, WHITE) == [
+        (3, 0), (3, 4), (6, 4), (7, 4), (7, 8)]
+
+
+def test_placements():
+    assert len(placements()) == 84 * 20
+    assert len(set(placements())) == 84 * 20
+
+
+def test_shipped_table_is_solved_table():
+    assert _load_table() == table_bytes(solve())
+
+
+def test_table_is_perfect_play():
+    for white_mask, black_mask in placements():
+        for turn in [WHITE, BLACK]:
+            enemy = BLACK if turn == WHITE else WHITE
+            result = result_of(white_mask, black_mask, turn)
+            move = best_move(white_mask, black_mask, turn)
+            if line_winner(white_mask, black_mask) is not None:
+                assert move is None
+                continue
+            results_after = {
+                move_after: result_of(
+                    *_after(white_mask, black_mask, turn, move_after),
+                    enemy)
+                for move_after in paika_moves(white_mask, black_mask, turn)}
+            if result == WIN:
+                assert results_after[move] == LOSS
+            elif result == DRAW:
+                assert results_after[move] == DRAW
+                assert LOSS not in results_after.values()
+            elif results_after:
+                assert set(results_after.values()) == {WIN}
+
+
+def test_best_move_of_start():
+    assert result_of(*START, WHITE) == WIN
+    assert best_move(*START, WHITE) in paika_moves(*START, WHITE)
+    assert best_move(0, 0, WHITE) is None
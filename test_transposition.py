@@ -0,0 +1,69 @@
+from transposition import Zobrist, TranspositionTable, round_phase
+from transposition import EXACT, LOWER_BOUND
+from constants import WHITE, BLACK
+from constants import TranspositionTableSizeError
+from bitboard import index_of
+import pytest
+
+
+def test_round_phase():
+    assert round_phase(1) == 1
+    assert round_phase(2) == 2
+    assert round_phase(3) == 3
+    assert round_phase(40) == 3
+
+
+def test_hash_depends_on_everything():
+    zobrist = Zobrist()
+    white_mask = 1 << index_of(1, 1)
+    black_mask = 1 << index_of(5, 5)
+    key = zobrist.hash_position(white_mask, black_mask, WHITE, 3)
+    assert key == zobrist.hash_position(white_mask, black_mask, WHITE, 7)
+    assert key != zobrist.hash_position(white_mask, black_mask, BLACK, 3)
+    assert key != zobrist.hash_position(white_mask, black_mask, WHITE, 1)
+    assert key != zobrist.hash_position(black_mask, white_mask, WHITE, 3)
+    assert key != zobrist.hash_position(
+        white_mask, black_mask, WHITE, 3, 'N')
+    assert key != zobrist.hash_position(
+        white_mask, black_mask, WHITE, 3, None, 1 << index_of(2, 2))
+
+
+def test_incremental_update():
+    zobrist = Zobrist()
+    white_mask = 1 << index_of(1, 1)
+    black_mask = (1 << index_of(1, 3)) | (1 << index_of(5, 5))
+    key = zobrist.hash_position(white_mask, black_mask, WHITE, 2)
+    new_white = 1 << index_of(1, 2)
+    new_black = 1 << index_of(5, 5)
+    key ^= zobrist.pawns_key(white_mask ^ new_white, black_mask ^ new_black)
+    key ^= zobrist.side_key
+    key ^= zobrist.phase_change_key(2, 3)
+    assert key == zobrist.hash_position(new_white, new_black, BLACK, 3)
+
+
+def test_table_probe_and_counters():
+    table = TranspositionTable(16)
+    assert table.probe(5) is None
+    table.store(5, 2, 100, EXACT, None)
+    assert table.probe(5) == (2, 100, EXACT, None)
+    assert table.hits == 1
+    assert table.misses == 1
+    assert table.hit_rate() == 0.5
+
+
+def test_table_replacement_policy():
+    table = TranspositionTable(16)
+    table.store(3, 4, 10, EXACT, None)
+    # shallower result of other position doesn't replace deeper one
+    table.store(3 + 16, 1, 20, LOWER_BOUND, None)
+    assert table.probe(3) == (4, 10, EXACT, None)
+    # but it does after a new search has started
+    table.new_search()
+    table.store(3 + 16, 1, 20, LOWER_BOUND, None)
+    assert table.probe(3 + 16) == (1, 20, LOWER_BOUND, None)
+    assert table.overwrites == 1
+
+
+def test_table_size():
+    with pytest.raises(TranspositionTableSizeError):
+        TranspositionTable(100)
@@ -0,0 +1,193 @@
+from random import Random
+from bitboard import NUM_OF_POINTS, bits
+from geometry import DIRECTIONS
+from constants import WHITE
+from constants import TranspositionTableSizeError
+
+ZOBRIST_SEED = 2023
+TABLE_SIZE = 1 << 18  # number of entries of the transposition table
+
+# kinds of stored scores
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+def round_phase(round_number):
+    """
+    Returns phase of the game that matters for the rules:
+    1 and 2 are the first rounds (only one capture allowed), 3 is the rest
+    """
+    return min(round_number, 3)
+
+
+class Zobrist:
+    """
+    Class used for hashing positions of Fanorona game with Zobrist keys;
+    every element of the position has its own random 64-bit key and the
+    hash is xor of keys of elements that are present
+
+    ...
+    Attributes
+    ----------
+    white_keys: list
+    black_keys: list
+        keys of white/black pawn standing at place with index
+    side_key: int
+        key that is present when BLACK is to move
+    direction_keys: dict
+        keys of the direction of the last capture in the current chain
+    visited_keys: list
+        keys of places visited during the current capture chain
+    phase_keys: dict
+        keys of round phase (see round_phase())
+
+    Methods
+    -------
+    hash_position(white_mask, black_mask, colour, round_number,
+                  last_direction=None, visited=0)
+        returns the hash of the whole position
+    pawns_key(white_changed, black_changed)
+        returns xor of pawn keys of places set in passed masks, it is
+        used for updating the hash after the turn
+    chain_key(last_direction, visited)
+        returns xor of keys of the state of the capture chain, it is
+        used for removing it from the hash when the turn ends
+    phase_change_key(round_number, new_round_number)
+        returns key that changes the phase of the hash
+    """
+    def __init__(self, seed=ZOBRIST_SEED):
+        generator = Random(seed)
+
+        def new_key():
+            return generator.getrandbits(64)
+
+        self.white_keys = [new_key() for _ in range(NUM_OF_POINTS)]
+        self.black_keys = [new_key() for _ in range(NUM_OF_POINTS)]
+        self.side_key = new_key()
+        self.direction_keys = {
+            direction: new_key() for direction in DIRECTIONS}
+        self.visited_keys = [new_key() for _ in range(NUM_OF_POINTS)]
+        self.phase_keys = {phase: new_key() for phase in [1, 2, 3]}
+
+    def hash_position(self, white_mask, black_mask, colour, round_number,
+                      last_direction=None, visited=0):
+        """Returns the hash of the whole position"""
+        key = self.pawns_key(white_mask, black_mask)
+        if colour != WHITE:
+            key ^= self.side_key
+        key ^= self.chain_key(last_direction, visited)
+        key ^= self.phase_keys[round_phase(round_number)]
+        return key
+
+    def chain_key(self, last_direction, visited):
+        """
+        Returns xor of keys of the state of the capture chain, it is 0
+        when no chain is going on
+        """
+        key = 0
+        if last_direction is not None:
+            key ^= self.direction_keys[last_direction]
+        for index in bits(visited):
+            key ^= self.visited_keys[index]
+        return key
+
+    def pawns_key(self, white_changed, black_changed):
+        """Returns xor of keys of pawns at places set in passed masks"""
+        key = 0
+        for index in bits(white_changed):
+            key ^= self.white_keys[index]
+        for index in bits(black_changed):
+            key ^= self.black_keys[index]
+        return key
+
+    def phase_change_key(self, round_number, new_round_number):
+        """Returns key that changes phase of round_number to the new one"""
+        phase = round_phase(round_number)
+        new_phase = round_phase(new_round_number)
+        if phase == new_phase:
+            return 0
+        return self.phase_keys[phase] ^ self.phase_keys[new_phase]
+
+
+class TranspositionTable:
+    """
+    Class used for remembering results of the search of positions,
+    it has fixed number of entries; an entry is replaced when the new
+    result is searched at least as deep as the stored one or when the
+    stored one comes from an older search
+
+    ...
+    Attributes
+    ----------
+    size: int
+        number of entries (power of two)
+    hits: int
+        number of probes that found the position
+    misses: int
+        number of probes that didn't find the position
+    stores: int
+        number of stored results
+    overwrites: int
+        number of stored results that replaced other position
+
+    Methods
+    -------
+    probe(key)
+        returns (depth, score, flag, best_steps) or None
+    store(key, depth, score, flag, best_steps)
+        remembers the result according to the replacement policy
+    new_search()
+        marks entries as coming from an older search
+    clear()
+        removes all entries and resets counters
+    hit_rate()
+        returns part of probes that found the position
+    """
+    def __init__(self, size=TABLE_SIZE):
+        if size & (size - 1):
+            raise TranspositionTableSizeError()
+        self.size = size
+        self._mask = size - 1
+        self.clear()
+
+    def clear(self):
+        self._keys = [None] * self.size
+        self._entries = [None] * self.size
+        self._ages = [0] * self.size
+        self._age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self):
+        self._age += 1
+
+    def probe(self, key):
+        slot = key & self._mask
+        if self._keys[slot] == key:
+            self.hits += 1
+            return self._entries[slot]
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, score, flag, best_steps):
+        slot = key & self._mask
+        stored_key = self._keys[slot]
+        if stored_key is not None:
+            stored_depth = self._entries[slot][0]
+            from_older_search = self._ages[slot] != self._age
+            if not from_older_search and depth < stored_depth:
+                return None
+            if stored_key != key:
+                self.overwrites += 1
+        self._keys[slot] = key
+        self._entries[slot] = (depth, score, flag, best_steps)
+        self._ages[slot] = self._age
+        self.stores += 1
+
+    def hit_rate(self):
+        """Returns part of probes that found the position"""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
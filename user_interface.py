@@ -43,23 +43,24 @@ def user_interface():
 
         if comp_user_choice == 1:
             msg = ("Do you want to play vs computer",
-                   "that makes random or good moves?",
+                   "that makes random, good or searched moves?",
                    "(1 - random moves, 0 -",
-                   "good moves): ")
+                   "good moves, 2 - searched moves,",
+                   "3 - Monte Carlo moves): ")
             random_play_user_choice = input(" ".join(msg))
 
             try:
                 random_play_user_choice = int(random_play_user_choice)
             except Exception:
-                print("Your input must be number, 0 or 1...")
+                print("Your input must be number, 0, 1, 2 or 3...")
 
-            while random_play_user_choice not in [0, 1]:
+            while random_play_user_choice not in [0, 1, 2, 3]:
                 random_play_user_choice = input(" ".join(msg) + " Try again: ")
 
                 try:
                     random_play_user_choice = int(random_play_user_choice)
                 except Exception:
-                    print("Your input must be number, 0 or 1...")
+                    print("Your input must be number, 0, 1, 2 or 3...")
 
     print("The game is started... If you don't see the window,",
           "see under this screen or click the icon in the taskbar :)")